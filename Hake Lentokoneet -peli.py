@@ -20,83 +20,205 @@ game is running, the programme will restart automatically or give a warning and
 make a choice to restart the game.
 """
 
-from multiprocessing import Process, Queue
+from multiprocessing import Pipe, Pool, Process, Queue, TimeoutError
+from bisect import bisect_right
+from queue import Empty, SimpleQueue
+from array import array
+from collections import OrderedDict, deque
+from itertools import accumulate, islice
+from abc import ABC, abstractmethod
+import argparse
+import asyncio
+import atexit
+import base64
+import importlib
+import json
+import os
 import random
-
-from tkinter import *
-from tkinter import ttk
-from tkinter import messagebox
-from tkinter.messagebox import *
-from tkinter.font import *
+import selectors
+import socket
+import sqlite3
+import struct
+import subprocess
+import sys
+import threading
+import time
+import zlib
 from functools import partial
+from math import exp, factorial
+
+# The command-line modes, which don't open the game window. Then tkinter isn't
+# imported at all, so they start fast and work also without any display.
+NO_WINDOW_OPTIONS = {"--text", "--watch", "--stats", "--stats-generated",
+                     "--difficulty-pool", "--leaderboard", "--opening-book",
+                     "--count-layouts", "--tournament", "--expert-pool"}
+if not NO_WINDOW_OPTIONS & {arg.split("=")[0] for arg in sys.argv[1:]}:
+    from tkinter import *
+    from tkinter import ttk
+    from tkinter import messagebox
+    from tkinter.messagebox import *
+    from tkinter.font import *
 
 # Here is global constants.
 SIZE_EASY = 8
 SIZE_MEDIUM = 10
 SIZE_HARD = 12
 ROW = "A B C D E F G H I J K L M N O P Q R S T U V W X Y Z".split()
-PLANEHEAD = " X"
-PLANEBODY = " *"
-BLANKSPACE = "  "
+# The values of the squares on the gameboard and the symbols of them, when
+# the board is printed.
+BLANKSPACE = 0
+PLANEBODY = 1
+PLANEHEAD = 2
+SYMBOLS = ["  ", " *", " X"]
+# The state of a square, which isn't clicked yet. The other states are the
+# values of the squares.
+UNKNOWN = 3
 RED = "#EC1C24"
 BLUE = "#00A8F3"
 WHITE = "#FFFFFF"
 GRAY = "#C3C3C3"
+YELLOW = "#FFF200"
+
+# The cells of the aircraft models as (dx, dy) from the planehead, when the
+# head forwards to west. The other directions are turned from these.
+SIMPLE_MODEL = [(0, 0), (1, -2), (1, -1), (1, 0), (1, 1), (1, 2), (2, 0),
+                (3, -1), (3, 0), (3, 1)]
+COMPLEX_MODEL = [(0, 0), (1, -1), (1, 0), (1, 1), (2, -2), (2, 0), (2, 2),
+                 (3, 0), (4, -1), (4, 0), (4, 1)]
+# The boardsize, the amount of aircrafts and the aircraft model of every
+# level.
+LEVELS = {"EASY": (SIZE_EASY, 2, SIMPLE_MODEL),
+          "MEDIUM": (SIZE_MEDIUM, 3, SIMPLE_MODEL),
+          "HARD": (SIZE_HARD, 4, COMPLEX_MODEL)}
+# All files of the game are next to this program (see resource_path), so
+# the game can be started from any directory.
+# The counted layouts are saved into this file, because counting the HARD
+# layouts takes some seconds.
+LAYOUT_COUNT_FILE = "layout_counts.json"
+# The biggest amount of saved hints in the hint engine of every level.
+HINT_CACHE_SIZE = 4096
+# The amount of the board creating processes, which all game tables of the
+# program share, and the longest time (seconds) to wait for the boards.
+BOARD_WORKERS = 2
+BOARD_TIMEOUT = 3
+# The game window asks the boards of a new game this many times, before it
+# creates them itself.
+BOARD_RETRIES = 3
+# The longest time (seconds) of the computer's move, and how often (ms) the
+# game windows check the answers of the computer.
+AI_MOVE_TIME = 1.0
+AI_POLL_INTERVAL = 16
+# The worker process keeps the strategies of this many games (a game is one
+# player of one match).
+AI_GAMES = 64
+# The asyncio loop of the game windows runs in the Tk mainloop every
+# ASYNC_INTERVAL ms for at most ASYNC_STEPS steps and ASYNC_BUDGET ms, so
+# the coroutines never make the windows slow.
+ASYNC_INTERVAL = 8
+ASYNC_STEPS = 8
+ASYNC_BUDGET = 4
+# The exact search of the end of the game is used, when there are at most
+# ENDGAME_LAYOUTS possible layouts left and the layouts times the squares,
+# which can still be hit, is at most ENDGAME_WORK. The work predicts the
+# time of the search: under it the searches took at most 9 ms. The search
+# of a hint stops after the time (seconds) anyway, and the saved states are
+# cleared, when there are too many of them.
+ENDGAME_LAYOUTS = 16
+ENDGAME_WORK = 150
+ENDGAME_TIME = 0.02
+ENDGAME_MEMO_SIZE = 200000
+# The opening book: the best first shots of every level, saved for the
+# given amount of shots.
+OPENING_BOOK_FILE = "opening_book.bin"
+OPENING_DEPTH = 8
+# The rated layouts of every level, which are used to create boards of the
+# chosen difficulty.
+DIFFICULTY_POOL_FILE = "difficulty_pool.json"
+DIFFICULTY_POOL_SIZE = 2000
+# The expert boards: the layouts, which the solver needs the most shots for.
+# They are searched by moving and turning the aircrafts (see Expert_pool),
+# and every search tries EXPERT_STEPS changed layouts. EXPERT is the
+# difficulty of the expert boards.
+EXPERT_POOL_FILE = "expert_pool.json"
+EXPERT_POOL_SIZE = 50
+EXPERT_STEPS = 40
+EXPERT_TEMPERATURE = 2.0
+EXPERT = "expert"
+# The spectator broadcast sends a whole state (keyframe) this often (seconds)
+# and a spectator can have this many bytes waiting. If a spectator is too
+# slow, the waiting data is thrown away and it gets a new keyframe.
+KEYFRAME_INTERVAL = 5.0
+SPECTATOR_BUFFER = 65536
+# The publisher process must open its port in this time (seconds).
+SPECTATOR_START_TIME = 3.0
+# The upper limits (milliseconds) of the buckets of the latency histograms.
+LATENCY_BUCKETS = [0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000,
+                   2000, 5000, float("inf")]
+# The finished games are recorded in this file, one JSON-object in each line.
+ARCHIVE_FILE = "games_archive.jsonl"
+# The leaderboard database and the biggest amount of games in one write.
+LEADERBOARD_FILE = "leaderboard.db"
+LEADERBOARD_BATCH = 1000
+# The pictures are read from one atlas file (see Image_atlas). The small
+# pictures are packed into a sprite sheet of at most ATLAS_WIDTH pixels wide,
+# and the big help pictures are saved as they are.
+IMAGE_ATLAS_FILE = "images.atlas"
+SPRITE_FILES = ["00.gif", "B1.gif", "B2.gif", "B3.gif", "G1.gif", "G2.gif",
+                "G3.gif", "easy_plane.png", "hard_plane.png", "help_1.gif",
+                "help_2.gif"]
+LAZY_IMAGE_FILES = ["help_3.gif", "help_4.gif"]
+ATLAS_WIDTH = 1024
+# The group of the entry points of the installed strategies and the default
+# amount of the tournament games.
+STRATEGY_GROUP = "aircraft_head_hunting.strategies"
+TOURNAMENT_GAMES = 1000
+# The amount of the players of a game and the amount of the players' boards
+# on one row of the game window.
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+PLAYERS_PER_ROW = 4
+# The UI benchmark plays this many games on every level. It fails, if the
+# 95th percentile of the click-to-repaint latency of any level is over the
+# budget (ms).
+BENCHMARK_GAMES = 5
+BENCHMARK_CLICK_BUDGET = 50
+# The soak test fails, if the Tk objects or the open files grow at all or
+# the memory grows more than this (kB).
+SOAK_MEMORY_GROWTH = 20480
 
 
 #===== class Aircraft =========================================================
 # This class is used to record the information of an aircraft. Including the
-# head's coordinates and the body's coordinates. X-coordinate's name is
-# str-type and Y-coordinate's name is int-type.
+# head's cell and the body's cells. The squares are numbered row by row: the
+# cell number of the square (x, y) is y * boardsize + x.
 class Aircraft:
     """
     Defines an aircraft.
     """
-    def __init__(self, coordinates):
+    __slots__ = ("__head", "__body")
+
+    def __init__(self, cells):
         """
         Initializes the aircraft's.
-        :param coordinates: list, the coordinates of a plane, the first
-                            element should be the plane's head.
+        :param cells: list, the cell numbers of a plane, the first element
+                      should be the plane's head.
         """
-        self.__coordinates = {}
-        self.__set_initial_coordinates(coordinates)
+        self.__head = cells[0]
+        self.__body = tuple(cells[1:])
 
-    def __set_initial_coordinates(self, coordinates):
+    def get_head(self):
         """
-        Initializes the aircraft's coordinates in a dict in dict.
-        * This is an private method.
-        :param coordinates: list, the coordinates of a plane, the first
-                            element should be the plane's head.
+        Gets the plane's head.
+        :return: int, the cell number of the planehead.
         """
-        head = coordinates[0]
-        body = coordinates[1:]
-
-        # Sets planehead.
-        try:
-            x = head[0].upper()
-            y = int(head[1:])
-            self.__coordinates.update({x:{y:PLANEHEAD}})
-        except:
-            return
-
-        # Sets planebody.
-        for element in body:
-            try:
-                x = element[0].upper()
-                y = int(element[1:])
-                if x in self.__coordinates.keys():
-                    self.__coordinates[x].update({y:PLANEBODY})
-                else:
-                    self.__coordinates.update({x:{y:PLANEBODY}})
-            except:
-                return
+        return self.__head
 
-    def get_coordinates(self):
+    def get_body(self):
         """
-        Gets the plane's coordinates.
-        :return: dict in dict, the plane's coordinates used in class.
+        Gets the plane's body.
+        :return: tuple, the cell numbers of the planebody.
         """
-        return self.__coordinates
+        return self.__body
 
 
 #===== class Gameboard ========================================================
@@ -112,63 +234,76 @@ class Gameboard:
     """
     This is a gameboard with the given size.
     """
+    __slots__ = ("__size", "__board")
+
     def __init__(self, boardsize):
         """
         Sets a gameboard.
         :param boardsize: int, the size of gameboard
         """
         self.__size = boardsize
-        self.__board = {}
-        self.__initial_board()
-
-    def __initial_board(self):
-        """
-        Initialize the gameboard.
-        * This is an private method.
-        """
-        for x in ROW[0 : self.__size]:
-            for y in range(self.__size):
-                if x in self.__board.keys():
-                    self.__board[x].update({y:BLANKSPACE})
-                else:
-                    self.__board.update({x:{y:BLANKSPACE}})
+        # The value of every square in one array (cell number = index).
+        self.__board = bytearray(boardsize * boardsize)
 
-    def add_aircraft(self, plane_coordinates):
+    def add_aircraft(self, plane):
         """
         Adds an new aircraft to this board.
-        :param plane_coordinates: dict in dict, the plane's coordinates.
+        :param plane: Aircraft, the new plane.
         :return: bool, True: if it is successfully added;
                        False: if it cannot be added.
         """
-        if not self.__overlapping(plane_coordinates):
-            for x in plane_coordinates.keys():
-                for y in plane_coordinates[x].keys():
-                    self.__board[x][y] = plane_coordinates[x][y]
+        if not self.__overlapping(plane):
+            for cell in plane.get_body():
+                self.__board[cell] = PLANEBODY
+            self.__board[plane.get_head()] = PLANEHEAD
             return True
         else:
             return
 
-    def __overlapping(self, plane_coordinates):
+    def __overlapping(self, plane):
         """
         Checks the new aircraft is overlapping.
         * This is an private method.
-        :param plane_coordinates: dict in dict, the new plane's coordinates.
+        :param plane: Aircraft, the new plane.
         :return: bool, True: if it is overlapping;
                        False: if it isn't overlapping.
         """
-        for x in plane_coordinates.keys():
-            for y in plane_coordinates[x].keys():
-                if self.__board[x][y] != BLANKSPACE:
-                    return True
+        if self.__board[plane.get_head()] != BLANKSPACE:
+            return True
+        for cell in plane.get_body():
+            if self.__board[cell] != BLANKSPACE:
+                return True
         return False
 
     def get_board(self):
         """
         Gets the gameboard information.
-        :return: dict in dict, the information of the gameboard.
+        :return: bytearray, the value of every cell of the gameboard.
         """
         return self.__board
 
+    def get_size(self):
+        """
+        Gets the size of the gameboard.
+        :return: int, the size of the gameboard.
+        """
+        return self.__size
+
+    def get_cells(self):
+        """
+        Gets the aircrafts' cells.
+        :return: tuple, two lists: the cells of the planeheads and the cells
+                 of the planebodies.
+        """
+        heads = []
+        bodies = []
+        for cell, value in enumerate(self.__board):
+            if value == PLANEHEAD:
+                heads.append(cell)
+            elif value == PLANEBODY:
+                bodies.append(cell)
+        return heads, bodies
+
     def print(self):
         """
         * Prints the gameboard on screen. Just used to print the answer on
@@ -177,8 +312,8 @@ class Gameboard:
         print("-"*(self.__size+2)*2)
         for Y in range(self.__size):
             print("|", end="")
-            for X in ROW[0:self.__size]:
-                print(self.__board[X][Y], end="")
+            for X in range(self.__size):
+                print(SYMBOLS[self.__board[Y * self.__size + X]], end="")
             print(" |")
         print("-"*(self.__size+2)*2)
 
@@ -187,18 +322,25 @@ class Gameboard:
 def is_valid_Aircraft(coordinates, boardsize):
     """
     Checks the aircraft has the valid coordinates on gameboard.
-    :param coordinates: dict in dict, the plane's coordinates.
+    :param coordinates: list, the plane's coordinates (x, y).
     :param boardsize: int, the size of whole gameboard.
     :return: bool, True: if the plane is valid;
                    False: if the plane is invalid.
     """
-    for element in coordinates:
-        x = element[0]
-        y = int(element[1:])
-        if (x > ROW[boardsize-1]) or (y > (boardsize - 1) or (y < 0)):
+    for x, y in coordinates:
+        if not (0 <= x < boardsize and 0 <= y < boardsize):
             return False
     return True
 
+def coordinates_to_cells(coordinates, boardsize):
+    """
+    Changes the coordinates into cell numbers.
+    :param coordinates: list, the plane's coordinates (x, y).
+    :param boardsize: int, the size of whole gameboard.
+    :return: list, the cell numbers.
+    """
+    return [y * boardsize + x for x, y in coordinates]
+
 #===== class Random_aircraft_SIMPLE ===========================================
 # This class is used to create a new random aircraft in simple model.
 class Random_aircraft_SIMPLE:
@@ -206,7 +348,7 @@ class Random_aircraft_SIMPLE:
     Creates a random SIMPLE aircraft.
     :param self.__plane: Aircraft, a simple aircraft.
     :param self.__size: int, the size of given gameboard.
-    :param self.__x_head: str, the planehead's x-coordinate on board.
+    :param self.__x_head: int, the planehead's x-coordinate on board.
     :param self.__y_head: int, the planehead's y-coordinate on board.
     """
     def __init__(self, boardsize):
@@ -234,7 +376,7 @@ class Random_aircraft_SIMPLE:
         Directions = ["W", "E", "N", "S"]
 
         while self.__plane == None:
-            self.__x_head = random.choice( ROW[0 : self.__size - 1] )
+            self.__x_head = random.randint(0, self.__size - 2)
             self.__y_head = random.randint(0, self.__size - 1)
             direction = random.choice(Directions)
 
@@ -258,21 +400,17 @@ class Random_aircraft_SIMPLE:
                    *
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-2, -1, 0, 1, 2]:
-                coordinates.append( ROW[index + 1] + str(self.__y_head + diff))
-            coordinates.append( ROW[index + 2] + str(self.__y_head))
-            for diff in [-1, 0, 1]:
-                coordinates.append( ROW[index + 3] + str(self.__y_head + diff))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-2, -1, 0, 1, 2]:
+            coordinates.append((self.__x_head + 1, self.__y_head + diff))
+        coordinates.append((self.__x_head + 2, self.__y_head))
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head + 3, self.__y_head + diff))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -286,21 +424,17 @@ class Random_aircraft_SIMPLE:
                     *
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.self.__x_head)
-            for diff in [-2, -1, 0, 1, 2]:
-                coordinates.append(ROW[index - 1] + str(self.__y_head + diff))
-            coordinates.append(ROW[index - 2] + str(self.__y_head))
-            for diff in [-1, 0, 1]:
-                coordinates.append(ROW[index - 3] + str(self.__y_head + diff))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-2, -1, 0, 1, 2]:
+            coordinates.append((self.__x_head - 1, self.__y_head + diff))
+        coordinates.append((self.__x_head - 2, self.__y_head))
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head - 3, self.__y_head + diff))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -313,21 +447,17 @@ class Random_aircraft_SIMPLE:
                 * * *
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-2, -1, 0, 1, 2]:
-                coordinates.append( ROW[index + diff] + str(self.__y_head + 1))
-            coordinates.append( ROW[index] + str(self.__y_head + 2))
-            for diff in [-1, 0, 1]:
-                coordinates.append( ROW[index + diff] + str(self.__y_head + 3))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-2, -1, 0, 1, 2]:
+            coordinates.append((self.__x_head + diff, self.__y_head + 1))
+        coordinates.append((self.__x_head, self.__y_head + 2))
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head + diff, self.__y_head + 3))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -340,21 +470,17 @@ class Random_aircraft_SIMPLE:
                    X
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-2, -1, 0, 1, 2]:
-                coordinates.append( ROW[index + diff] + str(self.__y_head - 1))
-            coordinates.append( ROW[index] + str(self.__y_head - 2))
-            for diff in [-1, 0, 1]:
-                coordinates.append( ROW[index + diff] + str(self.__y_head - 3))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-2, -1, 0, 1, 2]:
+            coordinates.append((self.__x_head + diff, self.__y_head - 1))
+        coordinates.append((self.__x_head, self.__y_head - 2))
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head + diff, self.__y_head - 3))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -372,7 +498,7 @@ class Random_aircraft_COMPLEX:
     Creates a random COMPLEX aircraft.
     :param self.__plane: Aircraft, a complex aircraft.
     :param self.__size: int, the size of given gameboard.
-    :param self.__x_head: str, the planehead's x-coordinate on board.
+    :param self.__x_head: int, the planehead's x-coordinate on board.
     :param self.__y_head: int, the planehead's y-coordinate on board.
     """
     def __init__(self, boardsize):
@@ -399,7 +525,7 @@ class Random_aircraft_COMPLEX:
         """
         Directions = ["W", "E", "N", "S"]
         while self.__plane == None:
-            self.__x_head = random.choice(ROW[0: self.__size - 1])
+            self.__x_head = random.randint(0, self.__size - 2)
             self.__y_head = random.randint(0, self.__size - 1)
             direction = random.choice(Directions)
 
@@ -422,22 +548,18 @@ class Random_aircraft_COMPLEX:
                      *
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-1, 0, 1]:
-                coordinates.append(ROW[index + 1] + str(self.__y_headead+diff))
-                coordinates.append(ROW[index + 4] + str(self.__y_head + diff))
-            for diff in [-2, 0, 2]:
-                coordinates.append(ROW[index + 2] + str(self.__y_head + diff))
-            coordinates.append(ROW[index + 3] + str(self.__y_head))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head + 1, self.__y_head + diff))
+            coordinates.append((self.__x_head + 4, self.__y_head + diff))
+        for diff in [-2, 0, 2]:
+            coordinates.append((self.__x_head + 2, self.__y_head + diff))
+        coordinates.append((self.__x_head + 3, self.__y_head))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -451,22 +573,18 @@ class Random_aircraft_COMPLEX:
                     *
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-1, 0, 1]:
-                coordinates.append(ROW[index - 1] + str(self.__y_head + diff))
-                coordinates.append(ROW[index - 4] + str(self.__y_head + diff))
-            for diff in [-2, 0, 2]:
-                coordinates.append(ROW[index - 2] + str(self.__y_head + diff))
-            coordinates.append(ROW[index - 3] + str(self.__y_head))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head - 1, self.__y_head + diff))
+            coordinates.append((self.__x_head - 4, self.__y_head + diff))
+        for diff in [-2, 0, 2]:
+            coordinates.append((self.__x_head - 2, self.__y_head + diff))
+        coordinates.append((self.__x_head - 3, self.__y_head))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -480,22 +598,18 @@ class Random_aircraft_COMPLEX:
                 * * *
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-1, 0, 1]:
-                coordinates.append(ROW[index + diff] + str(self.__y_head + 1))
-                coordinates.append(ROW[index + diff] + str(self.__y_head + 4))
-            for diff in [-2, 0, 2]:
-                coordinates.append(ROW[index + diff] + str(self.__y_head + 2))
-            coordinates.append(ROW[index] + str(self.__y_head + 3))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head + diff, self.__y_head + 1))
+            coordinates.append((self.__x_head + diff, self.__y_head + 4))
+        for diff in [-2, 0, 2]:
+            coordinates.append((self.__x_head + diff, self.__y_head + 2))
+        coordinates.append((self.__x_head, self.__y_head + 3))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -509,22 +623,18 @@ class Random_aircraft_COMPLEX:
                    X
         * This is a private method.
         """
-        coordinates = [self.__x_head + str(self.__y_head)]
-        try:
-            index = ROW.index(self.__x_head)
-            for diff in [-1, 0, 1]:
-                coordinates.append(ROW[index + diff] + str(self.__y_head - 1))
-                coordinates.append(ROW[index + diff] + str(self.__y_head - 4))
-            for diff in [-2, 0, 2]:
-                coordinates.append(ROW[index + diff] + str(self.__y_head - 2))
-            coordinates.append(ROW[index] + str(self.__y_head - 3))
-        except:
-            self.__plane = None
-            return
+        coordinates = [(self.__x_head, self.__y_head)]
+        for diff in [-1, 0, 1]:
+            coordinates.append((self.__x_head + diff, self.__y_head - 1))
+            coordinates.append((self.__x_head + diff, self.__y_head - 4))
+        for diff in [-2, 0, 2]:
+            coordinates.append((self.__x_head + diff, self.__y_head - 2))
+        coordinates.append((self.__x_head, self.__y_head - 3))
 
         # Checkes all coordinates is valid on the given gameboard.
         if is_valid_Aircraft(coordinates, self.__size):
-            self.__plane = Aircraft(coordinates)
+            self.__plane = Aircraft(
+                coordinates_to_cells(coordinates, self.__size))
         else:
             self.__plane = None
 
@@ -536,705 +646,5866 @@ class Random_aircraft_COMPLEX:
         return self.__plane
 
 
-#===== class Find_Aircraft_Head_Game ==========================================
-# This class is used to design the main game window. When the class is
-# running, the players can create/start a new game, choose the game level,
-# read the help file, play the game one by one and find the author information
-# about the game. The game window shows the game status during the game.
-class Find_Aircraft_Head_Game:
+#===== class Uniform_layouts ==================================================
+# This class is used to choose the aircrafts of a new gameboard. Every valid
+# layout (a set of aircrafts, which aren't overlapping) has the same
+# probability, so the game is fair for both players.
+#
+# An aircraft on the board is called a placement. The placements are numbered
+# and saved as bitmasks of the cells (cell number = y * boardsize + x). A
+# layout is a set of placements, where no placements are overlapping. The
+# layouts are counted by their first (the smallest) placement, and a layout
+# is chosen one placement after another with the counts of the rest layouts.
+#
+# The board can be turned and mirrored in 8 ways (see board_symmetries), and
+# every aircraft model is symmetric around its own axis, so every symmetry
+# moves a placement onto another placement. The canonical form of a layout
+# is the smallest one of its 8 symmetric layouts, so the caches of the
+# layouts can save only one layout of every symmetry class.
+class Uniform_layouts:
     """
-    GUI-surface defination.
+    All layouts of one level.
+    :param self.__level: str, the level of the game.
+    :param self.__size: int, the size of the gameboard.
+    :param self.__amount: int, the amount of aircrafts in a layout.
+    :param self.__placements: list, the cells (list) of every placement, the
+                              first cell is the planehead.
+    :param self.__masks: list, the cells of every placement as a bitmask.
+    :param self.__after: list, the placements after every placement, which
+                         aren't overlapping with it, as a bitmask.
+    :param self.__first_counts: list, the amount of layouts, which start from
+                                every placement. None if not counted yet.
+    :param self.__symmetries: list, the new placement of every placement in
+                              every symmetry. None if not made yet.
+    :param self.__moves: list, the placements, which every placement can be
+                         moved or turned into. None if not made yet.
     """
     def __init__(self, level):
         """
-        Initializes the whole window.
-        :param level: str, the level of the game. The level should be "EASY",
-                      "MEDIUM" or "HARD".
+        Finds all placements of the level.
+        :param level: str, the level of the game.
         """
         self.__level = level
-
-        # Creates a new main window.
-        self.__mainwindow = Tk()
-
-        # Sets the position of the main window.
-        x = self.__mainwindow.winfo_screenwidth() // 3
-        y = self.__mainwindow.winfo_screenheight() // 3
-        self.__mainwindow.geometry("+{}+{}".format(x, y))
-
-        # Sets the window's title and icon.
-        self.__mainwindow.title("Aircraft Head Hunting Game")
-        self.__mainwindow.iconbitmap("icon.ico")
-
-        # Creates the main menu.
-        self.__create_menu()
-
-        # Creates the gameboard in main window.
-        try:
-            self.__create_board()
-        except:
-            showerror(title = "Error",
-                      message = "Please, take a new game again!")
-
-    def __create_menu(self):
+        self.__size, self.__amount, model = LEVELS[level]
+        self.__placements = []
+        for direction in ["W", "E", "N", "S"]:
+            turned = turn_model(model, direction)
+            for y in range(self.__size):
+                for x in range(self.__size):
+                    cells = [(x + dx, y + dy) for dx, dy in turned]
+                    if all(0 <= cx < self.__size and 0 <= cy < self.__size
+                           for cx, cy in cells):
+                        self.__placements.append(
+                            [cy * self.__size + cx for cx, cy in cells])
+
+        self.__masks = []
+        for cells in self.__placements:
+            mask = 0
+            for cell in cells:
+                mask |= 1 << cell
+            self.__masks.append(mask)
+
+        self.__after = []
+        for i in range(len(self.__masks)):
+            after = 0
+            for j in range(i + 1, len(self.__masks)):
+                if self.__masks[i] & self.__masks[j] == 0:
+                    after |= 1 << j
+            self.__after.append(after)
+        self.__first_counts = None
+        self.__symmetries = None
+        self.__moves = None
+
+    def __signature(self):
         """
-        Creates the main menu bar. In this bar, there is 'File', 'Level
-        Choice' and 'Help' menu. Inside 'File' menu, the user can create a
-        new game or leave this game. Inside 'Level Choice' menu, the user
-        can choose the game level. Inside 'Help' menu, the user can choose to
-        read help information in a new window at '? Help' command and find the
-        author's information at 'About...' command.
+        Gets the information, which the counts depend on. If the level is
+        changed, the saved counts are not used.
         * This is a private method.
+        :return: list, the size, the amount and the model in the form of
+                 the file.
         """
-        # ====== Menu Bar =================================
-        self.__menu = Menu(self.__mainwindow)
-        self.__mainwindow.config(menu=self.__menu)
-        # ------ Start / Stop Menu --------------------
-        filemenu = Menu(self.__menu, tearoff=False)
-        self.__menu.add_cascade(label="File", menu=filemenu)
-        filemenu.add_command(label="New Game", command=self.__new_game)
-        filemenu.add_separator()
-        filemenu.add_command(label="Quit", command=self.quit)
-
-        # ------ Level Choice Menu --------------------
-        self.__levelVar = StringVar()
-        levelmenu = Menu(self.__menu, tearoff=False)
-        self.__menu.add_cascade(label="Level Choice", menu=levelmenu)
-        levelmenu.add_radiobutton(label='EASY', variable=self.__levelVar,
-                                  command=self.level_choice, value="EASY")
-        levelmenu.add_radiobutton(label='MEDIUM', variable=self.__levelVar,
-                                  command=self.level_choice, value="MEDIUM")
-        levelmenu.add_radiobutton(label='HARD', variable=self.__levelVar,
-                                  command=self.level_choice, value="HARD")
-
-        # ------ Help Menu -----------------------------
-        helpmenu = Menu(self.__menu, tearoff=False)
-        self.__menu.add_cascade(label="Help", menu=helpmenu)
-        helpmenu.add_command(label="? Help", command=self.__open_Help_Window)
-        helpmenu.add_separator()
-        helpmenu.add_command(label="About...", command=self.author_info)
+        return saved_form([self.__size, self.__amount,
+                           LEVELS[self.__level][2]])
 
-    def __create_board(self):
+    def count_layouts(self, candidates, amount):
         """
-        Sets an initial gameboard. Depends on the game level, the gameboard
-        size is different. The gameboard layout is designed by frame. There
-        is one main frame, two gameboard frames, one game model frame and one
-        info Frame.
-
-        This method is the most important one in this class. All of the
-        intial gameboard information is added by this method, including the
-        aircrafts information and the tip about aircraft model.
-
-        Level EASY: gameboard 8x8, 2 random aircrafts for each player.
-        Level MEDIUM: gameboard 10x10, 3 random aircrafts for each player.
-        Level HARD: gameboard 12x12, 4 random aircrafts for each player.
-        * This is a private method.
+        Counts the layouts of the given amount of aircrafts, which use only
+        the candidate placements.
+        :param candidates: int, the candidate placements as a bitmask.
+        :param amount: int, the amount of aircrafts.
+        :return: int, the amount of the layouts.
         """
-        # Takes 2 random boards. If the board's creating process has any
-        # problem (the return value is None), trys to get the board again.
-        board_1 = game_main(self.__level)
-        while board_1 == None:
-            board_1 = game_main(self.__level)
-        board_2 = game_main(self.__level)
-        while board_2 == None:
-            board_2 = game_main(self.__level)
-        self.__boards = [board_1, board_2]
-
-        # -- If needs to check the answer, can use the next print commands. --
-        # All of the printing in on Python run screen.
-        # print("Player 1's solution is:")
-        # board_1.print()
-        # print("Player 2's solution is:")
-        # board_2.print()
-        # print("-*-" * 15)
-        # print()
+        if amount == 0:
+            return 1
+        if amount == 1:
+            return candidates.bit_count()
+        total = 0
+        while candidates:
+            lowest = candidates & -candidates
+            candidates ^= lowest
+            total += self.count_layouts(
+                candidates & self.__after[lowest.bit_length() - 1],
+                amount - 1)
+        return total
+
+    def count_from(self, first):
+        """
+        Counts the layouts, whose first placement is the given one.
+        :param first: int, the number of the placement.
+        :return: int, the amount of the layouts.
+        """
+        return self.count_layouts(self.__after[first], self.__amount - 1)
 
-        # Sets the boardsize and the amount of aircrafts by level.
-        if self.__level == "EASY":
-            self.__size = 8
-            self.__finding_head = [2, 2]
-        elif self.__level == "MEDIUM":
-            self.__size = 10
-            self.__finding_head = [3, 3]
-        elif self.__level == "HARD":
-            self.__size = 12
-            self.__finding_head = [4, 4]
+    def count(self, processes=None, filename=None):
+        """
+        Counts all layouts of the level. The counts are read from the file,
+        if they are already counted. Otherwise they are counted in parallel
+        and saved into the file.
+        :param processes: int, the amount of the counting processes. None
+                          means the amount of the CPUs.
+        :param filename: str, the file of the saved counts. None means the
+                         file next to this program.
+        :return: int, the amount of all layouts.
+        """
+        if filename is None:
+            filename = resource_path(LAYOUT_COUNT_FILE)
+        if self.__first_counts is None:
+            saved = {}
+            try:
+                with open(filename, encoding="utf-8") as file:
+                    saved = json.load(file)
+            except (OSError, ValueError):
+                None
+            level_data = saved.get(self.__level, {})
+            if level_data.get("signature") == self.__signature():
+                self.__first_counts = level_data["first_counts"]
+            else:
+                with Pool(processes) as pool:
+                    self.__first_counts = pool.map(
+                        partial(_count_layouts_from, self.__level),
+                        range(len(self.__placements)), chunksize=4)
+                saved[self.__level] = {"signature": self.__signature(),
+                                       "first_counts": self.__first_counts}
+                try:
+                    with open(filename, "w", encoding="utf-8") as file:
+                        json.dump(saved, file)
+                except OSError:
+                    None
+            self.__cumulative = list(accumulate(self.__first_counts))
+        return self.__cumulative[-1]
+
+    def sample(self, rng=random):
+        """
+        Chooses one layout. Every layout has the same probability.
+        :param rng: random.Random, the random generator.
+        :return: list, the cells (list) of the aircrafts in the layout.
+        """
+        return [self.__placements[placement]
+                for placement in self.sample_placements(rng)]
 
-        # ====== Display Window =============================
-        # The pictures, which are used in the main window.
-        self.__easy_plane = PhotoImage(file="easy_plane.png")
-        self.__hard_plane = PhotoImage(file="hard_plane.png")
-        self.__emoji_draw = PhotoImage(file="00.gif")
-        self.__emoji_bad1 = PhotoImage(file="B1.gif")
-        self.__emoji_bad2 = PhotoImage(file="B2.gif")
-        self.__emoji_lose = PhotoImage(file="B3.gif")
-        self.__emoji_good1 = PhotoImage(file="G1.gif")
-        self.__emoji_good2 = PhotoImage(file="G2.gif")
-        self.__emoji_win = PhotoImage(file="G3.gif")
+    def sample_placements(self, rng=random):
+        """
+        Chooses one layout like sample(), but returns the numbers of the
+        placements.
+        :param rng: random.Random, the random generator.
+        :return: list, the numbers of the placements in the layout.
+        """
+        total = self.count()
+        # Chooses the first placement by the counts of the layouts.
+        index = rng.randrange(total)
+        first = bisect_right(self.__cumulative, index)
+        chosen = [first]
+
+        # Chooses the next placements one by one in the same way. The
+        # candidates are only the placements after the last chosen one,
+        # which aren't overlapping with the chosen ones.
+        candidates = self.__after[first]
+        for amount in range(self.__amount - 1, 0, -1):
+            index = rng.randrange(self.count_layouts(candidates, amount))
+            rest = candidates
+            while True:
+                lowest = rest & -rest
+                rest ^= lowest
+                placement = lowest.bit_length() - 1
+                next_candidates = candidates & self.__after[placement]
+                layouts = self.count_layouts(next_candidates, amount - 1)
+                if index < layouts:
+                    break
+                index -= layouts
+            chosen.append(placement)
+            candidates = next_candidates
+        return chosen
+
+    def sample_rejected(self, rng=random):
+        """
+        Chooses one layout by choosing random placements, until none of them
+        are overlapping. Every layout has the same probability like in
+        sample_placements(), and this doesn't need the counts, so it is much
+        faster on the big levels. The same generator gives other layouts
+        than sample_placements().
+        :param rng: random.Random, the random generator.
+        :return: list, the numbers of the placements in the layout.
+        """
+        amount = len(self.__placements)
+        while True:
+            chosen = []
+            used = 0
+            for plane in range(self.__amount):
+                placement = rng.randrange(amount)
+                if used & self.__masks[placement]:
+                    break
+                chosen.append(placement)
+                used |= self.__masks[placement]
+            else:
+                return chosen
+
+    def get_size(self):
+        """
+        Gets the size of the gameboard.
+        :return: int, the size of the gameboard.
+        """
+        return self.__size
 
-        # ------- Main frame design --------
-        self.__mainFrame = Frame(self.__mainwindow)
-        self.__startButton = Button(self.__mainFrame, text="Start Game",
-                                    command=self.__startgame, state=NORMAL,
-                                    font=Font(size=16), bg="#C4FF0E")
-        self.__mainLabel = Label(self.__mainFrame, font=Font(size=12))
-
-        player_1_label = Label(self.__mainFrame, text="Player 1",
-                               font=("Calibri", 15, "bold"))
-        player_2_label = Label(self.__mainFrame, text="Player 2",
-                               font=("Calibri", 15, "bold"))
-
-        self.__players_turn = [Label(self.__mainFrame, fg="#88001B",
-                                     font=Font(size=13, weight="bold")),
-                               Label(self.__mainFrame, fg="#88001B",
-                                     font=Font(size=13, weight="bold"))]
-        self.__players_state = [Label(self.__mainFrame, font=("times", 12)),
-                                Label(self.__mainFrame, font=("times", 12))]
-
-        self.__players_emoji = [Label(self.__mainFrame,
-                                      image=self.__emoji_draw),
-                                Label(self.__mainFrame,
-                                      image=self.__emoji_draw)]
+    def get_placements(self):
+        """
+        Gets all placements of the level.
+        :return: list, the cells (list) of every placement, the first cell is
+                 the planehead.
+        """
+        return self.__placements
 
-        # ------- Gameboard frames design --------
-        self.__gameboardFrames = [Frame(self.__mainFrame),
-                                  Frame(self.__mainFrame)]
-        self.__gamemodelFrame = Frame(self.__mainFrame)
-        gamemodelLabel = Label(self.__gamemodelFrame, text="Aircraft Model:",
-                               font=("Calibri", 13, "bold"))
-        if self.__level == "HARD":
-            gamemodel_picLabel = Label(self.__gamemodelFrame,
-                                       image=self.__hard_plane)
-        else:
-            gamemodel_picLabel = Label(self.__gamemodelFrame,
-                                       image=self.__easy_plane)
+    def get_masks(self):
+        """
+        Gets the cells of all placements as bitmasks.
+        :return: list, the bitmask of every placement.
+        """
+        return self.__masks
 
-        # Sets the gameboard squares by buttons. All buttons can return the
-        # coordinates to the method.
-        boardButtons_1 = {}
-        for x in range(self.__size):
-            for y in range(self.__size):
-                if x not in boardButtons_1.keys():
-                    boardButtons_1.update \
-                        ({x: {y: Button(self.__gameboardFrames[0],
-                                        bg = GRAY, width=3, height=1,
-                                        command=partial(self.__boardButton,x,y),
-                                        state=DISABLED)}})
-                else:
-                    boardButtons_1[x].update \
-                        ({y: Button(self.__gameboardFrames[0],
-                                    bg = GRAY, width=3, height=1,
-                                    command=partial(self.__boardButton, x, y),
-                                    state=DISABLED)})
-
-        boardButtons_2 = {}
-        for x in range(self.__size):
-            for y in range(self.__size):
-                if x not in boardButtons_2.keys():
-                    boardButtons_2.update \
-                        ({x: {y: Button(self.__gameboardFrames[1],
-                                        bg=GRAY, width=3, height=1,
-                                        command=partial(self.__boardButton,x,y),
-                                        state=DISABLED)}})
-                else:
-                    boardButtons_2[x].update \
-                        ({y: Button(self.__gameboardFrames[1],
-                                    bg=GRAY, width=3, height=1,
-                                    command=partial(self.__boardButton, x, y),
-                                    state=DISABLED)})
-        self.__boardButtons = [boardButtons_1, boardButtons_2]
+    def get_symmetries(self):
+        """
+        Gets the placements, where the symmetries of the board move every
+        placement.
+        :return: list, 8 lists of the new placement of every placement (in
+                 the order of board_symmetries).
+        """
+        if self.__symmetries is None:
+            numbers = {(cells[0], frozenset(cells)): placement
+                       for placement, cells in enumerate(self.__placements)}
+            self.__symmetries = []
+            for symmetry in board_symmetries(self.__size)[0]:
+                self.__symmetries.append(
+                    [numbers[symmetry[cells[0]],
+                             frozenset(symmetry[cell] for cell in cells)]
+                     for cells in self.__placements])
+        return self.__symmetries
+
+    def canonical_layout(self, placements):
+        """
+        Gets the canonical form of a layout: the smallest one of its 8
+        symmetric layouts.
+        :param placements: list, the numbers of the placements.
+        :return: tuple, the canonical layout (sorted placement numbers) and
+                 the symmetry, which turns the layout into it.
+        """
+        return min((tuple(sorted(symmetry[placement]
+                                 for placement in placements)), number)
+                   for number, symmetry in enumerate(self.get_symmetries()))
 
-        # Sets extra blank columns around the main gameboard.
-        x = self.__size
-        for y in range(self.__size):
-            Label(self.__gameboardFrames[0], text="      ").grid(row=y + 1,
-                                                               column=0)
-            Label(self.__gameboardFrames[1], text="      ").grid(row=y + 1,
-                                                               column=0)
+    def get_moves(self):
+        """
+        Gets the small changes of every placement: the aircraft is moved one
+        square or turned around its planehead.
+        :return: list, the numbers of the new placements (list) of every
+                 placement.
+        """
+        if self.__moves is None:
+            numbers = {(cells[0], frozenset(cells)): placement
+                       for placement, cells in enumerate(self.__placements)}
+            heads = {}
+            for placement, cells in enumerate(self.__placements):
+                heads.setdefault(cells[0], []).append(placement)
+            self.__moves = []
+            for placement, cells in enumerate(self.__placements):
+                moves = [turned for turned in heads[cells[0]]
+                         if turned != placement]
+                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                    moved = [(cell % self.__size + dx,
+                              cell // self.__size + dy) for cell in cells]
+                    if all(0 <= x < self.__size and 0 <= y < self.__size
+                           for x, y in moved):
+                        moved = [y * self.__size + x for x, y in moved]
+                        moves.append(numbers[moved[0], frozenset(moved)])
+                self.__moves.append(moves)
+        return self.__moves
+
+    def get_after(self):
+        """
+        Gets the placements after every placement, which aren't overlapping
+        with it.
+        :return: list, the placements of every placement as a bitmask.
+        """
+        return self.__after
 
-            Label(self.__gameboardFrames[0], text="      ").grid(row=y + 1,
-                                                             column=x + 1)
-            Label(self.__gameboardFrames[1], text="      ").grid(row=y + 1,
-                                                             column=x + 1)
 
-        # ------- Information display frame design --------
-        self.__infoFrame = Frame(self.__mainwindow)
-        Label(self.__infoFrame).pack()
-        levelDisplayLabel = Label(self.__infoFrame,
-                                  text=f"Level: {self.__level}",
-                                  font=("Arial", 15),
-                                  fg = "#0400FC", bg = "#D5F2FA")
-        welcomeLabel = Label(self.__infoFrame,
-                                   text = "Welcome to play! Enjoy your game!",
-                                   font=("Calibri", 12, "italic"),
-                                   fg = "#85021C", bg = "#FAD5DC")
+def saved_form(value):
+    """
+    Changes a value into the form, which it has after it is saved into a
+    JSON-file and read again (for example the tuples are lists). The
+    signatures of the saved files are compared in this form.
+    :param value: list, the value.
+    :return: list, the value as it is read from a JSON-file.
+    """
+    return json.loads(json.dumps(value))
 
-        # All widgets(labels/buttons/frames)' placement.
-        self.__mainFrame.pack()
-        self.__startButton.grid(row = 0, column = 0, columnspan=7)
-        self.__mainLabel.grid(row = 1, column = 0, columnspan=7)
-        self.__players_emoji[0].grid(row=2, column=0, rowspan=2)
-        self.__players_emoji[1].grid(row=2, column=6, rowspan=2)
-        player_1_label.grid(row=2, column=2, sticky=E)
-        player_2_label.grid(row=2, column=4, sticky=W)
-        self.__players_turn[0].grid(row=3, column=1, columnspan=2)
-        self.__players_turn[1].grid(row=3, column=4, columnspan=2)
-        self.__players_state[0].grid(row=4, column=0, columnspan=3, sticky=E+W)
-        self.__players_state[1].grid(row=4, column=4, columnspan=3, sticky=E+W)
-        self.__gameboardFrames[0].grid(row=5, column=0, columnspan=3)
-        self.__gameboardFrames[1].grid(row=5, column=4, columnspan=3)
-        self.__gamemodelFrame.grid(row=5, column=3, sticky=N)
-        gamemodelLabel.grid()
-        gamemodel_picLabel.grid()
+def turn_model(model, direction):
+    """
+    Turns the aircraft model into the given direction.
+    :param model: list, the cells (dx, dy) of the model forwarding to west.
+    :param direction: str, "W", "E", "N" or "S".
+    :return: list, the turned cells (dx, dy).
+    """
+    if direction == "W":
+        return [(dx, dy) for dx, dy in model]
+    elif direction == "E":
+        return [(-dx, dy) for dx, dy in model]
+    elif direction == "N":
+        return [(dy, dx) for dx, dy in model]
+    else: # direction == "S"
+        return [(dy, -dx) for dx, dy in model]
+
+# The layouts of every level are created only once in every process.
+_uniform_layouts = {}
+
+def uniform_layouts(level):
+    """
+    Gets the layouts of the level.
+    :param level: str, the level of the game.
+    :return: Uniform_layouts, the layouts of the level.
+    """
+    if level not in _uniform_layouts.keys():
+        _uniform_layouts[level] = Uniform_layouts(level)
+    return _uniform_layouts[level]
 
-        for x in range(self.__size):
-            for y in range(self.__size):
-                self.__boardButtons[0][x][y].grid(row=y + 1, column=x + 1)
-                self.__boardButtons[1][x][y].grid(row=y + 1, column=x + 1)
+def _count_layouts_from(level, first):
+    """
+    Counts the layouts from the given first placement in a counting process.
+    :param level: str, the level of the game.
+    :param first: int, the number of the placement.
+    :return: int, the amount of the layouts.
+    """
+    return uniform_layouts(level).count_from(first)
 
-        self.__infoFrame.pack(side=BOTTOM)
-        levelDisplayLabel.pack()
-        welcomeLabel.pack()
 
-    def __update_board(self):
+#===== class Revealed_board ===================================================
+# This class is used to record the clicked squares of one player's gameboard.
+# The state has a Zobrist-hash, which is updated at every shot, so the same
+# state can be found from a cache without comparing the whole boards. The
+# random numbers of the hash are always the same, so the hashes can be saved.
+#
+# The board can be turned and mirrored in 8 ways (see board_symmetries), and
+# the aircrafts are turned and mirrored with it, so the 8 symmetric states
+# have the same best shots. The canonical key is the smallest hash of the 8
+# symmetric states, and the caches save only one of them. The symmetric
+# hashes are counted only after they are asked for the first time, so the
+# boards without caches don't pay for them.
+class Revealed_board:
+    """
+    The clicked squares of one gameboard.
+    :param self.__level: str, the level of the game.
+    :param self.__cells: dict, the result (BLANKSPACE, PLANEBODY or
+                         PLANEHEAD) of every clicked cell.
+    :param self.__masks: list, the clicked cells of every result as
+                         bitmasks (the index is the result).
+    :param self.__hash: int, the Zobrist-hash of the clicked squares.
+    :param self.__zobrist: list, the random numbers of the hash (see
+                           zobrist_table).
+    :param self.__symmetric: list, the hashes of the 8 symmetric states.
+                             None if not asked yet.
+    """
+    def __init__(self, level):
         """
-        When the user opens a new game, the whole gameboard need to update.
-        * This is a private method.
+        Initializes a board without clicked squares.
+        :param level: str, the level of the game.
         """
-        self.__gameboardFrames[0].destroy()
-        self.__gameboardFrames[1].destroy()
-        self.__gamemodelFrame.destroy()
-        self.__mainFrame.destroy()
-        self.__infoFrame.destroy()
+        self.__level = level
+        self.__cells = {}
+        self.__masks = [0, 0, 0]
+        self.__hash = 0
+        self.__zobrist = zobrist_table(level)
+        self.__symmetric = None
 
-        try:
-            self.__create_board()
-        except:
-            showerror(title="Error",
-                      message="Please, take a new game again!")
+    def reveal(self, cell, result):
+        """
+        Records a shot.
+        :param cell: int, the cell number of the square.
+        :param result: int, BLANKSPACE, PLANEBODY or PLANEHEAD.
+        """
+        if cell in self.__cells:
+            return
+        self.__cells[cell] = result
+        self.__masks[result] |= 1 << cell
+        self.__hash ^= self.__zobrist[result][cell]
+        if self.__symmetric is not None:
+            for symmetry, table in enumerate(symmetric_zobrist(self.__level)):
+                self.__symmetric[symmetry] ^= table[result][cell]
+
+    def get_level(self):
+        """
+        Gets the level of the game.
+        :return: str, the level of the game.
+        """
+        return self.__level
 
-    def __new_game(self):
+    def get_cells(self):
         """
-        Creates a new game. Needs to confirm before starting a new game.
-        * This is a private method.
+        Gets the clicked cells.
+        :return: dict, the result of every clicked cell.
         """
-        check = messagebox.askokcancel("Confirm",
-                   "Are you sure to start a new {} game?".format(self.__level))
-        if check == True:
-            self.__update_board()
-        self.__startButton.configure(state=NORMAL)
+        return self.__cells
 
-    def __startgame(self):
+    def get_mask(self, result):
         """
-        Starts the game. Makes all of the gameboard buttons into NORMAL state.
-        * This is a private method.
+        Gets the clicked cells with the given result.
+        :param result: int, BLANKSPACE, PLANEBODY or PLANEHEAD.
+        :return: int, the cells as a bitmask.
         """
-        # Resets the round counter into 0.
-        self.__round = 0
+        return self.__masks[result]
 
-        # Resets all gameboard buttons into NORMAL state
-        for x in range(self.__size):
-            for y in range(self.__size):
-                self.__boardButtons[0][x][y].configure(state=NORMAL)
+    def get_key(self):
+        """
+        Gets the hash of the clicked squares.
+        :return: int, the 64-bit Zobrist-hash.
+        """
+        return self.__hash
 
-        # Shows the game information on the label.
-        self.__players_turn[0].configure(text="Your turn!")
-        self.__players_state[0].configure(
-            text=f"You have {self.__finding_head[0]} heads to find!")
-        self.__players_state[1].configure(
-            text=f"You have {self.__finding_head[1]} heads to find!")
-        self.__mainLabel.configure(text="Round: 0")
-
-        # Sets the start button into DISABLED state after the game already
-        # started.
-        self.__startButton.configure(state=DISABLED)
+    def get_canonical(self):
+        """
+        Gets the hash, which is the same for all 8 symmetric states.
+        :return: tuple, the canonical key (int) and the symmetry (int, see
+                 board_symmetries), which turns this state into the state
+                 of the key.
+        """
+        if self.__symmetric is None:
+            self.__symmetric = [0] * 8
+            for symmetry, table in enumerate(symmetric_zobrist(self.__level)):
+                for cell, result in self.__cells.items():
+                    self.__symmetric[symmetry] ^= table[result][cell]
+        key = min(self.__symmetric)
+        return key, self.__symmetric.index(key)
+
+# The random numbers of the Zobrist-hashes of every level.
+_zobrist_tables = {}
+
+def zobrist_table(level):
+    """
+    Gets the random numbers of the Zobrist-hashes. There is one 64-bit number
+    for every result of every cell. The numbers are the same in every run.
+    :param level: str, the level of the game.
+    :return: list, a list of the numbers of every cell for every result.
+    """
+    if level not in _zobrist_tables.keys():
+        size = LEVELS[level][0]
+        rng = random.Random(f"zobrist-{level}")
+        _zobrist_tables[level] = [
+            [rng.getrandbits(64) for cell in range(size * size)]
+            for result in [BLANKSPACE, PLANEBODY, PLANEHEAD]]
+    return _zobrist_tables[level]
+
+# The symmetries of every board size.
+_board_symmetries = {}
+
+def board_symmetries(size):
+    """
+    Gets the 8 ways to turn and mirror the board. The first one doesn't
+    change the board.
+    :param size: int, the size of the gameboard.
+    :return: tuple, two lists of 8 lists: the new cell of every cell in
+             every symmetry, and the same for the opposite symmetries.
+    """
+    if size not in _board_symmetries.keys():
+        last = size - 1
+        turns = [lambda x, y: (x, y), lambda x, y: (last - x, y),
+                 lambda x, y: (x, last - y), lambda x, y: (last - x, last - y),
+                 lambda x, y: (y, x), lambda x, y: (last - y, x),
+                 lambda x, y: (y, last - x),
+                 lambda x, y: (last - y, last - x)]
+        symmetries = []
+        opposites = []
+        for turn in turns:
+            symmetry = [0] * (size * size)
+            opposite = [0] * (size * size)
+            for y in range(size):
+                for x in range(size):
+                    new_x, new_y = turn(x, y)
+                    symmetry[y * size + x] = new_y * size + new_x
+                    opposite[new_y * size + new_x] = y * size + x
+            symmetries.append(symmetry)
+            opposites.append(opposite)
+        _board_symmetries[size] = (symmetries, opposites)
+    return _board_symmetries[size]
+
+# The random numbers of the hashes of the symmetric states of every level.
+_symmetric_zobrist = {}
+
+def symmetric_zobrist(level):
+    """
+    Gets the random numbers of the hashes of the 8 symmetric states. The
+    hash of a cell in a symmetry is the hash of the cell, where the symmetry
+    moves it, so the first table is the same as zobrist_table().
+    :param level: str, the level of the game.
+    :return: list, the tables (like zobrist_table) of every symmetry.
+    """
+    if level not in _symmetric_zobrist.keys():
+        table = zobrist_table(level)
+        symmetries = board_symmetries(LEVELS[level][0])[0]
+        _symmetric_zobrist[level] = [
+            [[numbers[symmetry[cell]] for cell in range(len(symmetry))]
+             for numbers in table]
+            for symmetry in symmetries]
+    return _symmetric_zobrist[level]
+
+
+#===== class Hint_engine ======================================================
+# This class is used to find the best next square for the player. In the end
+# of the game the square is searched exactly (see Endgame_solver). Otherwise
+# a square is good, if many possible aircrafts have their head there. An
+# aircraft is possible, if it doesn't cover any white square, its head isn't
+# on a blue square and its body isn't on a red square. The aircrafts, which
+# cover blue squares, are much more probable than the others.
+#
+# The hints are saved in a LRU-cache (a transposition table) by the canonical
+# key of the clicked squares, so the 8 symmetric states share one hint. The
+# hint is saved as the cell of the canonical state and turned back into the
+# asked state. In the beginning of the games the same states come again and
+# again, and then the hint is only a lookup.
+class Hint_engine:
+    """
+    Gives the hints of one level.
+    :param self.__layouts: Uniform_layouts, the placements of the level.
+    :param self.__cache: OrderedDict, the saved hints (the cells of the
+                         canonical states) by the canonical keys.
+    :param self.__cache_size: int, the biggest amount of the saved hints.
+    """
+    # How many times more probable an aircraft is for every blue square,
+    # which it covers.
+    HIT_WEIGHT = 50
 
-    def __boardButton(self, x, y):
+    def __init__(self, level, cache_size=HINT_CACHE_SIZE):
         """
-        This is the gameboard buttons' event. The button can change the state
-        into DISABLED or NORMAL and then change the color to while/red/blue.
+        Initializes the hint engine.
+        :param level: str, the level of the game.
+        :param cache_size: int, the biggest amount of the saved hints.
+        """
+        self.__level = level
+        self.__layouts = uniform_layouts(level)
+        self.__cache = OrderedDict()
+        self.__cache_size = cache_size
+        self.__endgame = Endgame_solver(level)
+        self.__hits = 0
+        self.__misses = 0
+
+    def best_cell(self, revealed, time_limit=ENDGAME_TIME):
+        """
+        Finds the best next square.
+        :param revealed: Revealed_board, the clicked squares.
+        :param time_limit: float, the longest time of the exact search
+                           (seconds). None: the search isn't stopped, so the
+                           hint doesn't depend on the load of the machine.
+        :return: int, the cell number of the best square. None if all of the
+                 squares are already clicked.
+        """
+        key, symmetry = revealed.get_canonical()
+        symmetries, opposites = board_symmetries(self.__layouts.get_size())
+        if key in self.__cache.keys():
+            self.__cache.move_to_end(key)
+            self.__hits += 1
+            cell = self.__cache[key]
+            return None if cell is None else opposites[symmetry][cell]
+
+        self.__misses += 1
+        # In the beginning of the game the square is in the opening book,
+        # and in the end of the game it is searched exactly.
+        cell = opening_book(self.__level).lookup(key)
+        if cell is not None:
+            cell = opposites[symmetry][cell]
+        stopped = False
+        if cell is None:
+            cell = self.__endgame.best_cell(revealed, time_limit)
+            stopped = self.__endgame.was_stopped()
+        if cell is None:
+            cell = self.__search(revealed)
+        # The usual hint after a stopped search isn't saved, so the hint of
+        # the state doesn't depend on the load of the machine.
+        if not stopped:
+            self.__cache[key] = None if cell is None \
+                else symmetries[symmetry][cell]
+            if len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
+        return cell
+
+    def __search(self, revealed):
+        """
+        Counts the weights of the planeheads of all possible aircrafts.
         * This is a private method.
-        :param x: int, x-coordinate of the given button.
-        :param y: int, y-coordinate of the given button.
+        :param revealed: Revealed_board, the clicked squares.
+        :return: int, the cell number of the best square.
         """
-        # Makes sure which player is playing now.
-        player_turn = self.__round % 2
-
-        # Changes the player's gameboard button's outfit.
-        board = self.__boards[player_turn].get_board()
-        if board[ROW[x]][y] == BLANKSPACE:
-            self.__boardButtons[player_turn][x][y].configure(bg=WHITE)
-        elif board[ROW[x]][y] == PLANEHEAD:
-            self.__boardButtons[player_turn][x][y].configure(bg=RED)
-            self.__finding_head[player_turn] -= 1
-            self.__players_state[player_turn].configure(
-                text=f"You have {self.__finding_head[player_turn]} "
-                     f"heads to find!"
-            )
-            self.__change_emoji()
-        elif board[ROW[x]][y] == PLANEBODY:
-            self.__boardButtons[player_turn][x][y].configure(bg=BLUE)
+        blank = revealed.get_mask(BLANKSPACE)
+        body = revealed.get_mask(PLANEBODY)
+        head = revealed.get_mask(PLANEHEAD)
+        clicked = blank | body | head
+
+        weights = {}
+        masks = self.__layouts.get_masks()
+        for placement, cells in enumerate(self.__layouts.get_placements()):
+            mask = masks[placement]
+            head_bit = 1 << cells[0]
+            if mask & blank or head_bit & (body | head) \
+                    or (mask ^ head_bit) & head:
+                continue
+            weight = self.HIT_WEIGHT ** (mask & body).bit_count()
+            weights[cells[0]] = weights.get(cells[0], 0) + weight
+
+        if weights:
+            return max(sorted(weights.keys()), key=weights.get)
+        # No aircraft is possible anymore, so takes any free square.
+        size = self.__layouts.get_size()
+        for cell in range(size * size):
+            if not clicked & (1 << cell):
+                return cell
+        return None
 
-        # If the game is over, all of the bottons need to be locked.
-        if player_turn == 1 and self.__is_winner():
-            self.__disabled_all_buttons()
-            return
+    def get_statistics(self):
+        """
+        Gets the statistics of the cache.
+        :return: tuple, the amount of the found and the not found hints.
+        """
+        return self.__hits, self.__misses
 
-        # Updates the round's showing.
-        round_show = self.__round // 2 + 1
-        self.__mainLabel.configure(text = f"Round: {round_show}")
+# The hint engines of every level.
+_hint_engines = {}
 
-        # When the game isn't over, changes the buttons' state. Makes sure
-        # the player can play the game one by one. Continues to count the
-        # round number.
-        self.__disabled_buttons()
-        self.__round += 1
+def hint_engine(level):
+    """
+    Gets the hint engine of the level. The cache of the engine is kept from
+    game to game.
+    :param level: str, the level of the game.
+    :return: Hint_engine, the hint engine of the level.
+    """
+    if level not in _hint_engines.keys():
+        _hint_engines[level] = Hint_engine(level)
+    return _hint_engines[level]
+
+
+#===== class Endgame_solver ===================================================
+# This class is used to find the best square in the end of the game, when
+# only a few layouts are possible anymore. Every possible layout has the same
+# probability (the boards are chosen uniformly). The solver finds the square,
+# after which the expected amount of the shots to find every head is the
+# smallest (expectimax). A shot divides the layouts into groups by the result
+# of the square, and the expected shots of every group are searched in the
+# same way.
+#
+# The search is started only, if the state is small enough (ENDGAME_WORK),
+# so the hint is given during the same turn. The size depends only on the
+# state, so the same state is always searched or never. The bigger states
+# get the most probable head, which is known exactly from the layouts.
+#
+# A state of the search is the set of the possible layouts, and every layout
+# is saved as the bitmasks of its not found heads and bodies. The shots and
+# their order are not in the state, so the same state is searched only once
+# and it is saved from turn to turn. The search of a hint stops after
+# ENDGAME_TIME seconds, and then the hint engine gives its usual hint. The
+# boards are rated without the time limit, so the ratings don't depend on
+# the load of the machine.
+class Endgame_solver:
+    """
+    The exact search of one level.
+    :param self.__level: str, the level of the game.
+    :param self.__layouts: Uniform_layouts, the placements of the level.
+    :param self.__free: list, the placements, which aren't overlapping with
+                        every placement, as a bitmask.
+    :param self.__memo: dict, the expected shots and the best cell of every
+                        searched state.
+    :param self.__deadline: float, the time (time.perf_counter), when the
+                            search stops. Infinite, if it isn't stopped.
+    :param self.__stopped: bool, True: the last search stopped, because it
+                           didn't finish in time.
+    """
+    def __init__(self, level):
+        """
+        Initializes the solver.
+        :param level: str, the level of the game.
+        """
+        self.__level = level
+        self.__layouts = uniform_layouts(level)
+        self.__free = list(self.__layouts.get_after())
+        for first, after in enumerate(self.__layouts.get_after()):
+            while after:
+                lowest = after & -after
+                after ^= lowest
+                self.__free[lowest.bit_length() - 1] |= 1 << first
+        self.__memo = {}
+        self.__deadline = 0.0
+        self.__stopped = False
+
+    def best_cell(self, revealed, time_limit=ENDGAME_TIME):
+        """
+        Finds the best next square, if there are only a few possible layouts.
+        :param revealed: Revealed_board, the clicked squares.
+        :param time_limit: float, the longest time of the search (seconds).
+                           None if the search isn't stopped.
+        :return: int, the cell number of the best square. If the search is
+                 too big or it didn't finish in time, the most probable head.
+                 None if there are too many layouts.
+        """
+        self.__stopped = False
+        state = self.state(revealed)
+        if not state:
+            return None
+        if not self.__small(state):
+            return self.__likely_cell(state)
+        self.__start(time_limit)
+        if len(self.__memo) > ENDGAME_MEMO_SIZE:
+            self.__memo.clear()
+        try:
+            return self.__expect(state)[1]
+        except Search_timeout:
+            self.__stopped = True
+            return self.__likely_cell(state)
 
-    def __change_emoji(self):
+    def was_stopped(self):
         """
-        Changes the emoji depends on the result of the game to take the game
-        has more funny.
-        * This is a private method.
+        Checks the last search of best_cell() didn't finish in time.
+        :return: bool, True: the search was stopped.
         """
-        player_turn = self.__round % 2
-        player_next_turn = (self.__round + 1) % 2
+        return self.__stopped
 
-        # Calculates the difference amount of each player's finded aircraft
-        # heads. Changes the emoji depending on the error.
-        diff = abs(self.__finding_head[0] - self.__finding_head[1])
-        if diff == 0:
-            self.__players_emoji[0].configure(image=self.__emoji_draw)
-            self.__players_emoji[1].configure(image=self.__emoji_draw)
-        elif diff == 1:
-            self.__players_emoji[player_turn].configure(
-                image=self.__emoji_good1)
-            self.__players_emoji[player_next_turn].configure(
-                image=self.__emoji_bad1)
-        else:
-            self.__players_emoji[player_turn].configure(
-                image=self.__emoji_good2)
-            self.__players_emoji[player_next_turn].configure(
-                image=self.__emoji_bad2)
+    def expected_shots(self, revealed, time_limit=ENDGAME_TIME):
+        """
+        Finds the expected amount of the shots to find every head, when the
+        best squares are shot.
+        :param revealed: Revealed_board, the clicked squares.
+        :param time_limit: float, the longest time of the search (seconds).
+                           None if the search isn't stopped.
+        :return: float, the expected shots. None if the search is too big or
+                 it didn't finish in time.
+        """
+        state = self.state(revealed)
+        if not self.__small(state):
+            return None
+        self.__start(time_limit)
+        try:
+            return self.__expect(state)[0]
+        except Search_timeout:
+            return None
 
-    def __disabled_all_buttons(self):
+    def __small(self, state):
         """
-        Locks all the gameboard buttons.
+        Checks that the state can be searched in one turn. The work of the
+        search is predicted by the amount of the layouts times the amount of
+        the squares, which are a head or a body in some layout.
         * This is a private method.
+        :param state: frozenset, the possible layouts (see state()). None if
+                      there are too many of them.
+        :return: bool, True: the state is searched.
         """
-        for x in range(self.__size):
-            for y in range(self.__size):
-                self.__boardButtons[0][x][y].configure(state=DISABLED)
-                self.__boardButtons[1][x][y].configure(state=DISABLED)
+        if not state:
+            return False
+        cells = 0
+        for heads, bodies in state:
+            cells |= heads | bodies
+        return len(state) * cells.bit_count() <= ENDGAME_WORK
 
-    def __disabled_buttons(self):
+    def __likely_cell(self, state):
         """
-        Changes the players' gameboard buttons state. If the buttons haven't
-        been chose, changes the state from NORMAL to DISABLED or from DISABLED
-        to NORMAL. Changes the text of turn-label at the same time.
+        Finds the square, which is a head in the most layouts, without a
+        search. If there are many of them, the square, after which the
+        fewest layouts are left on average, is chosen.
         * This is a private method.
+        :param state: frozenset, the possible layouts (see state()).
+        :return: int, the cell number of the square. None if every head is
+                 found.
         """
-        player_turn = self.__round % 2
-        player_next_turn = (self.__round + 1) % 2
-        for x in range(self.__size):
-            for y in range(self.__size):
-                self.__boardButtons[player_turn][x][y].configure(
-                    state=DISABLED)
-                state = str(self.__boardButtons[player_next_turn][x][y]["bg"])
-                # Changes just gray squares into NORMAL.
-                if state == GRAY:
-                    self.__boardButtons[player_next_turn][x][y].configure(
-                        state=NORMAL)
-        self.__players_turn[player_turn].configure(text="")
-        self.__players_turn[player_next_turn].configure(text="Your turn!")
-
-    def __is_winner(self):
+        heads_in = {}
+        bodies_in = {}
+        for heads, bodies in state:
+            while heads:
+                lowest = heads & -heads
+                heads ^= lowest
+                heads_in[lowest] = heads_in.get(lowest, 0) + 1
+            while bodies:
+                lowest = bodies & -bodies
+                bodies ^= lowest
+                bodies_in[lowest] = bodies_in.get(lowest, 0) + 1
+        if not heads_in:
+            return None
+
+        def goodness(cell):
+            head = heads_in[cell]
+            body = bodies_in.get(cell, 0)
+            left = head * head + body * body + \
+                (len(state) - head - body) ** 2
+            return head, -left, -cell
+        return max(heads_in.keys(), key=goodness).bit_length() - 1
+
+    def __start(self, time_limit):
         """
-        The game will be over, when the players are drawing or one of them
-        won the game. This method is used to check the game is over or not.
-        When the game is over, makes the showinfo-message at the same time.
+        Sets the time, when the search stops.
         * This is a private method.
-        :return: bool, True: when the game is over;
-                       False: when the game is still playing.
+        :param time_limit: float, the longest time of the search (seconds).
+                           None if the search isn't stopped.
         """
-        # When all of the players have found all heads, it is draw.
-        if self.__finding_head[0] == 0 and self.__finding_head[1] == 0:
-            self.__players_emoji[0].configure(image = self.__emoji_draw)
-            self.__players_emoji[1].configure(image = self.__emoji_draw)
-            showinfo(title = "GAME IS OVER",
-                     message= "Congratulations!\n\nThe game is a draw!")
-            return True
-        # When only player 1 has found all heads, player 1 is the winner.
-        elif self.__finding_head[0] == 0:
-            self.__players_emoji[0].configure(image = self.__emoji_win)
-            self.__players_emoji[1].configure(image = self.__emoji_lose)
-            showinfo(title = "GAME IS OVER",
-                     message = "Congratulations!\n\nPlayer 1 won the game!!!")
-            return True
-        # When only player 2 has found all heads, player 2 is the winner.
-        elif self.__finding_head[1] == 0:
-            self.__players_emoji[1].configure(image = self.__emoji_win)
-            self.__players_emoji[0].configure(image = self.__emoji_lose)
-            showinfo(title = "GAME IS OVER",
-                     message = "Congratulations!\n\nPlayer 2 won the game!!!")
-            return True
-
-        return False
+        if time_limit is None:
+            self.__deadline = float("inf")
+        else:
+            self.__deadline = time.perf_counter() + time_limit
 
-    def level_choice(self):
+    def state(self, revealed, limit=ENDGAME_LAYOUTS):
         """
-        This method is used to record the level of the game.
+        Finds the possible layouts. The results of the clicked squares are
+        the same as in the board (Gameboard.get_board()) of every layout.
+        :param revealed: Revealed_board, the clicked squares.
+        :param limit: int, the biggest amount of the layouts.
+        :return: frozenset, the not found heads and bodies (bitmasks) of
+                 every layout. None if there are more layouts than the limit.
         """
-        self.__level = self.__levelVar.get()
-
-    def author_info(self):
+        blank = revealed.get_mask(BLANKSPACE)
+        body = revealed.get_mask(PLANEBODY)
+        head = revealed.get_mask(PLANEHEAD)
+        clicked = blank | body | head
+
+        # The possible placements, and the possible placements of every
+        # cell as bitmasks.
+        candidates = 0
+        covering = {}
+        masks = self.__layouts.get_masks()
+        for placement, cells in enumerate(self.__layouts.get_placements()):
+            mask = masks[placement]
+            head_bit = 1 << cells[0]
+            if mask & blank or head_bit & body \
+                    or (mask ^ head_bit) & head:
+                continue
+            candidates |= 1 << placement
+            for cell in cells:
+                covering[cell] = covering.get(cell, 0) | 1 << placement
+
+        layouts = []
+        amount = LEVELS[self.__level][1]
+        if not self.__find_layouts(body | head, candidates, amount, 0,
+                                   covering, layouts, limit):
+            return None
+
+        state = set()
+        for chosen in layouts:
+            heads = 0
+            bodies = 0
+            while chosen:
+                lowest = chosen & -chosen
+                chosen ^= lowest
+                cells = self.__layouts.get_placements()[
+                    lowest.bit_length() - 1]
+                heads |= 1 << cells[0]
+                bodies |= masks[lowest.bit_length() - 1] ^ 1 << cells[0]
+            state.add((heads & ~clicked, bodies & ~clicked))
+        common = -1
+        for heads, bodies in state:
+            common &= bodies
+        return frozenset((heads, bodies & ~common) for heads, bodies in state)
+
+    def __find_layouts(self, required, candidates, amount, chosen, covering,
+                       layouts, limit):
         """
-        Sets the messagebox's title and text. Shows the author information.
+        Finds the layouts, which cover all required cells. The placement of
+        the smallest required cell is chosen first, so every layout is found
+        only once.
+        * This is a private method.
+        :param required: int, the cells, which aren't covered yet.
+        :param candidates: int, the placements, which can still be chosen.
+        :param amount: int, the amount of the placements to choose.
+        :param chosen: int, the chosen placements.
+        :param covering: dict, the possible placements of every cell.
+        :param layouts: list, the found layouts (bitmask of placements).
+        :param limit: int, the biggest amount of the layouts.
+        :return: bool, False if there are more layouts than the limit.
         """
-        showinfo(title = "Author Information",
-                 message = "Name: Shuang Fan \n"
-                           "Email: shuang.fan@tuni.fi\n"
-                           "Student number: H255220")
+        if amount == 0:
+            if required == 0:
+                layouts.append(chosen)
+            return len(layouts) <= limit
+        if required:
+            lowest = required & -required
+            options = candidates & covering.get(lowest.bit_length() - 1, 0)
+        else:
+            options = candidates
+        masks = self.__layouts.get_masks()
+        after = self.__layouts.get_after()
+        while options:
+            option = options & -options
+            options ^= option
+            placement = option.bit_length() - 1
+            rest = candidates & self.__free[placement]
+            if not required:
+                # Without required cells the placements are chosen in order.
+                rest &= after[placement]
+            if not self.__find_layouts(required & ~masks[placement], rest,
+                                       amount - 1, chosen | option,
+                                       covering, layouts, limit):
+                return False
+        return True
+
+    def __expect(self, state):
+        """
+        Searches the expected shots to find every head.
+        * This is a private method.
+        :param state: frozenset, the not found heads and bodies of every
+                      possible layout.
+        :return: tuple, the expected shots and the best cell (None if every
+                 head is found).
+        """
+        if state in self.__memo:
+            return self.__memo[state]
+        if time.perf_counter() > self.__deadline:
+            raise Search_timeout()
+
+        layouts = list(state)
+        heads_left = layouts[0][0].bit_count()
+        if heads_left == 0:
+            return 0, None
+        if len(layouts) == 1:
+            heads = layouts[0][0]
+            return heads_left, (heads & -heads).bit_length() - 1
+
+        # The layouts, where every cell is a head or a body, as bitmasks of
+        # the layouts.
+        head_layouts = {}
+        body_layouts = {}
+        for index, (heads, bodies) in enumerate(layouts):
+            bit = 1 << index
+            while heads:
+                lowest = heads & -heads
+                heads ^= lowest
+                head_layouts[lowest] = head_layouts.get(lowest, 0) | bit
+            while bodies:
+                lowest = bodies & -bodies
+                bodies ^= lowest
+                body_layouts[lowest] = body_layouts.get(lowest, 0) | bit
+        everyone = (1 << len(layouts)) - 1
+
+        # A head, which is in every layout, can be shot at once. It doesn't
+        # tell anything new, so the order of the shots doesn't matter.
+        for cell, found in head_layouts.items():
+            if found == everyone:
+                result = (1 + self.__expect(frozenset(
+                              (heads ^ cell, bodies)
+                              for heads, bodies in layouts))[0],
+                          cell.bit_length() - 1)
+                self.__memo[state] = result
+                return result
+
+        # Only the squares, which can be a head or have different results
+        # in the layouts, are useful. The squares with the same results in
+        # every layout are as good, so only one of them is tried. The most
+        # probable heads are tried first, so the bound cuts more.
+        patterns = {}
+        for cell in head_layouts.keys() | body_layouts.keys():
+            pattern = (head_layouts.get(cell, 0), body_layouts.get(cell, 0))
+            if pattern[1] != everyone:
+                patterns.setdefault(pattern, cell)
+        order = sorted(patterns.keys(), key=lambda pattern:
+                       (-pattern[0].bit_count(), patterns[pattern]))
+
+        total = len(layouts)
+        best = None
+        for hit, touched in order:
+            cell = patterns[(hit, touched)]
+            groups = [[], [], []]
+            for index, (heads, bodies) in enumerate(layouts):
+                if hit >> index & 1:
+                    groups[PLANEHEAD].append((heads ^ cell, bodies))
+                elif touched >> index & 1:
+                    groups[PLANEBODY].append((heads, bodies))
+                else:
+                    groups[BLANKSPACE].append((heads, bodies))
+            groups = [group for group in groups if group]
+
+            # Every not found head needs one shot. The groups are searched
+            # until the square cannot be better than the best one.
+            expected = 1 + sum(len(group) * group[0][0].bit_count()
+                               for group in groups) / total
+            if best is not None and expected >= best[0]:
+                continue
+            for group in sorted(groups, key=len, reverse=True):
+                # The bodies, which are in every layout of the group, don't
+                # tell anything anymore, so they are left out of the state.
+                common = -1
+                for heads, bodies in group:
+                    common &= bodies
+                value = self.__expect(frozenset(
+                    (heads, bodies & ~common) for heads, bodies in group))[0]
+                expected += len(group) / total * \
+                    (value - group[0][0].bit_count())
+                if best is not None and expected >= best[0]:
+                    break
+            else:
+                best = (expected, cell.bit_length() - 1)
+        self.__memo[state] = best
+        return best
+
+
+class Search_timeout(Exception):
+    """
+    The search didn't finish in time.
+    """
 
-    def __open_Help_Window(self):
+
+#===== class Opening_book =====================================================
+# This class is used to give the first shots of the game without any search.
+# Nothing is known in the beginning of the game, so the best first shots are
+# the same in every game. The book is made once (--opening-book): the hint
+# engine plays the first OPENING_DEPTH shots of every level with every
+# possible result of every shot.
+#
+# The book file has a part for every level. A part has the level name, the
+# amount of the states and the signature of the hint engine, and then the
+# sorted canonical keys of the states (8 bytes each, little-endian) and the
+# best cell of every canonical state (1 byte each). The symmetric states are
+# saved only once (see Revealed_board). A part is read only when its level
+# is used for the first time, and the square is found by binary search.
+class Opening_book:
+    """
+    The opening book of one level.
+    :param self.__level: str, the level of the game.
+    :param self.__filename: str, the book file.
+    :param self.__keys: array, the sorted hashes of the states. None if not
+                        read yet.
+    :param self.__cells: bytes, the best cell of every state.
+    """
+    MAGIC = b"AHHB"
+    PART = struct.Struct("<8sIL")
+
+    def __init__(self, level, filename=None):
         """
-        Opens the help window.
+        Initializes the book. The file is read only when it is used.
+        :param level: str, the level of the game.
+        :param filename: str, the book file. None means the file next to
+                         this program.
         """
-        Help_Window().start()
+        if filename is None:
+            filename = resource_path(OPENING_BOOK_FILE)
+        self.__level = level
+        self.__filename = filename
+        self.__keys = None
+        self.__cells = b""
 
-    def start(self):
+    def lookup(self, key):
         """
-        Starts the mainloop.
+        Finds the best square of the state.
+        :param key: int, the canonical key of the clicked squares.
+        :return: int, the cell number of the best square of the canonical
+                 state. None if the state isn't in the book.
         """
-        self.__mainwindow.mainloop()
+        if self.__keys is None:
+            self.__load()
+        index = bisect_right(self.__keys, key) - 1
+        if index >= 0 and self.__keys[index] == key:
+            return self.__cells[index]
+        return None
 
-    def quit(self):
+    def __load(self):
         """
-        Ends the execution of the program.
+        Reads the part of the level from the book file. If there is no book
+        or the hint engine is changed, the book is empty.
+        * This is a private method.
         """
-        check = messagebox.askokcancel("Confirm", "Are you sure to quit?")
-        if check == True:
-            try:
-                self.__mainwindow.destroy()
-                self.__helpwindow.destroy()
-            except:
-                None
+        self.__keys = array("Q")
+        try:
+            with open(self.__filename, "rb") as file:
+                if file.read(len(self.MAGIC)) != self.MAGIC:
+                    return
+                while True:
+                    header = file.read(self.PART.size)
+                    if len(header) < self.PART.size:
+                        return
+                    name, amount, signature = self.PART.unpack(header)
+                    if name.rstrip(b"\0").decode() != self.__level:
+                        file.seek(amount * 9, os.SEEK_CUR)
+                        continue
+                    if signature != book_signature(self.__level):
+                        return
+                    keys = array("Q")
+                    keys.frombytes(file.read(amount * 8))
+                    if sys.byteorder == "big":
+                        keys.byteswap()
+                    self.__cells = file.read(amount)
+                    self.__keys = keys
+                    return
+        except (OSError, ValueError):
+            None
+
+    def get_amount(self):
+        """
+        Gets the amount of the states in the book.
+        :return: int, the amount of the states.
+        """
+        if self.__keys is None:
+            self.__load()
+        return len(self.__keys)
 
-#===== class Help_Window ======================================================
-# This class is used to design the help window. In this window, there is the
-# game instruction. The user can use the help file to play the game. This
-# window can be opend with the main window at the same time.
-class Help_Window:
+
+def book_signature(level):
     """
-    The helpwindow's outfit design.
+    Gets the signature of the things, which the opening book depends on. If
+    the level or the hint engine is changed, the book is not used.
+    :param level: str, the level of the game.
+    :return: int, the CRC-32 of the settings.
     """
-    def __init__(self):
+    size, amount, model = LEVELS[level]
+    settings = [size, amount, [list(cell) for cell in model],
+                Hint_engine.HIT_WEIGHT, ENDGAME_LAYOUTS, ENDGAME_WORK,
+                "canonical"]
+    return zlib.crc32(json.dumps(settings).encode())
+
+def opening_lines(level, depth=OPENING_DEPTH):
+    """
+    Plays the first shots of the level with the hint engine. Every possible
+    result of every shot is played. The symmetric states are played only
+    once.
+    :param level: str, the level of the game.
+    :param depth: int, the amount of the shots.
+    :return: dict, the best cell of every canonical state by the canonical
+             key.
+    """
+    engine = Hint_engine(level)
+    layouts = uniform_layouts(level)
+    symmetries = board_symmetries(layouts.get_size())[0]
+    book = {}
+    waiting = [({}, depth)]
+    while waiting:
+        cells, shots_left = waiting.pop()
+        revealed = Revealed_board(level)
+        for cell, result in cells.items():
+            revealed.reveal(cell, result)
+        key, symmetry = revealed.get_canonical()
+        if key in book.keys():
+            continue
+        cell = engine.best_cell(revealed)
+        if cell is None:
+            continue
+        book[key] = symmetries[symmetry][cell]
+        if shots_left > 1:
+            for result in possible_results(layouts, revealed, cell):
+                waiting.append(({**cells, cell: result}, shots_left - 1))
+    return book
+
+def possible_results(layouts, revealed, cell):
+    """
+    Finds the possible results of a square. A result is possible, if any
+    possible aircraft gives it.
+    :param layouts: Uniform_layouts, the placements of the level.
+    :param revealed: Revealed_board, the clicked squares.
+    :param cell: int, the cell number of the square.
+    :return: list, the possible results.
+    """
+    blank = revealed.get_mask(BLANKSPACE)
+    body = revealed.get_mask(PLANEBODY)
+    head = revealed.get_mask(PLANEHEAD)
+    results = {BLANKSPACE}
+    masks = layouts.get_masks()
+    for placement, cells in enumerate(layouts.get_placements()):
+        mask = masks[placement]
+        head_bit = 1 << cells[0]
+        if not mask >> cell & 1 or mask & blank or head_bit & body \
+                or (mask ^ head_bit) & head:
+            continue
+        results.add(PLANEHEAD if cells[0] == cell else PLANEBODY)
+    return sorted(results)
+
+def build_opening_book(depth=OPENING_DEPTH, processes=None, filename=None):
+    """
+    Makes the opening book of every level in parallel and saves it.
+    :param depth: int, the amount of the shots.
+    :param processes: int, the amount of the processes. None means the
+                      amount of the CPUs.
+    :param filename: str, the book file. None means the file next to this
+                     program.
+    :return: dict, the amount of the states of every level.
+    """
+    if filename is None:
+        filename = resource_path(OPENING_BOOK_FILE)
+    for level in LEVELS.keys():
+        uniform_layouts(level).count()
+    with Pool(processes) as pool:
+        books = pool.map(partial(opening_lines, depth=depth), LEVELS.keys())
+    with open(filename, "wb") as file:
+        file.write(Opening_book.MAGIC)
+        for level, book in zip(LEVELS.keys(), books):
+            keys = array("Q", sorted(book.keys()))
+            cells = bytes(book[key] for key in keys)
+            if sys.byteorder == "big":
+                keys.byteswap()
+            file.write(Opening_book.PART.pack(level.encode(), len(cells),
+                                              book_signature(level)))
+            file.write(keys.tobytes())
+            file.write(cells)
+    _opening_books.clear()
+    return {level: len(book) for level, book in zip(LEVELS.keys(), books)}
+
+# The opening books of every level.
+_opening_books = {}
+
+def opening_book(level):
+    """
+    Gets the opening book of the level. The file is read only when the book
+    is used for the first time.
+    :param level: str, the level of the game.
+    :return: Opening_book, the book of the level.
+    """
+    if level not in _opening_books.keys():
+        _opening_books[level] = Opening_book(level)
+    return _opening_books[level]
+
+
+#===== class Match ============================================================
+# This class is used to keep the rules of the game. The players shoot one by
+# one. The game can be over only after the last player has played the
+# round, so all players have the same amount of shots. The players, who have
+# found all of the heads, are the winners. If many players have found all
+# heads, the game is a draw between them. The game window and the terminal
+# game use the same rules. There can be MIN_PLAYERS to MAX_PLAYERS players,
+# and the amounts of the heads of the players are kept in a compact array.
+class Match:
+    """
+    One game between the players.
+    :param self.__level: str, the level of the game.
+    :param self.__boards: list, the gameboards (Gameboard) of the players.
+    :param self.__round: int, the amount of the shots of all players.
+    :param self.__heads_left: array, the amount of not found heads of every
+                              player.
+    :param self.__revealed: list, the clicked squares (Revealed_board) of
+                            every player.
+    :param self.__shots: list, the shots (list of cells) of every player.
+    :param self.__seed: int, the seed of the boards. None if unknown.
+    :param self.__started: float, the time (time.monotonic) of the start.
+    :param self.__duration: float, the seconds of the game. None if the game
+                            isn't over yet.
+    """
+    def __init__(self, level, boards, seed=None):
         """
-        Initializes the help window.
+        Starts a new game.
+        :param level: str, the level of the game.
+        :param boards: list, the gameboards of the players.
+        :param seed: int, the seed of the boards. None if unknown.
         """
-        # Creates the help window in another window.
-        self.__helpwindow = Toplevel()
-        self.__helpwindow.geometry("800x500+0+0")
-        self.__helpwindow.title("Help")
-        self.__helpwindow.iconbitmap("icon.ico")
-
-        # Fonts settings.
-        font_title = Font(family="Segoe print", size=20, weight="bold")
-        font_text = Font(family="Arial", size=14)
-        font_highlight = Font(family="Arial", size=17, slant="italic",
-                              weight="bold")
+        self.__level = level
+        self.__boards = boards
+        self.__round = 0
+        self.__heads_left = array("B", [LEVELS[level][1]] * len(boards))
+        self.__revealed = [Revealed_board(level) for board in boards]
+        self.__shots = [[] for board in boards]
+        self.__over = False
+        self.__seed = seed
+        self.__started = time.monotonic()
+        self.__duration = None
+
+    def get_turn(self):
+        """
+        Gets the player, who shoots next.
+        :return: int, the index of the player.
+        """
+        return self.__round % len(self.__boards)
 
-        # Images settings.
-        self.__image_1 = PhotoImage(file="help_1.gif")
-        self.__image_2 = PhotoImage(file="help_2.gif")
-        self.__image_3 = PhotoImage(file="help_3.gif")
-        self.__image_4 = PhotoImage(file="help_4.gif")
+    def get_round(self):
+        """
+        Gets the amount of the shots of all players.
+        :return: int, the round counter.
+        """
+        return self.__round
 
-        # Creates a frame
-        main_frame = Frame(self.__helpwindow)
-        main_frame.pack(fill=BOTH, expand=1)
+    def get_rounds_played(self):
+        """
+        Gets the amount of the rounds, which are started.
+        :return: int, the amount of the rounds.
+        """
+        players = len(self.__boards)
+        return (self.__round + players - 1) // players
 
-        # Creates a canvas
-        self.__canvas = Canvas(main_frame)
-        self.__canvas.pack(side=LEFT, fill=BOTH, expand=1)
+    def shoot(self, cell):
+        """
+        The player in turn shoots a square. After the shot the next player
+        is in turn.
+        :param cell: int, the cell number of the square.
+        :return: int, BLANKSPACE, PLANEBODY or PLANEHEAD. None if the square
+                 is already clicked or the game is over.
+        """
+        player = self.get_turn()
+        if self.__over or cell in self.__revealed[player].get_cells():
+            return None
+        result = self.__boards[player].get_board()[cell]
+        self.__shots[player].append(cell)
+        self.__revealed[player].reveal(cell, result)
+        if result == PLANEHEAD:
+            self.__heads_left[player] -= 1
+
+        # The game is checked only at the end of the round.
+        if player == len(self.__boards) - 1 and 0 in self.__heads_left:
+            self.__over = True
+            self.__duration = time.monotonic() - self.__started
+        self.__round += 1
+        return result
 
-        # add a scrollbar to the canvas
-        scrollbar = ttk.Scrollbar(main_frame, orient=VERTICAL,
-                              command=self.__canvas.yview)
-        scrollbar.pack(side=RIGHT, fill=Y)
+    def get_duration(self):
+        """
+        Gets the length of the game.
+        :return: float, the seconds from the start to the end of the game,
+                 or to now if the game isn't over yet.
+        """
+        if self.__duration is None:
+            return time.monotonic() - self.__started
+        return self.__duration
 
-        # configure the canvas
-        self.__canvas.configure(yscrollcommand=scrollbar.set)
-        self.__canvas.bind('<Configure>', lambda e: self.__canvas.configure(
-            scrollregion = self.__canvas.bbox("all")))
-        self.__canvas.bind_all('<MouseWheel>',self.__on_mouse_wheel)
+    def get_seed(self):
+        """
+        Gets the seed of the boards.
+        :return: int, the seed. None if unknown.
+        """
+        return self.__seed
 
-        # Creates a new frame inside the canvas to design all labels and button.
-        frame = Frame(self.__canvas)
+    def is_over(self):
+        """
+        Checks the game is over or not.
+        :return: bool, True: when the game is over.
+        """
+        return self.__over
 
-        # Adds the new frame to a window in the canvas.
-        self.__canvas.create_window((0,0), window=frame, anchor="nw")
+    def get_winner(self):
+        """
+        Gets the winner of the game.
+        :return: int, the index of the winner. None if the game is a draw or
+                 it isn't over.
+        """
+        winners = self.get_winners()
+        if len(winners) != 1:
+            return None
+        return winners[0]
 
-        # Designs the labels and button.
-        label_1 = Label(frame, font=font_title, fg="#3D27FF", bg="#CBFFF6",
-                        text="Welcome to play 'Aircraft Head Hunting' Game!")
-        label_2 = Label(frame, font=font_text, text="Players: 2")
-        label_3 = Label(frame, font=font_text,
-                        text="Average time: 5-15 min.\n")
-        label_4 = Label(frame, font=font_highlight, fg="#FF7F27", bg="#FFE1EA",
-                        text="How to play?")
-        label_5 = Label(frame, font=font_text,
-                        text="1. Choose the level (default level is EASY) "
-                             "and take a New Game.")
-        label_6 = Label(frame, image=self.__image_1, relief=RIDGE)
-        label_7 = Label(frame, image=self.__image_2, relief=RIDGE)
-        label_8 = Label(frame, font=font_text,
-                        text="2. Press the \"Start Game\".")
-        label_9 = Label(frame, font=font_text, fg="#FF7F27",
-                        text="3. On your turn!")
-        label_10 = Label(frame, font=font_text, wraplength=750, justify=LEFT,
-                         text="  Click a square on your board: \n"
-                              "      If the square is the head of an aircraft,"
-                              " it will turn to red color. \n"
-                              "      If the square is the body of an aircraft,"
-                              " it will turn to blue color. \n"
-                              "      If the square isn't the head neither the "
-                              "body of an aircraft, it will turn to white.")
-        label_11 = Label(frame, font=font_text,
-                         text="4. Play the game in turn. In one round, each of "
-                              "you can click square once.")
-        label_12 = Label(frame, image=self.__image_3, relief=RIDGE)
-        label_13 = Label(frame, image=self.__image_4, relief=RIDGE)
-        label_14 = Label(frame, font=font_highlight, fg="#FF7F27", bg="#FFE1EA",
-                         text="How to win?")
-        label_15 = Label(frame, font=font_text,
-                         text="Find the aircraft head as fast as possible!\n")
-        label_16 = Label(frame, font=font_title, fg="#0ED145",
-                         text="Good luck! Enjoy the game!")
-        # This button is used to close the help window.
-        helpCloseButton = Button(frame, text="Close", bg="#FDF395",
-                                 command=self.close_help,
-                                 font=("Arial", 14, "bold"))
+    def get_winners(self):
+        """
+        Gets all players, who have found all heads, when the game is over.
+        :return: list, the indexes of the winners. Empty if the game isn't
+                 over.
+        """
+        if not self.__over:
+            return []
+        return [player for player, heads in enumerate(self.__heads_left)
+                if heads == 0]
 
-        # Sets the layout about all widgets.
-        label_1.grid(row=0, column=0, columnspan=2)
-        label_2.grid(row=1, column=0, columnspan=2, sticky=W)
-        label_3.grid(row=2, column=0, columnspan=2, sticky=W)
-        label_14.grid(row=3, column=0, columnspan=2, sticky=W)
-        label_15.grid(row=4, column=0, columnspan=2, sticky=W)
-        label_4.grid(row=5, column=0, columnspan=2, sticky=W)
-        label_5.grid(row=6, column=0, columnspan=2, sticky=W)
-        label_6.grid(row=7, column=0)
-        label_7.grid(row=7, column=1)
-        label_8.grid(row=8, column=0, columnspan=2, sticky=W)
-        label_9.grid(row=9, column=0, columnspan=2, sticky=W)
-        label_10.grid(row=10, column=0, columnspan=2, sticky=W)
-        label_11.grid(row=11, column=0, columnspan=2, sticky=W)
-        label_12.grid(row=12, column=0, columnspan=2)
-        label_13.grid(row=13, column=0, columnspan=2)
-        label_16.grid(row=14, column=0)
-        helpCloseButton.grid(row=14, column=1)
+    def get_heads_left(self, player):
+        """
+        Gets the amount of the heads, which the player hasn't found.
+        :param player: int, the index of the player.
+        :return: int, the amount of the heads.
+        """
+        return self.__heads_left[player]
 
-    def __on_mouse_wheel(self, event):
+    def get_all_heads_left(self):
         """
-        This method is used to scroll the canvas by mouse wheel.
-        :param event: a tkinter event about mouse wheel.
+        Gets the amounts of the heads, which the players haven't found.
+        :return: array, the amount of the heads of every player. It must not
+                 be changed.
         """
-        self.__canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+        return self.__heads_left
 
-    def start(self):
+    def get_revealed(self, player):
         """
-        Starts a new help window mainloop when the user clicks the
-        help-command. In the help window, there is game instruction to help
-        new player enjoys the game.
+        Gets the clicked squares of the player.
+        :param player: int, the index of the player.
+        :return: Revealed_board, the clicked squares.
         """
-        self.__helpwindow.mainloop()
+        return self.__revealed[player]
 
-    def close_help(self):
+    def get_level(self):
         """
-        Closes the help window.
+        Gets the level of the game.
+        :return: str, the level of the game.
         """
-        self.__helpwindow.destroy()
+        return self.__level
 
+    def get_players(self):
+        """
+        Gets the amount of the players.
+        :return: int, the amount of the players.
+        """
+        return len(self.__boards)
+
+    def get_record(self):
+        """
+        Gets the game in the archive format.
+        :return: dict, the game information.
+        """
+        winner = self.get_winner()
+        players = []
+        for player, board in enumerate(self.__boards):
+            heads, bodies = board.get_cells()
+            players.append({"heads": heads, "bodies": bodies,
+                            "shots": self.__shots[player]})
+        return {"level": self.__level,
+                "rounds": self.get_rounds_played(),
+                "winner": None if winner is None else winner + 1,
+                "players": players}
+
+
+#===== Player strategies ======================================================
+# A strategy is a player, which chooses the next shot from the clicked squares
+# of its own gameboard. The computer player of the game window and the
+# tournament use the same strategies. The strategies of this file are always
+# available by their names (BUILTIN_STRATEGIES). The other strategies are
+# found by a module path ("module:Class") or by the name of an installed
+# entry point in the group STRATEGY_GROUP. The module of a strategy is
+# imported only when the strategy is chosen, so a heavy solver doesn't slow
+# down the start of the game.
+#
+# Any class with the same methods can be a strategy, it doesn't need to
+# inherit Strategy. A subclass must have its own next_shot. A strategy may
+# also have the method observe(cell, result), which is called after every
+# own shot. The methods are called
+# millions of times in a tournament, so the clicked squares are given as the
+# Revealed_board of the game without copying, and observe is called only if
+# the strategy has it.
+class Strategy(ABC):
+    """
+    The base class of the strategies.
+    :param self.__level: str, the level of the game.
+    """
+    def __init__(self, level):
+        """
+        Initializes the strategy.
+        :param level: str, the level of the game.
+        """
+        self.__level = level
+
+    def get_level(self):
+        """
+        Gets the level of the game.
+        :return: str, the level of the game.
+        """
+        return self.__level
+
+    def new_game(self):
+        """
+        This is called before the first shot of every game.
+        """
+        None
+
+    @abstractmethod
+    def next_shot(self, revealed):
+        """
+        Chooses the next shot.
+        :param revealed: Revealed_board, the clicked squares. It must not be
+                         changed.
+        :return: int, the cell number of a square, which isn't clicked yet.
+                 None if all of the squares are clicked.
+        """
+
+class Random_strategy(Strategy):
+    """
+    Shoots the squares in a random order.
+    :param self.__rng: random.Random, the random generator.
+    :param self.__cells: list, the cells in the order of the shots.
+    :param self.__next: int, the index of the next shot in the order.
+    """
+    def __init__(self, level, seed=None):
+        """
+        Initializes the strategy.
+        :param level: str, the level of the game.
+        :param seed: int, the seed of the random generator.
+        """
+        super().__init__(level)
+        size = LEVELS[level][0]
+        self.__rng = random.Random(seed)
+        self.__cells = list(range(size * size))
+        self.__next = 0
+
+    def new_game(self):
+        """
+        Chooses a new order of the shots.
+        """
+        self.__rng.shuffle(self.__cells)
+        self.__next = 0
+
+    def next_shot(self, revealed):
+        """
+        Chooses the next square of the order, which isn't clicked yet.
+        :param revealed: Revealed_board, the clicked squares.
+        :return: int, the cell number. None if all squares are clicked.
+        """
+        clicked = revealed.get_cells()
+        while self.__next < len(self.__cells):
+            cell = self.__cells[self.__next]
+            self.__next += 1
+            if cell not in clicked:
+                return cell
+        return None
+
+class Hint_strategy(Strategy):
+    """
+    Always shoots the square of the hint.
+    :param self.__engine: Hint_engine, the hint engine of the level.
+    :param self.__time_limit: float, the longest time of the exact search
+                              (seconds). None if it isn't stopped.
+    """
+    def __init__(self, level, time_limit=ENDGAME_TIME):
+        """
+        Initializes the strategy.
+        :param level: str, the level of the game.
+        :param time_limit: float, the longest time of the exact search
+                           (seconds). None if it isn't stopped.
+        """
+        super().__init__(level)
+        self.__engine = hint_engine(level)
+        self.__time_limit = time_limit
+
+    def next_shot(self, revealed):
+        """
+        Asks the best square from the hint engine.
+        :param revealed: Revealed_board, the clicked squares.
+        :return: int, the cell number. None if all squares are clicked.
+        """
+        return self.__engine.best_cell(revealed, self.__time_limit)
+
+# The strategies, which are always available.
+BUILTIN_STRATEGIES = {"random": Random_strategy, "hint": Hint_strategy}
+
+# The loaded strategy classes by the name.
+_strategy_classes = {}
+
+def load_strategy(name):
+    """
+    Finds the class of a strategy and imports its module, if it isn't
+    imported yet.
+    :param name: str, the name of a built-in strategy or an entry point, or
+                 a module path ("module:Class").
+    :return: class, the strategy class.
+    """
+    if name in _strategy_classes.keys():
+        return _strategy_classes[name]
+    if name in BUILTIN_STRATEGIES.keys():
+        strategy = BUILTIN_STRATEGIES[name]
+    elif ":" in name:
+        module_name, _, attribute = name.partition(":")
+        try:
+            strategy = importlib.import_module(module_name)
+            for part in attribute.split("."):
+                strategy = getattr(strategy, part)
+        except (ImportError, AttributeError) as error:
+            raise ValueError(f"The strategy {name} cannot be loaded: "
+                             f"{error}")
+    else:
+        entry_points = [entry_point
+                        for entry_point in installed_strategies()
+                        if entry_point.name == name]
+        if not entry_points:
+            raise ValueError(f"There is no strategy {name}. The strategies "
+                             f"are: {', '.join(strategy_names())} or "
+                             f"module:Class.")
+        strategy = entry_points[0].load()
+    if not callable(getattr(strategy, "next_shot", None)):
+        raise ValueError(f"{name} isn't a strategy: it hasn't next_shot.")
+    _strategy_classes[name] = strategy
+    return strategy
+
+def installed_strategies():
+    """
+    Finds the entry points of the installed strategies. The strategies
+    aren't imported.
+    :return: list, the entry points (importlib.metadata.EntryPoint).
+    """
+    # The metadata is imported only here, because it is slow to import.
+    from importlib.metadata import entry_points
+    return list(entry_points(group=STRATEGY_GROUP))
+
+def strategy_names():
+    """
+    Gets the names of the built-in and the installed strategies.
+    :return: list, the names.
+    """
+    return list(BUILTIN_STRATEGIES.keys()) + sorted(
+        entry_point.name for entry_point in installed_strategies())
+
+def play_board(strategy, board, level):
+    """
+    Lets the strategy play one gameboard alone until it has found all heads.
+    :param strategy: the strategy (see Strategy).
+    :param board: Gameboard, the board.
+    :param level: str, the level of the game.
+    :return: int, the amount of the shots.
+    """
+    squares = board.get_board()
+    area = len(squares)
+    heads_left = squares.count(PLANEHEAD)
+    revealed = Revealed_board(level)
+    clicked = revealed.get_cells()
+    next_shot = strategy.next_shot
+    observe = getattr(strategy, "observe", None)
+    strategy.new_game()
+    while heads_left > 0:
+        cell = next_shot(revealed)
+        if cell is None or cell in clicked or not 0 <= cell < area:
+            raise ValueError(f"The strategy {type(strategy).__name__} shot "
+                             f"an invalid square: {cell}")
+        result = squares[cell]
+        revealed.reveal(cell, result)
+        if observe is not None:
+            observe(cell, result)
+        if result == PLANEHEAD:
+            heads_left -= 1
+    return len(clicked)
+
+
+#===== class Tournament =======================================================
+# This class is used to compare the strategies. Every strategy plays the same
+# random gameboards alone, and the games are played in parallel processes.
+# The boards are chosen without the counts of the layouts (see
+# Uniform_layouts.sample_rejected), because they would be slower to choose
+# than to play.
+# Two strategies play a game against each other, when they play the same
+# board, so the strategy with fewer shots wins the game. The same amount of
+# shots is a draw like in the real game, where both players have the same
+# amount of shots.
+class Tournament:
+    """
+    The games of the strategies.
+    :param self.__level: str, the level of the game.
+    :param self.__names: list, the names of the strategies.
+    :param self.__shots: list, the shots of every game of every strategy.
+    :param self.__seconds: float, the time of the games.
+    """
+    # The amount of the games in one task of a process.
+    CHUNK = 100
+
+    def __init__(self, level, names):
+        """
+        Initializes the tournament. The strategies are loaded here, so the
+        wrong names are found before the games.
+        :param level: str, the level of the game.
+        :param names: list, the names of the strategies.
+        """
+        for name in names:
+            load_strategy(name)
+        self.__level = level
+        self.__names = list(names)
+        self.__shots = [[] for name in names]
+        self.__seconds = 0.0
+
+    def play(self, games, seed=None, processes=None):
+        """
+        Plays new games.
+        :param games: int, the amount of the games.
+        :param seed: int, the seed of the gameboards. None chooses a random
+                     seed.
+        :param processes: int, the amount of the processes. None means the
+                          amount of the CPUs.
+        """
+        if seed is None:
+            seed = random.getrandbits(32)
+        started = time.perf_counter()
+        with Pool(processes) as pool:
+            chunks = pool.map(
+                partial(_tournament_games, self.__level, self.__names, seed,
+                        games), range(0, games, self.CHUNK))
+        self.__seconds += time.perf_counter() - started
+        for chunk in chunks:
+            for player, shots in enumerate(chunk):
+                self.__shots[player].extend(shots)
+
+    def get_shots(self, name):
+        """
+        Gets the shots of every game of the strategy.
+        :param name: str, the name of the strategy.
+        :return: list, the amount of the shots of every game.
+        """
+        return self.__shots[self.__names.index(name)]
+
+    def report(self):
+        """
+        Makes the report of the tournament.
+        :return: str, the averages of the shots, the results of every pair
+                 of the strategies and the speed of the games.
+        """
+        games = len(self.__shots[0]) if self.__shots else 0
+        lines = [f"Tournament on {self.__level}: {games} games"]
+        if games == 0:
+            return lines[0]
+        width = max(len(name) for name in self.__names)
+        for name, shots in zip(self.__names, self.__shots):
+            ordered = sorted(shots)
+            lines.append(f"  {name:<{width}}  {sum(shots) / games:6.2f} "
+                         f"shots on average, median {ordered[games // 2]}, "
+                         f"best {ordered[0]}, worst {ordered[-1]}")
+        for first in range(len(self.__names)):
+            for second in range(first + 1, len(self.__names)):
+                pairs = list(zip(self.__shots[first], self.__shots[second]))
+                wins = sum(1 for a, b in pairs if a < b)
+                draws = sum(1 for a, b in pairs if a == b)
+                lines.append(f"  {self.__names[first]} vs "
+                             f"{self.__names[second]}: {wins} wins, "
+                             f"{draws} draws, {games - wins - draws} losses")
+        moves = sum(sum(shots) for shots in self.__shots)
+        lines.append(f"  {moves} moves in {self.__seconds:.2f} s "
+                     f"({moves / max(self.__seconds, 1e-9):,.0f} moves/s)")
+        return "\n".join(lines)
+
+def _tournament_games(level, names, seed, games, first):
+    """
+    Plays one chunk of the tournament games in a process.
+    :param level: str, the level of the game.
+    :param names: list, the names of the strategies.
+    :param seed: int, the seed of the gameboards.
+    :param games: int, the amount of all games.
+    :param first: int, the number of the first game of the chunk.
+    :return: list, the shots of every game of every strategy.
+    """
+    strategies = [load_strategy(name)(level) for name in names]
+    shots = [[] for name in names]
+    layouts = uniform_layouts(level)
+    for game in range(first, min(games, first + Tournament.CHUNK)):
+        board = layout_board(level, layouts.sample_rejected(
+            random.Random(board_seed(seed, game))))
+        for player, strategy in enumerate(strategies):
+            shots[player].append(play_board(strategy, board, level))
+    return shots
+
+
+#===== class Render_scheduler =================================================
+# This class is used to show the changes of the widgets. One click changes
+# many labels and buttons, so the changes are only recorded first and all of
+# them are configured together, when Tk is idle. If a widget already has the
+# same option value (for example the same emoji image), it isn't configured
+# again.
+class Render_scheduler:
+    """
+    Collects the changes of the widgets.
+    :param self.__window: Tk, the main window.
+    :param self.__dirty: dict, the changed options of every changed widget.
+    :param self.__shown: dict, the configured options of every widget.
+    :param self.__scheduled: bool, True if the flush is already waiting.
+    """
+    def __init__(self, window):
+        """
+        Initializes the scheduler.
+        :param window: Tk, the main window.
+        """
+        self.__window = window
+        self.__dirty = {}
+        self.__shown = {}
+        self.__scheduled = False
+
+    def set(self, widget, **options):
+        """
+        Records the new options of a widget. The widget is configured in the
+        next flush.
+        :param widget: Widget, the changed widget.
+        :param options: the new options of the widget.
+        """
+        self.__dirty.setdefault(widget, {}).update(options)
+        if not self.__scheduled:
+            self.__scheduled = True
+            self.__window.after_idle(self.flush)
+
+    def flush(self):
+        """
+        Configures all changed widgets. The options, which are the same as
+        the shown ones, are skipped.
+        """
+        dirty = self.__dirty
+        self.__dirty = {}
+        self.__scheduled = False
+        for widget, options in dirty.items():
+            shown = self.__shown.setdefault(widget, {})
+            changed = {}
+            for option, value in options.items():
+                if option not in shown.keys() or shown[option] != value:
+                    changed[option] = value
+            if changed:
+                widget.configure(**changed)
+                shown.update(changed)
+
+    def reset(self):
+        """
+        Forgets all widgets. This is used, when the widgets are destroyed.
+        """
+        self.__dirty = {}
+        self.__shown = {}
+
+
+#===== class Ai_worker ========================================================
+# This class is used to find the moves of the computer and the hints in
+# another process, so the game window never waits for them. A request gets a
+# ticket, and the answer is given to the callback of the ticket, when the
+# game window checks the answers (poll) with after(). A cancelled request is
+# not searched at all, if the worker hasn't started it yet, and its answer
+# is never given. The search has a time limit, and after it the best square
+# found so far is the answer.
+class Ai_worker:
+    """
+    The worker process of the moves.
+    :param self.__requests: Queue, the requests to the worker process.
+    :param self.__answers: Queue, the answers from the worker process.
+    :param self.__process: Process, the worker process.
+    :param self.__callbacks: dict, the callbacks of the requests, which
+                             aren't answered yet, by the ticket.
+    :param self.__tickets: int, the last ticket.
+    """
+    def __init__(self):
+        """
+        Starts the worker process.
+        """
+        self.__requests = Queue()
+        self.__answers = Queue()
+        self.__process = Process(target=_ai_worker_main,
+                                 args=(self.__requests, self.__answers),
+                                 daemon=True)
+        self.__process.start()
+        self.__callbacks = {}
+        self.__tickets = 0
+
+    def ask(self, level, revealed, callback, time_limit=ENDGAME_TIME,
+            strategy=None, game=None):
+        """
+        Asks the best next square.
+        :param level: str, the level of the game.
+        :param revealed: Revealed_board, the clicked squares.
+        :param callback: function, which is called with the cell number of
+                         the square (None if every square is clicked).
+        :param time_limit: float, the longest time of the search (seconds).
+        :param strategy: str, the name of the strategy, which chooses the
+                         square. None means the hint engine.
+        :param game: hashable, the match and the player of the request. The
+                     worker keeps the strategy of every game, so it sees only
+                     the new shots. None starts the strategy again with all
+                     shots.
+        :return: int, the ticket of the request.
+        """
+        self.__tickets += 1
+        self.__callbacks[self.__tickets] = callback
+        self.__requests.put(("move", self.__tickets, level,
+                             dict(revealed.get_cells()), time_limit,
+                             strategy, game))
+        return self.__tickets
+
+    def cancel(self, ticket):
+        """
+        Cancels a request. Nothing happens, if it is already answered.
+        :param ticket: int, the ticket of the request.
+        """
+        if self.__callbacks.pop(ticket, None) is not None:
+            self.__requests.put(("cancel", ticket))
+
+    def poll(self):
+        """
+        Gives the ready answers to their callbacks. This is called in the
+        game window with after().
+        """
+        while True:
+            try:
+                ticket, cell = self.__answers.get_nowait()
+            except Empty:
+                return
+            callback = self.__callbacks.pop(ticket, None)
+            if callback is not None:
+                callback(cell)
+
+    def close(self):
+        """
+        Stops the worker process.
+        """
+        self.__callbacks.clear()
+        self.__requests.put(None)
+        self.__process.join(timeout=1)
+        if self.__process.is_alive():
+            self.__process.terminate()
+            self.__process.join()
+        self.__requests.close()
+        self.__answers.close()
+
+
+def _ai_worker_main(requests, answers):
+    """
+    Answers the requests in the worker process. All waiting messages are read
+    before the next search, so the cancelled requests are left out. The
+    strategy of every game is kept from move to move with its own clicked
+    squares, and it sees only the shots after its last move. A game, which
+    isn't kept or which has fewer shots than before (a new match), starts
+    the strategy again.
+    :param requests: Queue, the requests.
+    :param answers: Queue, the answers.
+    """
+    waiting = []
+    # The strategy, the clicked squares and the amount of the seen shots of
+    # every game, the least recently used first.
+    games = OrderedDict()
+    while True:
+        messages = [] if waiting else [requests.get()]
+        try:
+            while True:
+                messages.append(requests.get_nowait())
+        except Empty:
+            None
+        cancelled = set()
+        for message in messages:
+            if message is None:
+                return
+            if message[0] == "cancel":
+                cancelled.add(message[1])
+            else:
+                waiting.append(message)
+        waiting = [request for request in waiting
+                   if request[1] not in cancelled]
+        if waiting:
+            kind, ticket, level, cells, time_limit, name, game = \
+                waiting.pop(0)
+            if name is None:
+                revealed = Revealed_board(level)
+                for cell, result in cells.items():
+                    revealed.reveal(cell, result)
+                answers.put((ticket, hint_engine(level).best_cell(
+                    revealed, time_limit)))
+                continue
+            key = (name, level, game)
+            state = games.pop(key, None)
+            if state is None:
+                state = (load_strategy(name)(level), None, 0)
+            strategy, revealed, seen = state
+            if game is None or revealed is None or len(cells) < seen:
+                strategy.new_game()
+                revealed = Revealed_board(level)
+                seen = 0
+            observe = getattr(strategy, "observe", None)
+            for cell, result in islice(cells.items(), seen, None):
+                revealed.reveal(cell, result)
+                if observe is not None:
+                    observe(cell, result)
+            games[key] = (strategy, revealed, len(cells))
+            if len(games) > AI_GAMES:
+                games.popitem(last=False)
+            answers.put((ticket, strategy.next_shot(revealed)))
+
+
+#===== class Image_atlas ======================================================
+# This class is used to read the pictures of the game from one file. The
+# small pictures are packed into one sprite sheet, which is decoded once, and
+# every picture is copied from the sheet when it is used for the first time.
+# The big help pictures are saved as they are, and they are read and decoded
+# only when the help window is opened. The file is made with --build-atlas
+# from the picture files. If there is no atlas file, the picture files are
+# used. The files are always next to this program, so the game can be
+# started from any directory.
+#
+# The file begins with MAGIC and the length of the index. The index is JSON:
+# the places of the small pictures in the sheet and the places of the saved
+# pictures (the sheet is one of them) in the rest of the file.
+class Image_atlas:
+    """
+    The pictures of the game in one file.
+    :param self.__filename: str, the atlas file.
+    :param self.__sprites: dict, the place (x, y, width, height) of every
+                           small picture in the sheet.
+    :param self.__blobs: dict, the place (offset, length) of every saved
+                         picture in the file.
+    """
+    MAGIC = b"AHHI"
+    HEADER = struct.Struct("<4sI")
+    # The name of the sprite sheet in the file.
+    SHEET = "sheet.png"
+
+    def __init__(self, filename=None):
+        """
+        Initializes the atlas. The file is read when a picture is needed.
+        :param filename: str, the atlas file. None means the file next to
+                         this program.
+        """
+        if filename is None:
+            filename = resource_path(IMAGE_ATLAS_FILE)
+        self.__filename = filename
+        self.__sprites = None
+        self.__blobs = None
+
+    def __load(self):
+        """
+        Reads the index of the file. Without a valid file, the atlas is
+        empty.
+        * This is a private method.
+        """
+        if self.__sprites is not None:
+            return
+        self.__sprites = {}
+        self.__blobs = {}
+        try:
+            with open(self.__filename, "rb") as file:
+                magic, length = self.HEADER.unpack(
+                    file.read(self.HEADER.size))
+                if magic != self.MAGIC:
+                    return
+                index = json.loads(file.read(length).decode())
+        except (OSError, ValueError, struct.error):
+            return
+        start = self.HEADER.size + length
+        self.__sprites = index["sprites"]
+        self.__blobs = {name: (start + offset, size)
+                        for name, (offset, size) in index["blobs"].items()}
+
+    def get_sprite(self, name):
+        """
+        Gets the place of a small picture in the sprite sheet.
+        :param name: str, the file name of the picture.
+        :return: list, x, y, width and height. None if the picture isn't in
+                 the sheet.
+        """
+        self.__load()
+        return self.__sprites.get(name)
+
+    def get_blob(self, name):
+        """
+        Reads a saved picture.
+        :param name: str, the file name of the picture.
+        :return: bytes, the picture file. None if it isn't in the atlas.
+        """
+        self.__load()
+        if name not in self.__blobs.keys():
+            return None
+        offset, length = self.__blobs[name]
+        try:
+            with open(self.__filename, "rb") as file:
+                file.seek(offset)
+                blob = file.read(length)
+        except OSError:
+            return None
+        return blob if len(blob) == length else None
+
+def resource_path(filename):
+    """
+    Gets the path of a file, which is next to this program.
+    :param filename: str, the name of the file.
+    :return: str, the path of the file.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        filename)
+
+# The atlas of the pictures.
+_image_atlas = []
+
+def image_atlas():
+    """
+    Gets the atlas of the pictures. The index is read only once.
+    :return: Image_atlas, the atlas.
+    """
+    if not _image_atlas:
+        _image_atlas.append(Image_atlas())
+    return _image_atlas[0]
+
+def build_image_atlas(filename=None):
+    """
+    Makes the atlas file from the picture files. The sprite sheet is drawn
+    and saved by Tk, so this needs a display (or Xvfb).
+    :param filename: str, the atlas file. None means the file next to this
+                     program.
+    :return: int, the size of the atlas file (bytes).
+    """
+    if filename is None:
+        filename = resource_path(IMAGE_ATLAS_FILE)
+    display = start_virtual_display()
+    try:
+        root = Tk()
+        root.withdraw()
+        sprites = [PhotoImage(master=root, file=resource_path(name))
+                   for name in SPRITE_FILES]
+        # Packs the pictures into rows (shelves) from the highest to the
+        # lowest one.
+        places = {}
+        x = y = row_height = width = 0
+        for name, sprite in sorted(zip(SPRITE_FILES, sprites),
+                                   key=lambda item: -item[1].height()):
+            if x > 0 and x + sprite.width() > ATLAS_WIDTH:
+                x = 0
+                y += row_height
+                row_height = 0
+            places[name] = [x, y, sprite.width(), sprite.height()]
+            x += sprite.width()
+            width = max(width, x)
+            row_height = max(row_height, sprite.height())
+        sheet = PhotoImage(master=root, width=width, height=y + row_height)
+        for name, sprite in zip(SPRITE_FILES, sprites):
+            sheet.tk.call(sheet, "copy", sprite, "-to",
+                          places[name][0], places[name][1])
+        sheet_file = filename + ".png"
+        sheet.write(sheet_file, format="png")
+        root.destroy()
+    finally:
+        if display is not None:
+            display.terminate()
+
+    blobs = []
+    with open(sheet_file, "rb") as file:
+        blobs.append((Image_atlas.SHEET, file.read()))
+    os.remove(sheet_file)
+    for name in LAZY_IMAGE_FILES:
+        with open(resource_path(name), "rb") as file:
+            blobs.append((name, file.read()))
+    index = {"sprites": places, "blobs": {}}
+    offset = 0
+    for name, blob in blobs:
+        index["blobs"][name] = [offset, len(blob)]
+        offset += len(blob)
+    index = json.dumps(index, separators=(",", ":")).encode()
+    with open(filename, "wb") as file:
+        file.write(Image_atlas.HEADER.pack(Image_atlas.MAGIC, len(index)))
+        file.write(index)
+        for name, blob in blobs:
+            file.write(blob)
+    _image_atlas.clear()
+    return Image_atlas.HEADER.size + len(index) + offset
+
+
+#===== class Session_manager ==================================================
+# This class is used to run many games (tables) in one program, for example
+# on a kiosk. Every game is in its own window, but all of the windows are
+# under the same hidden Tk root. The pictures and the fonts are created only
+# once, and one small pool of processes creates the boards of every table,
+# so a new table costs only its own widgets. The moves of the computer and
+# the hints of every table are searched by one worker process.
+#
+# The manager has also an asyncio loop, which runs inside the Tk mainloop:
+# every ASYNC_INTERVAL ms the loop runs the ready coroutines until there is
+# nothing to do or ASYNC_BUDGET ms is used. So background work (for example
+# the answers of the worker process and the boards of the next game) can be
+# written as coroutines without threads. The coroutines must not block, the
+# slow work is done in the processes and awaited.
+class Session_manager:
+    """
+    The shared resources of the game windows.
+    :param self.__root: Tk, the hidden root window.
+    :param self.__pool: multiprocessing.Pool, the board creating processes.
+    :param self.__loop: asyncio.AbstractEventLoop, the loop of the
+                        coroutines.
+    :param self.__prefetched: dict, the seed and the job (AsyncResult),
+                              which creates the boards of the next game, by
+                              the level, the difficulty and the amount of
+                              the players.
+    :param self.__ai: Ai_worker, the worker process of the moves.
+    :param self.__images: dict, the pictures (PhotoImage) by the file name.
+    :param self.__fonts: dict, the fonts (Font) by the use.
+    :param self.__sessions: list, the open games (Find_Aircraft_Head_Game).
+    """
+    def __init__(self, processes=BOARD_WORKERS):
+        """
+        Starts the board creating processes and creates the root window.
+        :param processes: int, the amount of the board creating processes.
+        """
+        # The layouts of every level are counted first, so the processes get
+        # the counts. They can't count them, if the counts can't be saved,
+        # because the pool processes can't start processes of their own.
+        for level in LEVELS.keys():
+            uniform_layouts(level).count()
+        # The processes are started before Tk, so they don't get a copy of
+        # the windows.
+        self.__processes = processes
+        self.__pool = Pool(processes)
+        self.__ai = Ai_worker()
+        self.__root = Tk()
+        self.__root.withdraw()
+        self.__loop = asyncio.new_event_loop()
+        self.__prefetched = {}
+        self.__ticking = self.__root.after(ASYNC_INTERVAL, self.__tick)
+        self.spawn(self.__poll())
+        self.__images = {}
+        self.__fonts = {"start": Font(size=16),
+                        "label": Font(size=12),
+                        "turn": Font(size=13, weight="bold")}
+        self.__sessions = []
+
+    def new_session(self, level, broadcast=None, difficulty=None,
+                    computer=False, strategy=None, players=2):
+        """
+        Opens a new game window.
+        :param level: str, the level of the game.
+        :param broadcast: int, the port of the spectator broadcast. None if
+                          the game isn't broadcasted.
+        :param difficulty: tuple, the smallest and the biggest difficulty of
+                           the boards on the given level. EXPERT chooses the
+                           expert boards and None any board.
+        :param computer: bool, True: the computer plays all players except
+                         the player 1.
+        :param strategy: str, the name of the computer's strategy. None
+                         means the hint engine.
+        :param players: int, the amount of the players.
+        :return: Find_Aircraft_Head_Game, the new game.
+        """
+        return Find_Aircraft_Head_Game(level, broadcast, difficulty, self,
+                                       computer, strategy=strategy,
+                                       players=players)
+
+    def __tick(self):
+        """
+        Runs the ready coroutines of the asyncio loop. The loop is run one
+        step at a time, at most ASYNC_STEPS steps or until the budget is
+        used. A step without any ready callbacks returns at once.
+        * This is a private method.
+        """
+        deadline = time.perf_counter() + ASYNC_BUDGET / 1000
+        for step in range(ASYNC_STEPS):
+            self.__loop.call_soon(self.__loop.stop)
+            self.__loop.run_forever()
+            if time.perf_counter() >= deadline:
+                break
+        self.__ticking = self.__root.after(ASYNC_INTERVAL, self.__tick)
+
+    def spawn(self, coroutine):
+        """
+        Runs a coroutine in the asyncio loop of the game windows.
+        :param coroutine: coroutine, the background work.
+        :return: asyncio.Task, the task of the coroutine.
+        """
+        return self.__loop.create_task(coroutine)
+
+    def get_loop(self):
+        """
+        Gets the asyncio loop of the game windows.
+        :return: asyncio.AbstractEventLoop, the loop.
+        """
+        return self.__loop
+
+    async def __poll(self):
+        """
+        Gives the answers of the worker process to the game windows.
+        * This is a private method.
+        """
+        while True:
+            self.__ai.poll()
+            await asyncio.sleep(AI_POLL_INTERVAL / 1000)
+
+    def get_ai(self):
+        """
+        Gets the worker process of the moves.
+        :return: Ai_worker, the worker.
+        """
+        return self.__ai
+
+    def add_session(self, session):
+        """
+        Records a new game window. This is called by the game window.
+        :param session: Find_Aircraft_Head_Game, the game.
+        :return: int, the amount of the open games before this one.
+        """
+        self.__sessions.append(session)
+        return len(self.__sessions) - 1
+
+    def close_session(self, session):
+        """
+        Forgets a closed game window. When the last one is closed, the
+        manager is closed too.
+        :param session: Find_Aircraft_Head_Game, the game.
+        """
+        if session in self.__sessions:
+            self.__sessions.remove(session)
+        if not self.__sessions:
+            self.close()
+
+    def get_sessions(self):
+        """
+        Gets the open game windows.
+        :return: list, the games (Find_Aircraft_Head_Game).
+        """
+        return self.__sessions
+
+    def get_root(self):
+        """
+        Gets the root window.
+        :return: Tk, the hidden root window.
+        """
+        return self.__root
+
+    def get_fonts(self):
+        """
+        Gets the fonts of the game windows.
+        :return: dict, the fonts by the use.
+        """
+        return self.__fonts
+
+    def image(self, filename):
+        """
+        Gets a picture. Every picture is loaded only once, from the atlas
+        if it is there and otherwise from its own file.
+        :param filename: str, the picture file.
+        :return: PhotoImage, the picture.
+        """
+        if filename not in self.__images.keys():
+            self.__images[filename] = self.__load_image(filename)
+        return self.__images[filename]
+
+    def __load_image(self, filename):
+        """
+        Decodes a picture. A small picture is copied from the sprite sheet,
+        which is decoded only once.
+        * This is a private method.
+        :param filename: str, the picture file.
+        :return: PhotoImage, the picture.
+        """
+        atlas = image_atlas()
+        place = atlas.get_sprite(filename)
+        if place is not None:
+            sheet = self.image(Image_atlas.SHEET)
+            x, y, width, height = place
+            sprite = PhotoImage(master=self.__root, width=width,
+                                height=height)
+            sprite.tk.call(sprite, "copy", sheet, "-from", x, y,
+                           x + width, y + height)
+            return sprite
+        blob = atlas.get_blob(filename)
+        if blob is not None:
+            return PhotoImage(master=self.__root,
+                              data=base64.b64encode(blob).decode(),
+                              format=os.path.splitext(filename)[1][1:])
+        return PhotoImage(master=self.__root, file=resource_path(filename))
+
+    def create_boards(self, level, difficulty=None, seed=None, players=2):
+        """
+        Creates the boards of a new game in the board creating processes.
+        :param level: str, the level of the game.
+        :param difficulty: tuple, the smallest and the biggest difficulty.
+                           None if any board is ok.
+        :param seed: int, the seed of the game. None for random boards.
+        :param players: int, the amount of the boards.
+        :return: list, the boards (Gameboard). None if the processes didn't
+                 create them in time.
+        """
+        if seed is None:
+            seed = random.getrandbits(32)
+        return self.__wait_boards(
+            self.__start_boards(level, difficulty, seed, players))
+
+    def __start_boards(self, level, difficulty, seed, players):
+        """
+        Starts to create the boards of a game in the board creating
+        processes without waiting for them.
+        * This is a private method.
+        :param level: str, the level of the game.
+        :param difficulty: tuple, the smallest and the biggest difficulty.
+        :param seed: int, the seed of the game.
+        :param players: int, the amount of the boards.
+        :return: AsyncResult, the job of the boards.
+        """
+        return self.__pool.map_async(
+            partial(_pooled_board, level, difficulty),
+            [board_seed(seed, player) for player in range(players)])
+
+    def __wait_boards(self, job):
+        """
+        Waits for the boards of a job. A job, which isn't ready in time,
+        can't be cancelled, so the processes are started again.
+        * This is a private method.
+        :param job: AsyncResult, the job of the boards.
+        :return: list, the boards (Gameboard). None if the processes didn't
+                 create them in time or they failed.
+        """
+        try:
+            return job.get(timeout=BOARD_TIMEOUT)
+        except TimeoutError:
+            self.__restart_pool()
+            return None
+        except Exception:
+            return None
+
+    def __restart_pool(self):
+        """
+        Starts new board creating processes. The stuck tasks of a pool can't
+        be cancelled, so the old processes are stopped. The new processes
+        get a copy of the windows, but they never use them.
+        * This is a private method.
+        """
+        self.__prefetched.clear()
+        self.__pool.terminate()
+        self.__pool.join()
+        self.__pool = Pool(self.__processes)
+
+    def take_boards(self, level, difficulty=None, players=2):
+        """
+        Gets the boards of a new game. The boards, which were started in
+        the background, are used first, also if they aren't ready yet, and
+        the boards of the next game are started at once. Only the next game
+        of the newest kind is created in the background. The older jobs
+        aren't needed anymore, and they are left to finish in the
+        processes, because a job of the pool can't be cancelled.
+        :param level: str, the level of the game.
+        :param difficulty: tuple, the smallest and the biggest difficulty.
+                           None if any board is ok.
+        :param players: int, the amount of the boards.
+        :return: tuple, the seed of the game and the boards (list of
+                 Gameboard). None if the processes didn't create them in
+                 time.
+        """
+        key = (level, difficulty, players)
+        prefetched = self.__prefetched.pop(key, None)
+        self.__prefetched.clear()
+        if prefetched is not None:
+            seed, job = prefetched
+            boards = self.__wait_boards(job)
+        else:
+            seed = random.getrandbits(32)
+            boards = self.create_boards(level, difficulty, seed, players)
+        next_seed = random.getrandbits(32)
+        self.__prefetched[key] = (next_seed, self.__start_boards(
+            level, difficulty, next_seed, players))
+        return None if boards is None else (seed, boards)
+
+    def start(self):
+        """
+        Starts the mainloop. It ends, when the last game window is closed.
+        The coroutines are run inside it.
+        """
+        self.__root.mainloop()
+
+    def close(self):
+        """
+        Closes all game windows, the root window and the board creating
+        processes. The waiting games are written into the leaderboard.
+        """
+        for session in list(self.__sessions):
+            session.close()
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+            self.__ai.close()
+            self.__root.after_cancel(self.__ticking)
+            tasks = asyncio.all_tasks(self.__loop)
+            for task in tasks:
+                task.cancel()
+            self.__loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+            self.__loop.close()
+            self.__root.destroy()
+            leaderboard().close()
+
+
+def _pooled_board(level, difficulty, seed):
+    """
+    Creates one board in a board creating process.
+    :param level: str, the level of the game.
+    :param difficulty: tuple, the smallest and the biggest difficulty. None
+                       if any board is ok.
+    :param seed: str, the seed of the board.
+    :return: Gameboard, the new board.
+    """
+    return new_board(level, random.Random(seed), difficulty)
+
+
+#===== class Find_Aircraft_Head_Game ==========================================
+# This class is used to design the main game window. When the class is
+# running, the players can create/start a new game, choose the game level,
+# read the help file, play the game one by one and find the author information
+# about the game. The game window shows the game status during the game.
+class Find_Aircraft_Head_Game:
+    """
+    GUI-surface defination.
+    """
+    def __init__(self, level, broadcast=None, difficulty=None, manager=None,
+                 computer=False, messages=True, strategy=None, players=2):
+        """
+        Initializes the whole window.
+        :param level: str, the level of the game. The level should be "EASY",
+                      "MEDIUM" or "HARD".
+        :param broadcast: int, the port of the spectator broadcast. None if
+                          the game isn't broadcasted.
+        :param difficulty: tuple, the smallest and the biggest difficulty of
+                           the boards on the given level. EXPERT chooses the
+                           expert boards and None any board.
+        :param manager: Session_manager, the shared resources of the game
+                        windows. None creates a new one for this window.
+        :param computer: bool, True: the computer plays all players except
+                         the player 1.
+        :param messages: bool, False: the end of the game isn't shown in a
+                         message box. The benchmark plays without them.
+        :param strategy: str, the name of the computer's strategy. None
+                         means the hint engine.
+        :param players: int, the amount of the players (MIN_PLAYERS to
+                        MAX_PLAYERS).
+        """
+        if manager is None:
+            manager = Session_manager()
+        self.__manager = manager
+        # The request of the hint or the computer's move, which isn't
+        # answered yet.
+        self.__ai_ticket = None
+        self.__computer = False
+        self.__strategy = strategy
+        self.__messages = messages
+        self.__level = level
+        # The difficulty is used only on the given level, but the expert
+        # boards are chosen on every level (see the level menu).
+        self.__difficulty = {}
+        if difficulty is not None and difficulty != EXPERT:
+            self.__difficulty[level] = difficulty
+        self.__publisher = None
+        if broadcast is not None:
+            try:
+                self.__publisher = Spectator_publisher(broadcast)
+            except OSError as error:
+                showerror(title="Broadcast", message=str(error))
+
+        # Creates a new main window under the root of the manager.
+        table = manager.add_session(self)
+        self.__mainwindow = Toplevel(manager.get_root())
+        self.__mainwindow.protocol("WM_DELETE_WINDOW", self.close)
+        # All changes of the widgets during the game are shown together.
+        self.__render = Render_scheduler(self.__mainwindow)
+
+        # Sets the position of the main window. The tables are a bit apart.
+        x = self.__mainwindow.winfo_screenwidth() // 3 + 30 * table
+        y = self.__mainwindow.winfo_screenheight() // 3 + 30 * table
+        self.__mainwindow.geometry("+{}+{}".format(x, y))
+
+        # Sets the window's title and icon.
+        self.__mainwindow.title("Aircraft Head Hunting Game")
+        # The .ico-icon can be used only on Windows.
+        try:
+            self.__mainwindow.iconbitmap(resource_path("icon.ico"))
+        except TclError:
+            None
+
+        # The pictures and the fonts are shared by all tables. The board
+        # button commands are owned by the window. They are created only
+        # once and used in every new game.
+        self.__load_images()
+        self.__fonts = manager.get_fonts()
+        self.__commands = {}
+
+        # Creates the main menu. The computer player and the amount of the
+        # players are chosen for the next new game like the level.
+        self.__computerVar = BooleanVar(self.__mainwindow, value=computer)
+        self.__playersVar = IntVar(self.__mainwindow, value=players)
+        self.__expertVar = BooleanVar(self.__mainwindow,
+                                      value=difficulty == EXPERT)
+        self.__create_menu()
+
+        # Creates the gameboard in main window.
+        try:
+            self.__create_board()
+        except:
+            showerror(title = "Error",
+                      message = "Please, take a new game again!")
+
+    def __create_menu(self):
+        """
+        Creates the main menu bar. In this bar, there is 'File', 'Level
+        Choice' and 'Help' menu. Inside 'File' menu, the user can create a
+        new game or leave this game. Inside 'Level Choice' menu, the user
+        can choose the game level. Inside 'Help' menu, the user can choose to
+        read help information in a new window at '? Help' command and find the
+        author's information at 'About...' command.
+        * This is a private method.
+        """
+        # ====== Menu Bar =================================
+        self.__menu = Menu(self.__mainwindow)
+        self.__mainwindow.config(menu=self.__menu)
+        # ------ Start / Stop Menu --------------------
+        filemenu = Menu(self.__menu, tearoff=False)
+        self.__menu.add_cascade(label="File", menu=filemenu)
+        filemenu.add_command(label="New Game", command=self.__new_game)
+        filemenu.add_command(label="New Table", command=self.new_table)
+        filemenu.add_checkbutton(label="Computer Opponents",
+                                 variable=self.__computerVar)
+        filemenu.add_command(label="Leaderboard...",
+                             command=self.leaderboard_info)
+        filemenu.add_separator()
+        filemenu.add_command(label="Quit", command=self.quit)
+
+        # ------ Level Choice Menu --------------------
+        self.__levelVar = StringVar()
+        levelmenu = Menu(self.__menu, tearoff=False)
+        self.__menu.add_cascade(label="Level Choice", menu=levelmenu)
+        levelmenu.add_radiobutton(label='EASY', variable=self.__levelVar,
+                                  command=self.level_choice, value="EASY")
+        levelmenu.add_radiobutton(label='MEDIUM', variable=self.__levelVar,
+                                  command=self.level_choice, value="MEDIUM")
+        levelmenu.add_radiobutton(label='HARD', variable=self.__levelVar,
+                                  command=self.level_choice, value="HARD")
+        levelmenu.add_separator()
+        levelmenu.add_checkbutton(label="Expert Boards",
+                                  variable=self.__expertVar,
+                                  command=self.expert_choice)
+
+        # ------ Players Menu --------------------------
+        playersmenu = Menu(self.__menu, tearoff=False)
+        self.__menu.add_cascade(label="Players", menu=playersmenu)
+        for players in range(MIN_PLAYERS, MAX_PLAYERS + 1):
+            playersmenu.add_radiobutton(label=f"{players} Players",
+                                        variable=self.__playersVar,
+                                        value=players)
+
+        # ------ Help Menu -----------------------------
+        helpmenu = Menu(self.__menu, tearoff=False)
+        self.__menu.add_cascade(label="Help", menu=helpmenu)
+        helpmenu.add_command(label="? Help", command=self.__open_Help_Window)
+        helpmenu.add_separator()
+        helpmenu.add_command(label="About...", command=self.author_info)
+        if _profiler is not None:
+            helpmenu.add_command(label="Profiling...",
+                                 command=self.profiling_info)
+
+    def __create_board(self):
+        """
+        Sets an initial gameboard. Depends on the game level, the gameboard
+        size is different. The gameboard layout is designed by frame. There
+        is one main frame, a player frame with a gameboard frame for every
+        player, one game model frame and one info Frame.
+
+        This method is the most important one in this class. All of the
+        intial gameboard information is added by this method, including the
+        aircrafts information and the tip about aircraft model.
+
+        Level EASY: gameboard 8x8, 2 random aircrafts for each player.
+        Level MEDIUM: gameboard 10x10, 3 random aircrafts for each player.
+        Level HARD: gameboard 12x12, 4 random aircrafts for each player.
+        * This is a private method.
+        """
+        # The expert boards are only read from the saved pool. If there
+        # aren't any on this level, the normal boards are used.
+        difficulty = self.__difficulty.get(self.__level)
+        if self.__expertVar.get() and expert_pool(self.__level).load():
+            difficulty = EXPERT
+        elif difficulty is not None:
+            # The boards aren't rated in the window, because it would stop
+            # the window for minutes.
+            pool = difficulty_pool(self.__level)
+            pool.load(0)
+            if not pool.get_boards(difficulty[0], difficulty[1]):
+                del self.__difficulty[self.__level]
+                if self.__messages:
+                    showinfo(title="Difficulty",
+                             message=f"There are no rated {self.__level} "
+                                     f"boards of the difficulty "
+                                     f"{difficulty[0]}-{difficulty[1]}. "
+                                     f"Any boards are used. The boards are "
+                                     f"rated with --difficulty-pool.")
+                difficulty = None
+
+        # Takes a random board for every player from the shared board
+        # creating processes. If they have any problem (the return value is
+        # None), trys to get the boards again a few times, and then creates
+        # them in this process. The boards are created from the game seed,
+        # so the game can be played again. The boards of the next game are
+        # created in the background at the same time.
+        players = self.__playersVar.get()
+        ready = None
+        for attempt in range(BOARD_RETRIES):
+            ready = self.__manager.take_boards(self.__level, difficulty,
+                                               players)
+            if ready is not None:
+                break
+        if ready is None:
+            if self.__messages:
+                showerror(title="Error",
+                          message="The board creating processes don't "
+                                  "answer. The boards are created in the "
+                                  "game window.")
+            seed = random.getrandbits(32)
+            ready = (seed, [new_board(self.__level,
+                                      random.Random(board_seed(seed, player)),
+                                      difficulty)
+                            for player in range(players)])
+        self.__seed, self.__boards = ready
+        # The level of the shown boards. The chosen level can change during
+        # the game, but it is used only in the next new game.
+        self.__game_level = self.__level
+
+        # -- If needs to check the answer, can use the next print commands. --
+        # All of the printing in on Python run screen.
+        # print("Player 1's solution is:")
+        # board_1.print()
+        # print("Player 2's solution is:")
+        # board_2.print()
+        # print("-*-" * 15)
+        # print()
+
+        # Sets the boardsize by level.
+        self.__size = LEVELS[self.__level][0]
+
+        # ====== Display Window =============================
+        # ------- Main frame design --------
+        self.__mainFrame = Frame(self.__mainwindow)
+        self.__startButton = Button(self.__mainFrame, text="Start Game",
+                                    command=self.__startgame, state=NORMAL,
+                                    font=self.__fonts["start"], bg="#C4FF0E")
+        self.__mainLabel = Label(self.__mainFrame, font=self.__fonts["label"])
+        self.__hintButton = Button(self.__mainFrame, text="Hint",
+                                   command=self.__hint, state=DISABLED,
+                                   font=self.__fonts["label"], bg=YELLOW)
+
+        # ------- Player frames design --------
+        # Every player has a frame with the emoji, the name, the turn, the
+        # state and the gameboard. The frames are in rows of PLAYERS_PER_ROW
+        # players. The aircraft model is in the middle of the first row, and
+        # the emojis are on the outer sides of the frames.
+        players = len(self.__boards)
+        columns = min(players, PLAYERS_PER_ROW)
+        middle = (columns + 1) // 2
+        self.__players_turn = []
+        self.__players_state = []
+        self.__players_emoji = []
+        self.__gameboardFrames = []
+        for player in range(players):
+            playerFrame = Frame(self.__mainFrame)
+            column = player % columns
+            if column >= middle:
+                column += 1
+            playerFrame.grid(row=2 + player // columns, column=column,
+                             sticky=N)
+            right = column > middle
+            nameLabel = Label(playerFrame, text=f"Player {player + 1}",
+                              font=("Calibri", 15, "bold"))
+            nameLabel.grid(row=0, column=0 if right else 2,
+                           sticky=W if right else E)
+            self.__players_emoji.append(Label(playerFrame,
+                                              image=self.__emoji_draw))
+            self.__players_emoji[player].grid(row=0, column=2 if right else 0,
+                                              rowspan=2)
+            self.__players_turn.append(Label(playerFrame, fg="#88001B",
+                                             font=self.__fonts["turn"]))
+            self.__players_turn[player].grid(row=1, column=0 if right else 1,
+                                             columnspan=2)
+            self.__players_state.append(Label(playerFrame,
+                                              font=("times", 12)))
+            self.__players_state[player].grid(row=2, column=0, columnspan=3,
+                                              sticky=E+W)
+            self.__gameboardFrames.append(Frame(playerFrame))
+            self.__gameboardFrames[player].grid(row=3, column=0,
+                                                columnspan=3)
+
+        # ------- Gameboard frames design --------
+        self.__gamemodelFrame = Frame(self.__mainFrame)
+        gamemodelLabel = Label(self.__gamemodelFrame, text="Aircraft Model:",
+                               font=("Calibri", 13, "bold"))
+        if self.__level == "HARD":
+            gamemodel_picLabel = Label(self.__gamemodelFrame,
+                                       image=self.__hard_plane)
+        else:
+            gamemodel_picLabel = Label(self.__gamemodelFrame,
+                                       image=self.__easy_plane)
+
+        # Sets the gameboard squares by buttons. All buttons can return the
+        # cell number to the method. The buttons are in lists by the cell
+        # numbers (cell number = y * boardsize + x).
+        if self.__size not in self.__commands.keys():
+            self.__commands[self.__size] = [
+                partial(self.__boardButton, cell)
+                for cell in range(self.__size * self.__size)]
+        self.__boardButtons = []
+        for frame in self.__gameboardFrames:
+            self.__boardButtons.append(
+                [Button(frame, bg=GRAY, width=3, height=1,
+                        command=self.__commands[self.__size][cell],
+                        state=DISABLED)
+                 for cell in range(self.__size * self.__size)])
+
+        # Sets extra blank columns around the main gameboard.
+        x = self.__size
+        for frame in self.__gameboardFrames:
+            for y in range(self.__size):
+                Label(frame, text="      ").grid(row=y + 1, column=0)
+                Label(frame, text="      ").grid(row=y + 1, column=x + 1)
+
+        # ------- Information display frame design --------
+        self.__infoFrame = Frame(self.__mainwindow)
+        Label(self.__infoFrame).pack()
+        levelDisplayLabel = Label(self.__infoFrame,
+                                  text=f"Level: {self.__level}",
+                                  font=("Arial", 15),
+                                  fg = "#0400FC", bg = "#D5F2FA")
+        welcomeLabel = Label(self.__infoFrame,
+                                   text = "Welcome to play! Enjoy your game!",
+                                   font=("Calibri", 12, "italic"),
+                                   fg = "#85021C", bg = "#FAD5DC")
+
+        # All widgets(labels/buttons/frames)' placement.
+        self.__mainFrame.pack()
+        self.__startButton.grid(row = 0, column = 0, columnspan=columns + 1)
+        self.__mainLabel.grid(row = 1, column = 0, columnspan=columns)
+        self.__hintButton.grid(row = 1, column = columns)
+        self.__gamemodelFrame.grid(row=2, column=middle, sticky=N)
+        gamemodelLabel.grid()
+        gamemodel_picLabel.grid()
+
+        for buttons in self.__boardButtons:
+            for cell in range(self.__size * self.__size):
+                y, x = divmod(cell, self.__size)
+                buttons[cell].grid(row=y + 1, column=x + 1)
+
+        self.__infoFrame.pack(side=BOTTOM)
+        levelDisplayLabel.pack()
+        welcomeLabel.pack()
+
+    def __load_images(self):
+        """
+        Loads the pictures, which are used in the main window.
+        * This is a private method.
+        """
+        image = self.__manager.image
+        self.__easy_plane = image("easy_plane.png")
+        self.__hard_plane = image("hard_plane.png")
+        self.__emoji_draw = image("00.gif")
+        self.__emoji_bad1 = image("B1.gif")
+        self.__emoji_bad2 = image("B2.gif")
+        self.__emoji_lose = image("B3.gif")
+        self.__emoji_good1 = image("G1.gif")
+        self.__emoji_good2 = image("G2.gif")
+        self.__emoji_win = image("G3.gif")
+
+    def __update_board(self):
+        """
+        When the user opens a new game, the whole gameboard need to update.
+        * This is a private method.
+        """
+        self.__cancel_ai()
+        # The player frames and the gameboards are inside the main frame.
+        self.__mainFrame.destroy()
+        self.__infoFrame.destroy()
+        self.__render.reset()
+
+        try:
+            self.__create_board()
+        except:
+            showerror(title="Error",
+                      message="Please, take a new game again!")
+
+    def __new_game(self):
+        """
+        Creates a new game. Needs to confirm before starting a new game.
+        * This is a private method.
+        """
+        check = messagebox.askokcancel("Confirm",
+                   "Are you sure to start a new {} game?".format(self.__level))
+        if check == True:
+            self.__update_board()
+        self.__render.set(self.__startButton, state=NORMAL)
+
+    def __startgame(self):
+        """
+        Starts the game. Makes all of the gameboard buttons into NORMAL state.
+        * This is a private method.
+        """
+        # Starts a new match: the round counter is 0 and there are no shots.
+        self.__match = Match(self.__game_level, self.__boards, self.__seed)
+        self.__computer = self.__computerVar.get()
+        self.__cancel_ai()
+        self.__hint_square = None
+        self.__render.set(self.__hintButton, state=NORMAL)
+
+        # Resets all gameboard buttons into NORMAL state
+        for button in self.__boardButtons[0]:
+            self.__render.set(button, state=NORMAL)
+
+        # Shows the game information on the label.
+        self.__render.set(self.__players_turn[0], text="Your turn!")
+        for player in range(self.__match.get_players()):
+            self.__render.set(self.__players_state[player],
+                text=f"You have {self.__match.get_heads_left(player)} "
+                     f"heads to find!")
+        self.__render.set(self.__mainLabel, text="Round: 0")
+        if self.__publisher is not None:
+            self.__publisher.new_game(self.__game_level,
+                                      self.__match.get_players())
+
+        # Sets the start button into DISABLED state after the game already
+        # started.
+        self.__render.set(self.__startButton, state=DISABLED)
+
+    def __boardButton(self, cell):
+        """
+        This is the gameboard buttons' event. The button can change the state
+        into DISABLED or NORMAL and then change the color to while/red/blue.
+        * This is a private method.
+        :param cell: int, the cell number of the given button.
+        """
+        # Makes sure which player is playing now.
+        player_turn = self.__match.get_turn()
+        shot_round = self.__match.get_round()
+        self.__clear_hint()
+
+        # Changes the player's gameboard button's outfit.
+        result = self.__match.shoot(cell)
+        if result == BLANKSPACE:
+            self.__render.set(self.__boardButtons[player_turn][cell], bg=WHITE)
+        elif result == PLANEHEAD:
+            self.__render.set(self.__boardButtons[player_turn][cell], bg=RED)
+            self.__render.set(self.__players_state[player_turn],
+                text=f"You have {self.__match.get_heads_left(player_turn)} "
+                     f"heads to find!"
+            )
+            self.__change_emoji()
+        elif result == PLANEBODY:
+            self.__render.set(self.__boardButtons[player_turn][cell], bg=BLUE)
+        if self.__publisher is not None:
+            self.__publisher.shot(player_turn, cell, result, shot_round)
+
+        # If the game is over, all of the bottons need to be locked.
+        if self.__is_winner():
+            self.__disabled_all_buttons()
+            self.__save_game()
+            return
+
+        # Updates the round's showing.
+        round_show = self.__match.get_rounds_played()
+        self.__render.set(self.__mainLabel, text = f"Round: {round_show}")
+
+        # When the game isn't over, changes the buttons' state. Makes sure
+        # the player can play the game one by one.
+        self.__disabled_buttons()
+        if self.__is_computer_turn():
+            self.__computer_move()
+
+    def __hint(self):
+        """
+        Asks the best next square of the player from the worker process.
+        * This is a private method.
+        """
+        if self.__is_computer_turn():
+            return
+        player_turn = self.__match.get_turn()
+        self.__clear_hint()
+        self.__cancel_ai()
+        self.__ai_ticket = self.__manager.get_ai().ask(
+            self.__game_level, self.__match.get_revealed(player_turn),
+            partial(self.__show_hint, self.__match, self.__match.get_round()))
+
+    def __show_hint(self, match, shot_round, cell):
+        """
+        Shows the best next square on the player's gameboard in yellow. The
+        hint is not shown, if somebody has already shot.
+        * This is a private method.
+        :param match: Match, the game of the request.
+        :param shot_round: int, the round counter of the request.
+        :param cell: int, the cell number of the square.
+        """
+        self.__ai_ticket = None
+        if match is not self.__match or match.get_round() != shot_round \
+                or cell is None:
+            return
+        player_turn = match.get_turn()
+        self.__clear_hint()
+        self.__render.set(self.__boardButtons[player_turn][cell], bg=YELLOW)
+        self.__hint_square = (player_turn, cell)
+
+    def __is_computer_turn(self):
+        """
+        Checks, if the computer is in turn.
+        * This is a private method.
+        :return: bool, True: the computer plays now.
+        """
+        return self.__computer and not self.__match.is_over() \
+            and self.__match.get_turn() != 0
+
+    def __computer_move(self):
+        """
+        Asks the computer's move from the worker process. The window works
+        normally during the search.
+        * This is a private method.
+        """
+        self.__cancel_ai()
+        player_turn = self.__match.get_turn()
+        self.__render.set(self.__players_turn[player_turn],
+                          text="Thinking...")
+        self.__ai_ticket = self.__manager.get_ai().ask(
+            self.__game_level, self.__match.get_revealed(player_turn),
+            partial(self.__computer_shot, self.__match,
+                    self.__match.get_round()),
+            AI_MOVE_TIME, self.__strategy,
+            (id(self.__match), self.__match.get_seed(), player_turn))
+
+    def __computer_shot(self, match, shot_round, cell):
+        """
+        Shoots the computer's move, if the game is still the same.
+        * This is a private method.
+        :param match: Match, the game of the request.
+        :param shot_round: int, the round counter of the request.
+        :param cell: int, the cell number of the square.
+        """
+        self.__ai_ticket = None
+        if match is self.__match and match.get_round() == shot_round \
+                and cell is not None:
+            self.__boardButton(cell)
+
+    def __cancel_ai(self):
+        """
+        Cancels the hint or the computer's move, which isn't answered yet.
+        * This is a private method.
+        """
+        if self.__ai_ticket is not None:
+            self.__manager.get_ai().cancel(self.__ai_ticket)
+            self.__ai_ticket = None
+
+    def __clear_hint(self):
+        """
+        Changes the hint square back to gray.
+        * This is a private method.
+        """
+        if self.__hint_square is not None:
+            player, cell = self.__hint_square
+            self.__render.set(self.__boardButtons[player][cell], bg=GRAY)
+            self.__hint_square = None
+
+    def __change_emoji(self):
+        """
+        Changes the emoji depends on the result of the game to take the game
+        has more funny. This is called, when a player found a head.
+        * This is a private method.
+        """
+        # Calculates the difference amount of each player's finded aircraft
+        # heads and the best other player's. Changes the emoji depending on
+        # the error. Only the changed emojis are drawn again.
+        emojis = [self.__emoji_bad2, self.__emoji_bad1, self.__emoji_draw,
+                  self.__emoji_good1, self.__emoji_good2]
+        heads_left = self.__match.get_all_heads_left()
+        best, second = sorted(heads_left)[:2]
+        for player, heads in enumerate(heads_left):
+            lead = (second if heads == best else best) - heads
+            self.__render.set(self.__players_emoji[player],
+                              image=emojis[max(-2, min(2, lead)) + 2])
+
+    def __disabled_all_buttons(self):
+        """
+        Locks all the gameboard buttons.
+        * This is a private method.
+        """
+        for buttons in self.__boardButtons:
+            for button in buttons:
+                self.__render.set(button, state=DISABLED)
+        self.__render.set(self.__hintButton, state=DISABLED)
+
+    def __disabled_buttons(self):
+        """
+        Changes the players' gameboard buttons state. If the buttons haven't
+        been chose, changes the state from NORMAL to DISABLED or from DISABLED
+        to NORMAL. Changes the text of turn-label at the same time. Only the
+        boards of the last player and the next player are changed, so the
+        turn costs the same with any amount of players.
+        * This is a private method.
+        """
+        player_next_turn = self.__match.get_turn()
+        player_turn = (player_next_turn - 1) % self.__match.get_players()
+        clicked = self.__match.get_revealed(player_next_turn).get_cells()
+        for cell in range(self.__size * self.__size):
+            self.__render.set(self.__boardButtons[player_turn][cell],
+                              state=DISABLED)
+            # Changes just gray (not clicked) squares into NORMAL. The
+            # computer's squares are not clicked by the user.
+            if cell not in clicked and not self.__is_computer_turn():
+                self.__render.set(self.__boardButtons[player_next_turn][cell],
+                                  state=NORMAL)
+        self.__render.set(self.__players_turn[player_turn], text="")
+        self.__render.set(self.__players_turn[player_next_turn],
+                          text="Your turn!")
+
+    def __is_winner(self):
+        """
+        The game will be over, when the players are drawing or one of them
+        won the game. This method is used to check the game is over or not.
+        When the game is over, makes the showinfo-message at the same time.
+        * This is a private method.
+        :return: bool, True: when the game is over;
+                       False: when the game is still playing.
+        """
+        if not self.__match.is_over():
+            return False
+
+        winners = self.__match.get_winners()
+        players = self.__match.get_players()
+        # When only one player has found all heads, the player is the winner.
+        # When many players have found all heads, it is draw between them.
+        for player in range(players):
+            if player not in winners:
+                image = self.__emoji_lose
+            elif len(winners) == 1:
+                image = self.__emoji_win
+            else:
+                image = self.__emoji_draw
+            self.__render.set(self.__players_emoji[player], image=image)
+        if len(winners) == 1:
+            message = (f"Congratulations!\n\n"
+                       f"Player {winners[0] + 1} won the game!!!")
+        elif len(winners) == players:
+            message = "Congratulations!\n\nThe game is a draw!"
+        else:
+            message = ("Congratulations!\n\nThe game is a draw between "
+                       "players " + ", ".join(str(winner + 1)
+                                              for winner in winners) + "!")
+        self.__render.flush()
+        if self.__messages:
+            showinfo(title = "GAME IS OVER", message = message)
+        return True
+
+    def __save_game(self):
+        """
+        Records the finished game into the game archive and the leaderboard.
+        The archive is only used for the game statistics, so the game goes
+        on even if the archive cannot be written. The leaderboard is written
+        in the background.
+        * This is a private method.
+        """
+        try:
+            save_game(self.__match.get_record())
+        except OSError:
+            None
+        leaderboard().add_match(self.__match)
+
+    def level_choice(self):
+        """
+        This method is used to record the level of the game. The hint, which
+        isn't ready yet, is cancelled. The computer's move is still needed,
+        because the new level is used only in the next new game.
+        """
+        self.__level = self.__levelVar.get()
+        if self.__ai_ticket is not None and not self.__is_computer_turn():
+            self.__cancel_ai()
+
+    def expert_choice(self):
+        """
+        Checks there are expert boards on the chosen level, when the expert
+        boards are chosen. They are used in the next new game.
+        """
+        if self.__expertVar.get() and not expert_pool(self.__level).load():
+            self.__expertVar.set(False)
+            showinfo(title = "Expert Boards",
+                     message = f"There are no expert boards of "
+                               f"{self.__level} yet. They are searched "
+                               f"with the option --expert-pool.")
+
+    def author_info(self):
+        """
+        Sets the messagebox's title and text. Shows the author information.
+        """
+        showinfo(title = "Author Information",
+                 message = "Name: Shuang Fan \n"
+                           "Email: shuang.fan@tuni.fi\n"
+                           "Student number: H255220")
+
+    def new_table(self):
+        """
+        Opens another game window on the chosen level.
+        """
+        self.__manager.new_session(self.__level,
+                                   difficulty=EXPERT
+                                   if self.__expertVar.get() else None,
+                                   computer=self.__computerVar.get(),
+                                   strategy=self.__strategy,
+                                   players=self.__playersVar.get())
+
+    def leaderboard_info(self):
+        """
+        Shows the best games and the averages of every level.
+        """
+        showinfo(title = "Leaderboard", message = leaderboard().report())
+
+    def profiling_info(self):
+        """
+        Shows the latencies of the profiled handlers.
+        """
+        showinfo(title = "Profiling", message = _profiler.report())
+
+    def __open_Help_Window(self):
+        """
+        Opens the help window.
+        """
+        Help_Window(self.__manager.image).start()
+
+    def start(self):
+        """
+        Starts the mainloop of all game windows.
+        """
+        self.__manager.start()
+
+    def restart(self):
+        """
+        Starts a new game without asking. This is used by the soak test and
+        the benchmark.
+        """
+        self.__update_board()
+        self.__mainwindow.update()
+
+    def choose_level(self, level):
+        """
+        Chooses the level of the next new game like the level menu. This is
+        used by the benchmark.
+        :param level: str, the level of the game.
+        """
+        self.__levelVar.set(level)
+        self.level_choice()
+
+    def press_start(self):
+        """
+        Clicks the start button. This is used by the benchmark.
+        """
+        self.__startButton.invoke()
+
+    def press_square(self, cell):
+        """
+        Clicks the square of the player in turn like the user. This is used
+        by the benchmark.
+        :param cell: int, the cell number of the square.
+        :return: bool, False if the square cannot be clicked now.
+        """
+        if self.__match.is_over():
+            return False
+        button = self.__boardButtons[self.__match.get_turn()][cell]
+        # The state of the button is changed in the next flush.
+        self.__render.flush()
+        if str(button["state"]) != NORMAL:
+            return False
+        button.invoke()
+        return True
+
+    def is_over(self):
+        """
+        :return: bool, True: the match is over.
+        """
+        return self.__match.is_over()
+
+    def get_players(self):
+        """
+        Gets the amount of the players of the shown game.
+        :return: int, the amount of the players.
+        """
+        return len(self.__boards)
+
+    def repaint(self):
+        """
+        Draws all changes of the window and waits until the display has got
+        them. The pointer query is answered after all earlier drawings, so
+        the display has received the new picture when this returns.
+        """
+        self.__mainwindow.update_idletasks()
+        self.__mainwindow.winfo_pointerxy()
+
+    def open_help(self):
+        """
+        Opens the help window without its own mainloop. This is used by the
+        benchmark.
+        :return: Help_Window, the opened help window.
+        """
+        return Help_Window(self.__manager.image)
+
+    def tk_object_counts(self):
+        """
+        Counts the objects, which Tk keeps: the widgets, the images, the
+        fonts and the Tcl-commands (for example the button callbacks).
+        :return: dict, the amount of every kind of objects.
+        """
+        widgets = 0
+        waiting = [self.__mainwindow]
+        while waiting:
+            widget = waiting.pop()
+            widgets += 1
+            waiting.extend(widget.winfo_children())
+        tk = self.__mainwindow.tk
+        return {"widgets": widgets,
+                "images": len(tk.splitlist(tk.call("image", "names"))),
+                "fonts": len(tk.splitlist(tk.call("font", "names"))),
+                "commands": len(tk.splitlist(tk.call("info", "commands")))}
+
+    def close(self):
+        """
+        Closes the window and the spectator broadcast without asking. If
+        this is the last window, the program is closed.
+        """
+        if self.__publisher is not None:
+            self.__publisher.close()
+            self.__publisher = None
+        self.__cancel_ai()
+        self.__mainwindow.destroy()
+        self.__manager.close_session(self)
+
+    def quit(self):
+        """
+        Ends the execution of the program.
+        """
+        check = messagebox.askokcancel("Confirm", "Are you sure to quit?")
+        if check == True:
+            try:
+                self.close()
+            except:
+                None
+
+#===== class Help_Window ======================================================
+# This class is used to design the help window. In this window, there is the
+# game instruction. The user can use the help file to play the game. This
+# window can be opend with the main window at the same time.
+class Help_Window:
+    """
+    The helpwindow's outfit design.
+    """
+    def __init__(self, image=None):
+        """
+        Initializes the help window.
+        :param image: function, which gets a picture (PhotoImage) by the
+                      file name. None reads the picture files.
+        """
+        if image is None:
+            image = lambda filename: PhotoImage(file=resource_path(filename))
+        # Creates the help window in another window.
+        self.__helpwindow = Toplevel()
+        self.__helpwindow.geometry("800x500+0+0")
+        self.__helpwindow.title("Help")
+        # The .ico-icon can be used only on Windows.
+        try:
+            self.__helpwindow.iconbitmap(resource_path("icon.ico"))
+        except TclError:
+            None
+
+        # Fonts settings.
+        font_title = Font(family="Segoe print", size=20, weight="bold")
+        font_text = Font(family="Arial", size=14)
+        font_highlight = Font(family="Arial", size=17, slant="italic",
+                              weight="bold")
+
+        # Images settings.
+        self.__image_1 = image("help_1.gif")
+        self.__image_2 = image("help_2.gif")
+        self.__image_3 = image("help_3.gif")
+        self.__image_4 = image("help_4.gif")
+
+        # Creates a frame
+        main_frame = Frame(self.__helpwindow)
+        main_frame.pack(fill=BOTH, expand=1)
+
+        # Creates a canvas
+        self.__canvas = Canvas(main_frame)
+        self.__canvas.pack(side=LEFT, fill=BOTH, expand=1)
+
+        # add a scrollbar to the canvas
+        scrollbar = ttk.Scrollbar(main_frame, orient=VERTICAL,
+                              command=self.__canvas.yview)
+        scrollbar.pack(side=RIGHT, fill=Y)
+
+        # configure the canvas
+        self.__canvas.configure(yscrollcommand=scrollbar.set)
+        self.__canvas.bind('<Configure>', lambda e: self.__canvas.configure(
+            scrollregion = self.__canvas.bbox("all")))
+        self.__canvas.bind_all('<MouseWheel>',self.__on_mouse_wheel)
+
+        # Creates a new frame inside the canvas to design all labels and button.
+        frame = Frame(self.__canvas)
+
+        # Adds the new frame to a window in the canvas.
+        self.__canvas.create_window((0,0), window=frame, anchor="nw")
+
+        # Designs the labels and button.
+        label_1 = Label(frame, font=font_title, fg="#3D27FF", bg="#CBFFF6",
+                        text="Welcome to play 'Aircraft Head Hunting' Game!")
+        label_2 = Label(frame, font=font_text,
+                        text=f"Players: {MIN_PLAYERS}-{MAX_PLAYERS}")
+        label_3 = Label(frame, font=font_text,
+                        text="Average time: 5-15 min.\n")
+        label_4 = Label(frame, font=font_highlight, fg="#FF7F27", bg="#FFE1EA",
+                        text="How to play?")
+        label_5 = Label(frame, font=font_text,
+                        text="1. Choose the level (default level is EASY) "
+                             "and take a New Game.")
+        label_6 = Label(frame, image=self.__image_1, relief=RIDGE)
+        label_7 = Label(frame, image=self.__image_2, relief=RIDGE)
+        label_8 = Label(frame, font=font_text,
+                        text="2. Press the \"Start Game\".")
+        label_9 = Label(frame, font=font_text, fg="#FF7F27",
+                        text="3. On your turn!")
+        label_10 = Label(frame, font=font_text, wraplength=750, justify=LEFT,
+                         text="  Click a square on your board: \n"
+                              "      If the square is the head of an aircraft,"
+                              " it will turn to red color. \n"
+                              "      If the square is the body of an aircraft,"
+                              " it will turn to blue color. \n"
+                              "      If the square isn't the head neither the "
+                              "body of an aircraft, it will turn to white.")
+        label_11 = Label(frame, font=font_text,
+                         text="4. Play the game in turn. In one round, each of "
+                              "you can click square once.")
+        label_12 = Label(frame, image=self.__image_3, relief=RIDGE)
+        label_13 = Label(frame, image=self.__image_4, relief=RIDGE)
+        label_14 = Label(frame, font=font_highlight, fg="#FF7F27", bg="#FFE1EA",
+                         text="How to win?")
+        label_15 = Label(frame, font=font_text,
+                         text="Find the aircraft head as fast as possible!\n")
+        label_16 = Label(frame, font=font_title, fg="#0ED145",
+                         text="Good luck! Enjoy the game!")
+        # This button is used to close the help window.
+        helpCloseButton = Button(frame, text="Close", bg="#FDF395",
+                                 command=self.close_help,
+                                 font=("Arial", 14, "bold"))
+
+        # Sets the layout about all widgets.
+        label_1.grid(row=0, column=0, columnspan=2)
+        label_2.grid(row=1, column=0, columnspan=2, sticky=W)
+        label_3.grid(row=2, column=0, columnspan=2, sticky=W)
+        label_14.grid(row=3, column=0, columnspan=2, sticky=W)
+        label_15.grid(row=4, column=0, columnspan=2, sticky=W)
+        label_4.grid(row=5, column=0, columnspan=2, sticky=W)
+        label_5.grid(row=6, column=0, columnspan=2, sticky=W)
+        label_6.grid(row=7, column=0)
+        label_7.grid(row=7, column=1)
+        label_8.grid(row=8, column=0, columnspan=2, sticky=W)
+        label_9.grid(row=9, column=0, columnspan=2, sticky=W)
+        label_10.grid(row=10, column=0, columnspan=2, sticky=W)
+        label_11.grid(row=11, column=0, columnspan=2, sticky=W)
+        label_12.grid(row=12, column=0, columnspan=2)
+        label_13.grid(row=13, column=0, columnspan=2)
+        label_16.grid(row=14, column=0)
+        helpCloseButton.grid(row=14, column=1)
+
+    def __on_mouse_wheel(self, event):
+        """
+        This method is used to scroll the canvas by mouse wheel.
+        :param event: a tkinter event about mouse wheel.
+        """
+        self.__canvas.yview_scroll(-1 * int(event.delta / 120), "units")
+
+    def start(self):
+        """
+        Shows the help window on top when the user clicks the help-command.
+        In the help window, there is game instruction to help new player
+        enjoys the game. The window runs in the mainloop of the game
+        windows.
+        """
+        self.__helpwindow.lift()
+        self.__helpwindow.focus_set()
+
+    def close_help(self):
+        """
+        Closes the help window.
+        """
+        self.__helpwindow.destroy()
+
+
+# ----- Creates a new game (event/process) ----------------------------
+def create_game(level, out_board, legacy=False, difficulty=None, seed=None):
+    """
+    Creates a new game with random aircrafts. Sometimes the gameboard cannot
+    create at once with the old random aircraft generators.
+    * This is the real main function for a game.
+    """
+    # Returns the board value.
+    if legacy:
+        out_board.put(legacy_board(level))
+    else:
+        rng = random if seed is None else random.Random(seed)
+        out_board.put(new_board(level, rng, difficulty))
+
+def new_board(level, rng=random, difficulty=None):
+    """
+    Creates a new gameboard with a uniformly chosen layout of aircrafts.
+    :param level: str, the level of the game.
+    :param rng: random.Random, the random generator.
+    :param difficulty: tuple, the smallest and the biggest difficulty (the
+                       shots of the solver). EXPERT for the expert boards and
+                       None if any board is ok. If there isn't any saved
+                       board of the difficulty or any expert board, any
+                       board is used.
+    :return: Gameboard, the new gameboard.
+    """
+    if difficulty == EXPERT:
+        board = expert_pool(level).choose(rng)
+        if board is not None:
+            return board
+    elif difficulty is not None:
+        board = difficulty_pool(level).choose(difficulty[0], difficulty[1],
+                                              rng)
+        if board is not None:
+            return board
+    return layout_board(level, uniform_layouts(level).sample_placements(rng))
+
+def board_seed(seed, player):
+    """
+    Gets the seed of one player's board. All boards of a game are created
+    from the same game seed.
+    :param seed: int, the seed of the game.
+    :param player: int, the index of the player.
+    :return: str, the seed of the board.
+    """
+    return f"{seed}-{player}"
+
+def layout_board(level, placements):
+    """
+    Creates a gameboard with the given aircrafts.
+    :param level: str, the level of the game.
+    :param placements: list, the numbers of the placements (see
+                       Uniform_layouts) of the aircrafts.
+    :return: Gameboard, the new gameboard.
+    """
+    layouts = uniform_layouts(level)
+    board = Gameboard(layouts.get_size())
+    for placement in placements:
+        board.add_aircraft(Aircraft(layouts.get_placements()[placement]))
+    return board
+
+def legacy_board(level):
+    """
+    Creates a new gameboard with the random aircraft generators. The
+    aircrafts are added one by one, so sometimes the board cannot be
+    finished and this never returns.
+    :param level: str, the level of the game.
+    :return: Gameboard, the new gameboard.
+    """
+    if level == "EASY":
+        board = Gameboard(8)
+
+        plane_1 = Random_aircraft_SIMPLE(8).get_aircraft()
+        board.add_aircraft(plane_1)
+
+        plane_2 = Random_aircraft_SIMPLE(8).get_aircraft()
+        while not board.add_aircraft(plane_2):
+            plane_2 = Random_aircraft_SIMPLE(8).get_aircraft()
+
+    if level == "MEDIUM":
+        board = Gameboard(10)
+
+        plane_1 = Random_aircraft_SIMPLE(10).get_aircraft()
+        board.add_aircraft(plane_1)
+
+        plane_2 = Random_aircraft_SIMPLE(10).get_aircraft()
+        while not board.add_aircraft(plane_2):
+            plane_2 = Random_aircraft_SIMPLE(10).get_aircraft()
+
+        plane_3 = Random_aircraft_SIMPLE(10).get_aircraft()
+        while not board.add_aircraft(plane_3):
+            plane_3 = Random_aircraft_SIMPLE(10).get_aircraft()
+
+    if level == "HARD":
+        board = Gameboard(12)
+
+        plane_1 = Random_aircraft_COMPLEX(12).get_aircraft()
+        board.add_aircraft(plane_1)
+
+        plane_2 = Random_aircraft_COMPLEX(12).get_aircraft()
+        while not board.add_aircraft(plane_2):
+            plane_2 = Random_aircraft_COMPLEX(12).get_aircraft()
+
+        plane_3 = Random_aircraft_COMPLEX(12).get_aircraft()
+        while not board.add_aircraft(plane_3):
+            plane_3 = Random_aircraft_COMPLEX(12).get_aircraft()
+
+        plane_4 = Random_aircraft_COMPLEX(12).get_aircraft()
+        while not board.add_aircraft(plane_4):
+            plane_4 = Random_aircraft_COMPLEX(12).get_aircraft()
+
+    return board
+
+def game_main(level, legacy=False, difficulty=None, seed=None):
+    """
+    This function is used to terminate the process during it is timeout. The
+    function returns the None value, if the game's creating process is timeout.
+    :param level: str, the level of the game.
+    :param legacy: bool, True: uses the old random aircraft generators.
+    :param difficulty: tuple, the smallest and the biggest difficulty. None
+                       if any board is ok.
+    :param seed: str, the seed of the board. None for a random board.
+    :return Gameboard, the gameboard information. If the process is timeout,
+            returns None.
+    """
+    out_board = Queue()
+    # Creates a Process
+    action_process = Process(target=create_game,
+                             args=(level, out_board, legacy, difficulty,
+                                   seed))
+
+    # Starts the process and blockes for 3 seconds.
+    action_process.start()
+    action_process.join(timeout=3)
+
+    # Terminates the process.
+    action_process.terminate()
+    try:
+        # If the process is timeout, returns None. Otherwise returns the
+        # gameboard information.
+        if action_process.exitcode != 0:
+            return None
+        else:
+            board = out_board.get()
+            return board
+    finally:
+        # Releases the process and the queue (its pipe and thread) at once.
+        action_process.join()
+        action_process.close()
+        out_board.close()
+        out_board.join_thread()
+
+#===== class Difficulty_pool ==================================================
+# This class is used to create boards of the chosen difficulty. The
+# difficulty of a board is the amount of shots, which the solver needs to
+# find all heads. The solver always shoots the square of the hint, so it is
+# the same as a player, who plays well.
+#
+# The boards aren't created and thrown away until one is good enough.
+# Instead, a big amount of uniformly chosen layouts are rated once (in
+# parallel) and saved by their difficulty. A new board is chosen from the
+# saved layouts of the wanted difficulties.
+class Difficulty_pool:
+    """
+    The rated layouts of one level.
+    :param self.__level: str, the level of the game.
+    :param self.__layouts: dict, the layouts (list of placement numbers) of
+                           every difficulty. None if not loaded yet.
+    """
+    def __init__(self, level):
+        """
+        Initializes the pool.
+        :param level: str, the level of the game.
+        """
+        self.__level = level
+        self.__layouts = None
+
+    def __signature(self):
+        """
+        Gets the information, which the difficulties depend on. If the level
+        or the solver is changed, the saved layouts are not used.
+        * This is a private method.
+        :return: list, the size, the amount, the model and the settings of
+                 the hints in the form of the file.
+        """
+        size, amount, model = LEVELS[self.__level]
+        return saved_form([size, amount, model, Hint_engine.HIT_WEIGHT,
+                           ENDGAME_LAYOUTS, ENDGAME_WORK, "exact"])
+
+    def load(self, amount=None, processes=None, filename=None):
+        """
+        Loads the rated layouts from the file. If there aren't enough of
+        them, new layouts are rated in parallel and saved into the file.
+        :param amount: int, the smallest amount of the rated layouts. None
+                       means any saved layouts are enough, and
+                       DIFFICULTY_POOL_SIZE layouts are rated if there
+                       aren't any. 0 only reads the saved layouts, so the
+                       game window never waits for the rating.
+        :param processes: int, the amount of the rating processes. None
+                          means the amount of the CPUs.
+        :param filename: str, the file of the rated layouts. None means the
+                         file next to this program.
+        :return: int, the amount of the rated layouts.
+        """
+        if filename is None:
+            filename = resource_path(DIFFICULTY_POOL_FILE)
+        if self.__layouts is not None and \
+                self.get_amount() >= (1 if amount is None else amount):
+            return self.get_amount()
+
+        saved = {}
+        try:
+            with open(filename, encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            None
+        level_data = saved.get(self.__level, {})
+        rated = []
+        if level_data.get("signature") == self.__signature():
+            rated = level_data["layouts"]
+        if amount is None and not rated:
+            amount = DIFFICULTY_POOL_SIZE
+        if amount is not None and len(rated) < amount:
+            # Counts the layouts first, so the rating processes can read the
+            # counts from the file.
+            uniform_layouts(self.__level).count()
+            seeds = [random.getrandbits(64)
+                     for i in range(amount - len(rated))]
+            with Pool(processes) as pool:
+                rated.extend(pool.map(partial(_rated_layout, self.__level),
+                                      seeds, chunksize=50))
+            saved[self.__level] = {"signature": self.__signature(),
+                                   "layouts": rated}
+            try:
+                with open(filename, "w", encoding="utf-8") as file:
+                    json.dump(saved, file, separators=(",", ":"))
+            except OSError:
+                None
+
+        self.__layouts = {}
+        for shots, placements in rated:
+            self.__layouts.setdefault(shots, []).append(placements)
+        return self.get_amount()
+
+    def choose(self, lowest, highest, rng=random):
+        """
+        Chooses a board, whose difficulty is between the given ones. Every
+        rated layout in the range has the same probability. Only the saved
+        layouts are used, so the range should be checked (see get_boards)
+        before the boards are created.
+        :param lowest: int, the smallest difficulty.
+        :param highest: int, the biggest difficulty.
+        :param rng: random.Random, the random generator.
+        :return: Gameboard, the chosen board. None if there isn't any board
+                 of the difficulty.
+        """
+        self.load(0)
+        buckets = [self.__layouts[shots]
+                   for shots in sorted(self.__layouts.keys())
+                   if lowest <= shots <= highest]
+        total = sum(len(bucket) for bucket in buckets)
+        if total == 0:
+            return None
+        index = rng.randrange(total)
+        for bucket in buckets:
+            if index < len(bucket):
+                return layout_board(self.__level, bucket[index])
+            index -= len(bucket)
+
+    def get_amount(self):
+        """
+        Gets the amount of the rated layouts.
+        :return: int, the amount of the layouts.
+        """
+        return sum(len(bucket) for bucket in self.__layouts.values())
+
+    def get_boards(self, lowest, highest):
+        """
+        Gets the amount of the loaded layouts, whose difficulty is between
+        the given ones.
+        :param lowest: int, the smallest difficulty.
+        :param highest: int, the biggest difficulty.
+        :return: int, the amount of the layouts.
+        """
+        if self.__layouts is None:
+            return 0
+        return sum(len(bucket) for shots, bucket in self.__layouts.items()
+                   if lowest <= shots <= highest)
+
+    def get_distribution(self):
+        """
+        Gets the amount of the layouts of every difficulty.
+        :return: dict, the amount of the layouts by the difficulty.
+        """
+        self.load()
+        return {shots: len(self.__layouts[shots])
+                for shots in sorted(self.__layouts.keys())}
+
+
+def rate_board(board, level):
+    """
+    Plays the board with the solver, which always shoots the square of the
+    hint. The exact search isn't stopped by time, so the rating of a board
+    is always the same, also when all CPUs are busy.
+    :param board: Gameboard, the board.
+    :param level: str, the level of the game.
+    :return: int, the amount of the shots to find all heads.
+    """
+    return play_board(Hint_strategy(level, time_limit=None), board, level)
+
+# The difficulty pools of every level.
+_difficulty_pools = {}
+
+def difficulty_pool(level):
+    """
+    Gets the difficulty pool of the level.
+    :param level: str, the level of the game.
+    :return: Difficulty_pool, the pool of the level.
+    """
+    if level not in _difficulty_pools.keys():
+        _difficulty_pools[level] = Difficulty_pool(level)
+    return _difficulty_pools[level]
+
+def _rated_layout(level, seed):
+    """
+    Chooses a layout and rates it in a rating process.
+    :param level: str, the level of the game.
+    :param seed: int, the seed of the random generator.
+    :return: list, the difficulty and the placement numbers of the layout.
+    """
+    placements = uniform_layouts(level).sample_placements(random.Random(seed))
+    return [rate_board(layout_board(level, placements), level), placements]
+
+def parse_difficulty(text):
+    """
+    Changes a difficulty range (for example "15-20" or "25") into numbers.
+    :param text: str, the range or EXPERT.
+    :return: tuple, the smallest and the biggest difficulty. EXPERT for the
+             expert boards.
+    """
+    if text.lower() == EXPERT:
+        return EXPERT
+    lowest, separator, highest = text.partition("-")
+    lowest = int(lowest)
+    return lowest, int(highest) if separator else lowest
+
+
+#===== class Expert_pool ======================================================
+# This class is used to create the expert boards: the layouts, which the
+# solver (see rate_board) needs the most shots for. The best layouts are
+# searched with simulated annealing. A search starts from a new uniformly
+# chosen layout like new_board and changes one aircraft at a time: it is
+# moved one square or turned around its planehead. A harder layout is always
+# taken, and an easier one with the probability exp(-loss / temperature),
+# where the temperature cools down to 0 during the search. The searches are
+# run in parallel processes.
+#
+# A board is chosen from the saved layouts and turned with a random symmetry.
+# The solver doesn't play the symmetric boards in the same way (the ties are
+# broken by the cell numbers), so a layout is rated by the average shots of
+# its 8 symmetric boards: the expected difficulty of the chosen board. The
+# rating is the same for the whole symmetry class, so every process saves
+# the ratings by the canonical layout (see Uniform_layouts.canonical_layout)
+# and the same layout is rated only once. The hardest layout of every search
+# is saved into the file, and the game windows only read them.
+#
+# The solver rates the boards without any time limit (see rate_board), so a
+# rating doesn't depend on the speed or the load of the machine: the same
+# seed always finds the same layout.
+class Expert_pool:
+    """
+    The searched expert layouts of one level.
+    :param self.__level: str, the level of the game.
+    :param self.__layouts: list, the expected difficulty and the placement
+                           numbers of every layout. None if not loaded yet.
+    """
+    def __init__(self, level):
+        """
+        Initializes the pool.
+        :param level: str, the level of the game.
+        """
+        self.__level = level
+        self.__layouts = None
+
+    def __signature(self):
+        """
+        Gets the information, which the difficulties depend on. If the level
+        or the solver is changed, the saved layouts are not used.
+        * This is a private method.
+        :return: list, the size, the amount, the model and the settings of
+                 the hints in the form of the file.
+        """
+        size, amount, model = LEVELS[self.__level]
+        return saved_form([size, amount, model, Hint_engine.HIT_WEIGHT,
+                           ENDGAME_LAYOUTS, ENDGAME_WORK, "exact"])
+
+    def load(self, amount=None, processes=None, steps=EXPERT_STEPS,
+             filename=None):
+        """
+        Loads the expert layouts from the file. If there aren't enough of
+        them, new layouts are searched in parallel and saved into the file.
+        :param amount: int, the smallest amount of the layouts. None means
+                       only the saved layouts are used, so the game windows
+                       never wait for the searches.
+        :param processes: int, the amount of the searching processes. None
+                          means the amount of the CPUs.
+        :param steps: int, the amount of the tried layouts of every search.
+        :param filename: str, the file of the expert layouts. None means the
+                         file next to this program.
+        :return: int, the amount of the expert layouts.
+        """
+        if filename is None:
+            filename = resource_path(EXPERT_POOL_FILE)
+        if self.__layouts is not None and \
+                (amount is None or len(self.__layouts) >= amount):
+            return len(self.__layouts)
+
+        saved = {}
+        try:
+            with open(filename, encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            None
+        level_data = saved.get(self.__level, {})
+        self.__layouts = []
+        if level_data.get("signature") == self.__signature():
+            self.__layouts = level_data["layouts"]
+        if amount is not None and len(self.__layouts) < amount:
+            # Counts the layouts first, so the searching processes can read
+            # the counts from the file.
+            uniform_layouts(self.__level).count()
+            seeds = [random.getrandbits(64)
+                     for i in range(amount - len(self.__layouts))]
+            with Pool(processes) as pool:
+                self.__layouts.extend(pool.map(
+                    partial(_annealed_layout, self.__level, steps), seeds,
+                    chunksize=1))
+            saved[self.__level] = {"signature": self.__signature(),
+                                   "layouts": self.__layouts}
+            try:
+                with open(filename, "w", encoding="utf-8") as file:
+                    json.dump(saved, file, separators=(",", ":"))
+            except OSError:
+                None
+        return len(self.__layouts)
+
+    def choose(self, rng=random):
+        """
+        Chooses an expert board. Every saved layout has the same
+        probability, and it is turned with a random symmetry.
+        :param rng: random.Random, the random generator.
+        :return: Gameboard, the chosen board. None if there aren't any saved
+                 expert boards.
+        """
+        if not self.load():
+            return None
+        shots, placements = rng.choice(self.__layouts)
+        symmetry = rng.choice(uniform_layouts(self.__level).get_symmetries())
+        return layout_board(self.__level,
+                            [symmetry[placement] for placement in placements])
+
+    def get_amount(self):
+        """
+        Gets the amount of the expert layouts.
+        :return: int, the amount of the layouts.
+        """
+        return self.load()
+
+    def get_distribution(self):
+        """
+        Gets the amount of the layouts of every difficulty.
+        :return: dict, the amount of the layouts by the expected difficulty
+                 (rounded).
+        """
+        self.load()
+        distribution = {}
+        for shots, placements in sorted(self.__layouts):
+            distribution[round(shots)] = distribution.get(round(shots), 0) + 1
+        return distribution
+
+
+# The ratings of the layouts in this process by the level and the canonical
+# layout.
+_layout_ratings = {}
+
+def rate_layout(level, placements):
+    """
+    Rates a layout by the average shots of the solver on its 8 symmetric
+    boards. Every symmetry class is rated only once.
+    :param level: str, the level of the game.
+    :param placements: list, the numbers of the placements.
+    :return: float, the expected amount of the shots to find all heads.
+    """
+    layouts = uniform_layouts(level)
+    key = (level, layouts.canonical_layout(placements)[0])
+    if key not in _layout_ratings.keys():
+        shots = [rate_board(layout_board(level, [symmetry[placement]
+                                                 for placement in placements]),
+                            level)
+                 for symmetry in layouts.get_symmetries()]
+        _layout_ratings[key] = round(sum(shots) / len(shots), 3)
+    return _layout_ratings[key]
+
+def anneal_layout(level, steps=EXPERT_STEPS, rng=random):
+    """
+    Searches a hard layout with simulated annealing (see Expert_pool).
+    :param level: str, the level of the game.
+    :param steps: int, the amount of the tried layouts.
+    :param rng: random.Random, the random generator.
+    :return: list, the expected difficulty and the placement numbers of the
+             hardest found layout.
+    """
+    layouts = uniform_layouts(level)
+    masks = layouts.get_masks()
+    moves = layouts.get_moves()
+    placements = layouts.sample_placements(rng)
+    shots = rate_layout(level, placements)
+    best = [shots, sorted(placements)]
+    for step in range(steps):
+        temperature = EXPERT_TEMPERATURE * (1 - step / steps)
+        plane = rng.randrange(len(placements))
+        others = 0
+        for other, placement in enumerate(placements):
+            if other != plane:
+                others |= masks[placement]
+        moved = rng.choice(moves[placements[plane]])
+        if masks[moved] & others:
+            continue
+        changed = placements[:plane] + [moved] + placements[plane + 1:]
+        changed_shots = rate_layout(level, changed)
+        if changed_shots >= shots or rng.random() < exp(
+                (changed_shots - shots) / temperature):
+            placements, shots = changed, changed_shots
+            if shots > best[0]:
+                best = [shots, sorted(placements)]
+    return best
+
+# The expert pools of every level.
+_expert_pools = {}
+
+def expert_pool(level):
+    """
+    Gets the expert pool of the level.
+    :param level: str, the level of the game.
+    :return: Expert_pool, the pool of the level.
+    """
+    if level not in _expert_pools.keys():
+        _expert_pools[level] = Expert_pool(level)
+    return _expert_pools[level]
+
+def _annealed_layout(level, steps, seed):
+    """
+    Searches one expert layout in a searching process.
+    :param level: str, the level of the game.
+    :param steps: int, the amount of the tried layouts.
+    :param seed: int, the seed of the random generator.
+    :return: list, the expected difficulty and the placement numbers of the
+             layout.
+    """
+    return anneal_layout(level, steps, random.Random(seed))
+
+
+#===== Game archive and statistics ============================================
+# The finished games are recorded into the archive file. Every line of the
+# file is one game in JSON-format:
+#   {"level": "EASY", "rounds": 17, "winner": 1,
+#    "players": [{"heads": [...], "bodies": [...], "shots": [...]}, {...}]}
+# The coordinates are cell numbers (y * boardsize + x). The winner is the
+# number of the player (1 to MAX_PLAYERS), or null if the game was a draw.
+# There is an item in "players" for every player.
+#
+# The archives can grow very big, so the statistics read them in chunks and
+# keep only the sums in NumPy arrays.
+def save_game(record, filename=None):
+    """
+    Appends one finished game into the archive.
+    :param record: dict, the game information.
+    :param filename: str, the archive file. None means the file next to this
+                     program.
+    """
+    if filename is None:
+        filename = resource_path(ARCHIVE_FILE)
+    with open(filename, "a", encoding="utf-8") as file:
+        file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+def read_archive(filename=None, chunk_size=10000):
+    """
+    Reads the archive in chunks. Only one chunk is in the memory at a time.
+    :param filename: str, the archive file. None means the file next to this
+                     program.
+    :param chunk_size: int, the biggest amount of games in one chunk.
+    :return: generator, lists of games (dict).
+    """
+    if filename is None:
+        filename = resource_path(ARCHIVE_FILE)
+    with open(filename, encoding="utf-8") as file:
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            yield [json.loads(line) for line in lines if line.strip()]
+
+def generated_games(level, amount, chunk_size=10000, legacy=False):
+    """
+    Creates new gameboards and returns them like games in the archive, but
+    without any shots. These are used to check where the generators put the
+    aircrafts.
+    :param level: str, the level of the game.
+    :param amount: int, the amount of the gameboards.
+    :param chunk_size: int, the biggest amount of games in one chunk.
+    :param legacy: bool, True: uses the old random aircraft generators in
+                   the same way as the game window used them.
+    :return: generator, lists of games (dict).
+    """
+    while amount > 0:
+        chunk = []
+        for i in range(min(amount, chunk_size)):
+            if legacy:
+                board = game_main(level, legacy=True)
+                while board == None:
+                    board = game_main(level, legacy=True)
+            else:
+                board = new_board(level)
+            heads, bodies = board.get_cells()
+            chunk.append({"level": level, "rounds": None, "winner": None,
+                          "players": [{"heads": heads, "bodies": bodies,
+                                       "shots": []}]})
+        amount -= len(chunk)
+        yield chunk
+
+class Game_statistics:
+    """
+    Collects the statistics of the games level by level:
+    heatmaps of the planeheads, the planebodies and the first hits, and the
+    distribution of the rounds-to-win.
+    :param self.__levels: dict, the collected arrays of every level.
+    """
+    def __init__(self):
+        """
+        Initializes the empty statistics.
+        """
+        # NumPy is needed only for the statistics, not for playing the game.
+        import numpy
+        self.__np = numpy
+        self.__levels = {}
+
+    def __level_data(self, level):
+        """
+        Gets the arrays of the level. Creates them, if the level is new.
+        * This is a private method.
+        :param level: str, the level of the game.
+        :return: dict, the arrays of the level.
+        """
+        if level not in self.__levels.keys():
+            size = LEVELS[level][0]
+            self.__levels[level] = {
+                "size": size,
+                "games": 0,
+                "boards": 0,
+                "heads": self.__np.zeros(size * size, dtype=self.__np.int64),
+                "bodies": self.__np.zeros(size * size, dtype=self.__np.int64),
+                "first_hits": self.__np.zeros(size * size,
+                                              dtype=self.__np.int64),
+                "first_hit_shots": self.__np.zeros(size * size + 1,
+                                                   dtype=self.__np.int64),
+                "rounds": self.__np.zeros(size * size + 1,
+                                          dtype=self.__np.int64)}
+        return self.__levels[level]
+
+    def add_games(self, games):
+        """
+        Adds a chunk of games into the statistics.
+        :param games: list, the games (dict) in the archive format.
+        """
+        np = self.__np
+        by_level = {}
+        for game in games:
+            by_level.setdefault(game["level"], []).append(game)
+
+        for level, level_games in by_level.items():
+            data = self.__level_data(level)
+            cells = data["size"] * data["size"]
+            heads = []
+            bodies = []
+            first_hits = []
+            first_hit_shots = []
+            rounds = []
+            for game in level_games:
+                if game["rounds"] is not None:
+                    rounds.append(game["rounds"])
+                for player in game["players"]:
+                    heads.extend(player["heads"])
+                    bodies.extend(player["bodies"])
+                    planes = set(player["heads"]) | set(player["bodies"])
+                    for shot, cell in enumerate(player["shots"]):
+                        if cell in planes:
+                            first_hits.append(cell)
+                            first_hit_shots.append(shot + 1)
+                            break
+
+            data["games"] += len(level_games)
+            data["boards"] += sum(len(game["players"])
+                                  for game in level_games)
+            data["heads"] += np.bincount(heads, minlength=cells)
+            data["bodies"] += np.bincount(bodies, minlength=cells)
+            data["first_hits"] += np.bincount(first_hits, minlength=cells)
+            data["first_hit_shots"] += np.bincount(
+                first_hit_shots, minlength=cells + 1)[:cells + 1]
+            data["rounds"] += np.bincount(rounds,
+                                          minlength=cells + 1)[:cells + 1]
+
+    def add_archive(self, chunks):
+        """
+        Adds all chunks of an archive into the statistics.
+        :param chunks: iterable, lists of games (dict).
+        """
+        for games in chunks:
+            self.add_games(games)
+
+    def get_levels(self):
+        """
+        Gets the levels, which have statistics.
+        :return: list, the names of the levels.
+        """
+        return [level for level in LEVELS.keys()
+                if level in self.__levels.keys()]
+
+    def heatmap(self, level, kind):
+        """
+        Gets a heatmap of the level. The rows of the map are the y-coordinates
+        like in the printed board.
+        :param level: str, the level of the game.
+        :param kind: str, "heads", "bodies" or "first_hits".
+        :return: numpy.ndarray, the counts in a boardsize x boardsize array.
+        """
+        data = self.__levels[level]
+        return data[kind].reshape(data["size"], data["size"])
+
+    def rounds_distribution(self, level):
+        """
+        Gets the distribution of the rounds-to-win. The index of the array is
+        the amount of the rounds.
+        :param level: str, the level of the game.
+        :return: numpy.ndarray, the amount of the games with every round.
+        """
+        return self.__levels[level]["rounds"]
 
-# ----- Creates a new game (event/process) ----------------------------
-def create_game(level, out_board):
+    def edge_bias(self, level):
+        """
+        Compares how often the planeheads are on the edge squares of the
+        board and on the other squares.
+        :param level: str, the level of the game.
+        :return: float, the average amount of heads in an edge square divided
+                 by the average amount of heads in an inner square. 1.0 means
+                 no edge bias. Returns None, if there are no inner heads.
+        """
+        heatmap = self.heatmap(level, "heads")
+        inner = heatmap[1:-1, 1:-1]
+        edge_sum = heatmap.sum() - inner.sum()
+        edge_squares = heatmap.size - inner.size
+        if inner.sum() == 0:
+            return None
+        return (edge_sum / edge_squares) / (inner.sum() / inner.size)
+
+    def __percentile(self, counts, percent):
+        """
+        Gets a percentile from a distribution.
+        * This is a private method.
+        :param counts: numpy.ndarray, the distribution.
+        :param percent: float, the percentile (0-100).
+        :return: int, the value of the percentile.
+        """
+        cumulative = self.__np.cumsum(counts)
+        return int(self.__np.searchsorted(cumulative,
+                                          cumulative[-1] * percent / 100))
+
+    def report(self):
+        """
+        Makes a text report of the statistics.
+        :return: str, the report.
+        """
+        np = self.__np
+        lines = []
+        for level in self.get_levels():
+            data = self.__levels[level]
+            lines.append(f"===== {level}: {data['games']} games, "
+                         f"{data['boards']} boards =====")
+            rounds = data["rounds"]
+            if rounds.sum() > 0:
+                mean = (rounds * np.arange(rounds.size)).sum() / rounds.sum()
+                lines.append(
+                    f"Rounds to win: mean {mean:.1f}, "
+                    f"p50 {self.__percentile(rounds, 50)}, "
+                    f"p90 {self.__percentile(rounds, 90)}, "
+                    f"max {int(np.flatnonzero(rounds)[-1])}")
+            shots = data["first_hit_shots"]
+            if shots.sum() > 0:
+                mean = (shots * np.arange(shots.size)).sum() / shots.sum()
+                lines.append(f"Shots to the first hit: mean {mean:.1f}")
+            bias = self.edge_bias(level)
+            if bias is not None:
+                lines.append(f"Head edge bias: {bias:.2f} "
+                             f"(1.00 = same as inner squares)")
+            for kind in ["heads", "bodies", "first_hits"]:
+                heatmap = self.heatmap(level, kind)
+                if heatmap.sum() == 0:
+                    continue
+                lines.append(f"{kind} (% of boards):")
+                percents = heatmap * 100 / data["boards"]
+                lines.append("   " + "".join(f"{x:>4}" for x in
+                                             ROW[0:data["size"]]))
+                for y in range(data["size"]):
+                    lines.append(f"{y:>3}" + "".join(
+                        f"{value:4.0f}" for value in percents[y]))
+            lines.append("")
+        return "\n".join(lines)
+
+
+#===== class Vector_environment ===============================================
+# This class is used to train computer players. It plays many games at once
+# with NumPy arrays: every game has one board, and one shot is shot on every
+# board at every step. The rules are the same as in Match with one player:
+# a shot reveals the value of the square, a clicked square cannot be shot
+# again, and the game is over when all heads are found. The finished games
+# are started again at once with new boards.
+#
+# The new boards are chosen by rejection: the aircrafts are chosen
+# independently and the layouts with overlapping aircrafts are thrown away.
+# All orders of the aircrafts are as probable, so every layout has the same
+# probability like in Uniform_layouts, but a whole batch is chosen at once.
+class Vector_environment:
     """
-    Creates a new game with random aircrafts. Sometimes the gameboard cannot
-    create at once.
-    * This is the real main function for a game.
+    Many one-player games as NumPy arrays.
+    :param self.__level: str, the level of the game.
+    :param self.__boards: numpy.ndarray, the values of the boards (games x
+                          cells).
+    :param self.__observations: numpy.ndarray, the results of the clicked
+                                squares, UNKNOWN if not clicked (games x
+                                cells).
+    :param self.__heads_left: numpy.ndarray, the not found heads of every
+                              game.
+    :param self.__shots: numpy.ndarray, the shots of every game.
     """
-    if level == "EASY":
-        board = Gameboard(8)
+    # The reward of a head, of a square without a head and of a square,
+    # which is already clicked.
+    REWARD_HEAD = 1.0
+    REWARD_MISS = 0.0
+    REWARD_REPEAT = -1.0
 
-        plane_1 = Random_aircraft_SIMPLE(8).get_aircraft()
-        board.add_aircraft(plane_1.get_coordinates())
+    def __init__(self, level, amount, seed=None):
+        """
+        Creates the games.
+        :param level: str, the level of the game.
+        :param amount: int, the amount of the games.
+        :param seed: int, the seed of the random generator. None for a
+                     random seed.
+        """
+        # NumPy is needed only for the training, not for playing the game.
+        import numpy
+        self.__np = numpy
+        self.__level = level
+        self.__size, self.__amount, model = LEVELS[level]
+        self.__rng = numpy.random.default_rng(seed)
+
+        layouts = uniform_layouts(level)
+        self.__cells = numpy.array(layouts.get_placements(), dtype=numpy.intp)
+        # The placements, which aren't overlapping, as a table.
+        placements = len(self.__cells)
+        self.__fits = numpy.zeros((placements, placements), dtype=bool)
+        for first, after in enumerate(layouts.get_after()):
+            while after:
+                lowest = after & -after
+                after ^= lowest
+                self.__fits[first, lowest.bit_length() - 1] = True
+        self.__fits |= self.__fits.T
+        # The part of the chosen aircrafts, which aren't overlapping.
+        self.__acceptance = layouts.count() * factorial(self.__amount) / \
+            placements ** self.__amount
+
+        cells = self.__size * self.__size
+        self.__rows = numpy.arange(amount)
+        self.__boards = numpy.zeros((amount, cells), dtype=numpy.uint8)
+        self.__observations = numpy.full((amount, cells), UNKNOWN,
+                                         dtype=numpy.uint8)
+        self.__heads_left = numpy.zeros(amount, dtype=numpy.int16)
+        self.__shots = numpy.zeros(amount, dtype=numpy.int32)
+        self.__rewards = numpy.array(
+            [self.REWARD_MISS, self.REWARD_MISS, self.REWARD_HEAD],
+            dtype=numpy.float32)
+        self.reset()
+
+    def sample_layouts(self, amount):
+        """
+        Chooses layouts uniformly.
+        :param amount: int, the amount of the layouts.
+        :return: numpy.ndarray, the placement numbers of the aircrafts of
+                 every layout (layouts x aircrafts).
+        """
+        np = self.__np
+        placements = len(self.__cells)
+        chosen = np.empty((0, self.__amount), dtype=np.intp)
+        while len(chosen) < amount:
+            # Chooses more candidates than needed, because most of them
+            # are thrown away on the harder levels.
+            needed = int(1.2 * (amount - len(chosen)) / self.__acceptance)
+            candidates = self.__rng.integers(
+                placements, size=(needed + 64, self.__amount))
+            valid = np.ones(len(candidates), dtype=bool)
+            for first in range(self.__amount):
+                for second in range(first + 1, self.__amount):
+                    valid &= self.__fits[candidates[:, first],
+                                         candidates[:, second]]
+            chosen = np.concatenate([chosen, candidates[valid]])
+        return chosen[:amount]
+
+    def __start(self, games):
+        """
+        Starts new games with new boards.
+        * This is a private method.
+        :param games: numpy.ndarray, the indexes of the games.
+        """
+        chosen = self.sample_layouts(len(games))
+        self.__boards[games] = BLANKSPACE
+        self.__boards[games[:, None, None], self.__cells[chosen]] = PLANEBODY
+        self.__boards[games[:, None], self.__cells[chosen, 0]] = PLANEHEAD
+        self.__observations[games] = UNKNOWN
+        self.__heads_left[games] = self.__amount
+        self.__shots[games] = 0
+
+    def reset(self):
+        """
+        Starts all games again.
+        :return: numpy.ndarray, the observations (games x size x size). The
+                 array is updated at every step.
+        """
+        self.__start(self.__rows)
+        return self.__observations.reshape(-1, self.__size, self.__size)
 
-        plane_2 = Random_aircraft_SIMPLE(8).get_aircraft()
-        while not board.add_aircraft(plane_2.get_coordinates()):
-            plane_2 = Random_aircraft_SIMPLE(8).get_aircraft()
+    def step(self, actions):
+        """
+        Shoots one square on every board.
+        :param actions: numpy.ndarray, the cell number of the square of every
+                        game.
+        :return: tuple, the observations (games x size x size), the rewards
+                 and the finished games (bool) of this step, and the shots
+                 of every finished game (0 if the game isn't finished). The
+                 observations of the finished games are already the new
+                 games.
+        """
+        np = self.__np
+        actions = np.asarray(actions, dtype=np.intp)
+        results = self.__boards[self.__rows, actions]
+        repeated = self.__observations[self.__rows, actions] != UNKNOWN
+        self.__observations[self.__rows, actions] = results
+
+        rewards = self.__rewards[results]
+        rewards[repeated] = self.REWARD_REPEAT
+        found = (results == PLANEHEAD) & ~repeated
+        self.__heads_left -= found
+        self.__shots += ~repeated
+        dones = self.__heads_left == 0
+        shots = np.where(dones, self.__shots, 0)
+        if dones.any():
+            self.__start(np.flatnonzero(dones))
+        return (self.__observations.reshape(-1, self.__size, self.__size),
+                rewards, dones, shots)
+
+    def get_boards(self):
+        """
+        Gets the boards of the games.
+        :return: numpy.ndarray, the values of the boards (games x size x
+                 size).
+        """
+        return self.__boards.reshape(-1, self.__size, self.__size)
 
-    if level == "MEDIUM":
-        board = Gameboard(10)
+    def get_shots(self):
+        """
+        Gets the shots of the running games.
+        :return: numpy.ndarray, the shots of every game.
+        """
+        return self.__shots
 
-        plane_1 = Random_aircraft_SIMPLE(10).get_aircraft()
-        board.add_aircraft(plane_1.get_coordinates())
 
-        plane_2 = Random_aircraft_SIMPLE(10).get_aircraft()
-        while not board.add_aircraft(plane_2.get_coordinates()):
-            plane_2 = Random_aircraft_SIMPLE(10).get_aircraft()
+#===== class Leaderboard ======================================================
+# This class is used to record the finished games into a local SQLite
+# database. The games are written by a background thread, so the game window
+# never waits for the disk: the thread writes all waiting games in one
+# transaction. The database is in WAL-mode, so the queries can read it while
+# the thread writes.
+#
+# The best games are found by an index. The totals of every level are kept
+# in their own table and updated in the same transaction as the games, so
+# the averages don't need to read the games at all.
+class Leaderboard:
+    """
+    The leaderboard database.
+    :param self.__filename: str, the database file.
+    :param self.__waiting: SimpleQueue, the games, which aren't written yet.
+    :param self.__writer: threading.Thread, the writing thread. None if not
+                          started.
+    :param self.__reader: sqlite3.Connection, the connection of the queries.
+                          None if not opened.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            level TEXT NOT NULL,
+            rounds INTEGER NOT NULL,
+            winner INTEGER,
+            duration REAL NOT NULL,
+            seed INTEGER,
+            played REAL NOT NULL);
+        CREATE INDEX IF NOT EXISTS games_best
+            ON games (level, rounds, duration) WHERE winner IS NOT NULL;
+        CREATE TABLE IF NOT EXISTS level_totals (
+            level TEXT PRIMARY KEY,
+            games INTEGER NOT NULL,
+            rounds INTEGER NOT NULL,
+            duration REAL NOT NULL,
+            draws INTEGER NOT NULL);
+        """
 
-        plane_3 = Random_aircraft_SIMPLE(10).get_aircraft()
-        while not board.add_aircraft(plane_3.get_coordinates()):
-            plane_3 = Random_aircraft_SIMPLE(10).get_aircraft()
+    def __init__(self, filename=None):
+        """
+        Initializes the leaderboard. The database is opened only when it is
+        used.
+        :param filename: str, the database file. None means the file next to
+                         this program.
+        """
+        if filename is None:
+            filename = resource_path(LEADERBOARD_FILE)
+        self.__filename = filename
+        self.__waiting = SimpleQueue()
+        self.__writer = None
+        self.__reader = None
+
+    def __connect(self):
+        """
+        Opens a connection to the database and creates the tables.
+        * This is a private method.
+        :return: sqlite3.Connection, the connection.
+        """
+        connection = sqlite3.connect(self.__filename, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(self.SCHEMA)
+        return connection
 
-    if level == "HARD":
-        board = Gameboard(12)
+    def add(self, level, rounds, winner, duration, seed=None):
+        """
+        Records a finished game. The game is written in the background.
+        :param level: str, the level of the game.
+        :param rounds: int, the amount of the rounds.
+        :param winner: int, the number of the winner (from 1). None if the
+                       game was a draw.
+        :param duration: float, the seconds of the game.
+        :param seed: int, the seed of the boards. None if unknown.
+        """
+        if self.__writer is None:
+            # The thread never keeps the program running. The waiting games
+            # are written at the exit, also if the window isn't closed by
+            # the program.
+            self.__writer = threading.Thread(target=self.__write,
+                                             name="leaderboard", daemon=True)
+            self.__writer.start()
+            atexit.register(self.close)
+        self.__waiting.put((level, rounds, winner, duration, seed,
+                            time.time()))
+
+    def add_match(self, match):
+        """
+        Records a finished match.
+        :param match: Match, the game.
+        """
+        winner = match.get_winner()
+        self.add(match.get_level(), match.get_rounds_played(),
+                 None if winner is None else winner + 1,
+                 match.get_duration(), match.get_seed())
 
-        plane_1 = Random_aircraft_COMPLEX(12).get_aircraft()
-        board.add_aircraft(plane_1.get_coordinates())
+    def __write(self):
+        """
+        Writes the waiting games until the leaderboard is closed. This is run
+        in the writing thread. If a batch can't be written (for example the
+        database is locked or the disk is full), the error is printed and
+        the batch is written once again with the next batch.
+        * This is a private method.
+        """
+        connection = None
+        failed = []
+        running = True
+        while running:
+            games = []
+            flushed = []
+            item = self.__waiting.get()
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    games.append(item)
+                if len(games) >= LEADERBOARD_BATCH:
+                    break
+                try:
+                    item = self.__waiting.get_nowait()
+                except Empty:
+                    break
+            if failed or games:
+                try:
+                    if connection is None:
+                        connection = self.__connect()
+                    self.__insert(connection, failed + games)
+                    failed = []
+                except sqlite3.Error as error:
+                    if failed:
+                        self.__report(f"The leaderboard lost {len(failed)} "
+                                      f"game(s): {error}")
+                    if games:
+                        self.__report(f"The leaderboard can't write "
+                                      f"{len(games)} game(s), they are tried "
+                                      f"once again: {error}")
+                    failed = games
+            for event in flushed:
+                event.set()
+        if failed:
+            try:
+                if connection is None:
+                    connection = self.__connect()
+                self.__insert(connection, failed)
+            except sqlite3.Error as error:
+                self.__report(f"The leaderboard lost {len(failed)} game(s): "
+                              f"{error}")
+        if connection is not None:
+            connection.close()
+
+    def __report(self, message):
+        """
+        Prints an error of the writing thread. The thread must not stop, even
+        if the error can't be printed, because the window waits for it.
+        * This is a private method.
+        :param message: str, the error message.
+        """
+        try:
+            print(message, file=sys.stderr, flush=True)
+        except (OSError, ValueError, AttributeError):
+            None
 
-        plane_2 = Random_aircraft_COMPLEX(12).get_aircraft()
-        while not board.add_aircraft(plane_2.get_coordinates()):
-            plane_2 = Random_aircraft_COMPLEX(12).get_aircraft()
+    def __insert(self, connection, games):
+        """
+        Writes the games and updates the totals in one transaction.
+        * This is a private method.
+        :param connection: sqlite3.Connection, the connection of the thread.
+        :param games: list, the games (tuple).
+        """
+        totals = {}
+        for level, rounds, winner, duration, seed, played in games:
+            total = totals.setdefault(level, [0, 0, 0.0, 0])
+            total[0] += 1
+            total[1] += rounds
+            total[2] += duration
+            total[3] += winner is None
+        with connection:
+            connection.executemany(
+                "INSERT INTO games (level, rounds, winner, duration, seed, "
+                "played) VALUES (?, ?, ?, ?, ?, ?)", games)
+            connection.executemany(
+                "INSERT INTO level_totals VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (level) DO UPDATE SET "
+                "games = games + excluded.games, "
+                "rounds = rounds + excluded.rounds, "
+                "duration = duration + excluded.duration, "
+                "draws = draws + excluded.draws",
+                [(level, *total) for level, total in totals.items()])
+
+    def flush(self):
+        """
+        Waits until the games, which are added before, are written.
+        """
+        if self.__writer is not None:
+            flushed = threading.Event()
+            self.__waiting.put(flushed)
+            flushed.wait()
 
-        plane_3 = Random_aircraft_COMPLEX(12).get_aircraft()
-        while not board.add_aircraft(plane_3.get_coordinates()):
-            plane_3 = Random_aircraft_COMPLEX(12).get_aircraft()
+    def close(self):
+        """
+        Writes the waiting games and stops the writing thread.
+        """
+        if self.__writer is not None:
+            atexit.unregister(self.close)
+            self.__waiting.put(None)
+            self.__writer.join()
+            self.__writer = None
+        if self.__reader is not None:
+            self.__reader.close()
+            self.__reader = None
+
+    def __query(self, sql, parameters=()):
+        """
+        Reads the database.
+        * This is a private method.
+        :param sql: str, the query.
+        :param parameters: tuple, the parameters of the query.
+        :return: list, the rows (tuple).
+        """
+        if self.__reader is None:
+            self.__reader = self.__connect()
+        return self.__reader.execute(sql, parameters).fetchall()
 
-        plane_4 = Random_aircraft_COMPLEX(12).get_aircraft()
-        while not board.add_aircraft(plane_4.get_coordinates()):
-            plane_4 = Random_aircraft_COMPLEX(12).get_aircraft()
+    def best_games(self, level, amount=10):
+        """
+        Gets the best won games of the level: the fewest rounds first, and
+        the shortest time first if the rounds are the same.
+        :param level: str, the level of the game.
+        :param amount: int, the biggest amount of the games.
+        :return: list, the rounds, the winner, the duration, the seed and the
+                 time (time.time) of every game.
+        """
+        return self.__query(
+            "SELECT rounds, winner, duration, seed, played FROM games "
+            "WHERE level = ? AND winner IS NOT NULL "
+            "ORDER BY rounds, duration LIMIT ?", (level, amount))
 
-    # Returns the board value.
-    out_board.put(board)
+    def averages(self):
+        """
+        Gets the averages of every level.
+        :return: dict, the amount of the games, the average rounds, the
+                 average duration and the amount of the draws by the level.
+        """
+        return {level: (games, rounds / games, duration / games, draws)
+                for level, games, rounds, duration, draws in self.__query(
+                    "SELECT level, games, rounds, duration, draws "
+                    "FROM level_totals WHERE games > 0")}
 
-def game_main(level):
+    def report(self, amount=5):
+        """
+        Makes a text of the best games and the averages of every level.
+        :param amount: int, the amount of the best games of every level.
+        :return: str, the text.
+        """
+        try:
+            averages = self.averages()
+        except sqlite3.Error as error:
+            return f"The leaderboard cannot be read: {error}"
+        lines = []
+        for level in LEVELS.keys():
+            if level not in averages.keys():
+                continue
+            games, rounds, duration, draws = averages[level]
+            lines.append(f"{level}: {games} games, {rounds:.1f} rounds and "
+                         f"{duration:.0f} s on average, {draws} draws")
+            for place, (rounds, winner, duration, seed, played) in \
+                    enumerate(self.best_games(level, amount), 1):
+                day = time.strftime("%Y-%m-%d", time.localtime(played))
+                lines.append(f"  {place}. {rounds} rounds, {duration:.0f} s, "
+                             f"player {winner}, {day}, seed {seed}")
+            lines.append("")
+        return "\n".join(lines).strip() or "No games are recorded yet."
+
+# The leaderboard of the program.
+_leaderboard = None
+
+def leaderboard():
     """
-    This function is used to terminate the process during it is timeout. The
-    function returns the None value, if the game's creating process is timeout.
-    :return Gameboard, the gameboard information. If the process is timeout,
-            returns None.
+    Gets the leaderboard. It is opened only once.
+    :return: Leaderboard, the leaderboard.
     """
-    out_board = Queue()
-    # Creates a Process
-    action_process = Process(target=create_game, args=(level, out_board))
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = Leaderboard()
+    return _leaderboard
+
+
+#===== Spectator broadcast ====================================================
+# The spectators can watch a game without the game window. The game window
+# sends every shot to a publisher process, which sends them forward to all
+# spectators over TCP-sockets. The messages are:
+#   Delta:    b"D", player, cell, result, round (2 bytes) - 6 bytes.
+#   Keyframe: b"K", level, boardsize, players, round (2 bytes) and then the
+#             state of every square of every player (one byte per square,
+#             UNKNOWN or the result of the shot).
+# A spectator gets a keyframe, when it joins, and every KEYFRAME_INTERVAL
+# seconds. The numbers are in network byte order.
+DELTA = struct.Struct("!cBBBH")
+KEYFRAME = struct.Struct("!cBBBH")
+
+class Spectator_publisher:
+    """
+    Sends the events of the game window to the publisher process. Sending
+    never waits, so the game doesn't stop, even if the spectators are slow.
+    :param self.__events: Queue, the events to the publisher process.
+    :param self.__process: Process, the publisher process.
+    """
+    def __init__(self, port):
+        """
+        Starts the publisher process and waits, until it has opened the
+        port.
+        :param port: int, the TCP-port of the spectators.
+        :raise OSError: if the publisher process can't use the port.
+        """
+        self.__events = Queue()
+        receiver, sender = Pipe(duplex=False)
+        self.__process = Process(target=run_spectator_server,
+                                 args=(port, self.__events, sender),
+                                 daemon=True)
+        self.__process.start()
+        sender.close()
+        try:
+            if receiver.poll(SPECTATOR_START_TIME):
+                error = receiver.recv()
+            else:
+                error = "the publisher process didn't start in time"
+        except EOFError:
+            error = "the publisher process stopped"
+        finally:
+            receiver.close()
+        if error is not None:
+            self.__process.terminate()
+            self.__process.join()
+            self.__events.close()
+            raise OSError(f"The broadcast can't use the port {port}: "
+                          f"{error}")
+
+    def __put(self, event):
+        """
+        Sends an event to the publisher process. If the process has
+        stopped, the events are thrown away, so they don't pile up in the
+        queue.
+        * This is a private method.
+        :param event: tuple, the event.
+        """
+        if self.__process.is_alive():
+            self.__events.put(event)
 
-    # Starts the process and blockes for 3 seconds.
-    action_process.start()
-    action_process.join(timeout=3)
+    def new_game(self, level, players=2):
+        """
+        Tells that a new game is started.
+        :param level: str, the level of the game.
+        :param players: int, the amount of the players.
+        """
+        self.__put(("new", level, players))
 
-    # Terminates the process.
-    action_process.terminate()
-    # If the process is timeout, returns None. Otherwise returns the
-    # gameboard information.
-    if action_process.exitcode != 0:
+    def shot(self, player, cell, result, round):
+        """
+        Tells a shot.
+        :param player: int, the index of the player.
+        :param cell: int, the cell number of the square.
+        :param result: int, BLANKSPACE, PLANEBODY or PLANEHEAD.
+        :param round: int, the round counter of the game.
+        """
+        self.__put(("shot", player, cell, result, round))
+
+    def close(self):
+        """
+        Stops the publisher process.
+        """
+        self.__events.put(None)
+        self.__process.join(timeout=1)
+        self.__process.terminate()
+        self.__events.close()
+
+
+class Spectator_server:
+    """
+    The publisher process. Keeps the state of the game and sends the deltas
+    and the keyframes to the spectators.
+    :param self.__selector: selectors.DefaultSelector, the sockets.
+    :param self.__buffers: dict, the waiting bytes of every spectator.
+    :param self.__lengths: dict, the lengths of the waiting messages of every
+                           spectator.
+    :param self.__sent: dict, the sent bytes of the first waiting message of
+                        every spectator.
+    :param self.__level: str, the level of the game. None before any game.
+    :param self.__boards: list, the square states of every player.
+    """
+    def __init__(self, port, events, host="127.0.0.1"):
+        """
+        Opens the listening socket.
+        :param port: int, the TCP-port of the spectators.
+        :param events: Queue, the events from the game window.
+        :param host: str, the address of the listening socket.
+        """
+        self.__events = events
+        self.__selector = selectors.DefaultSelector()
+        self.__listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__listener.bind((host, port))
+        self.__listener.listen(128)
+        self.__listener.setblocking(False)
+        self.__selector.register(self.__listener, selectors.EVENT_READ)
+        self.__buffers = {}
+        self.__lengths = {}
+        self.__sent = {}
+        self.__level = None
+        self.__size = 0
+        self.__boards = []
+        self.__round = 0
+        self.__next_keyframe = time.monotonic() + KEYFRAME_INTERVAL
+
+    def run(self):
+        """
+        Sends the events to the spectators until the game window stops.
+        """
+        while True:
+            for key, mask in self.__selector.select(timeout=0.02):
+                if key.fileobj is self.__listener:
+                    self.__accept()
+                elif mask & selectors.EVENT_READ:
+                    self.__receive(key.fileobj)
+                elif mask & selectors.EVENT_WRITE:
+                    self.__send(key.fileobj)
+
+            while True:
+                try:
+                    event = self.__events.get_nowait()
+                except Empty:
+                    break
+                if event is None:
+                    return
+                self.__handle(event)
+
+            if time.monotonic() >= self.__next_keyframe:
+                self.__next_keyframe = time.monotonic() + KEYFRAME_INTERVAL
+                if self.__level is not None:
+                    self.__broadcast(self.__keyframe())
+
+    def __handle(self, event):
+        """
+        Updates the state by an event and sends it to the spectators.
+        * This is a private method.
+        :param event: tuple, the event from the game window.
+        """
+        if event[0] == "new":
+            self.__level = event[1]
+            self.__size = LEVELS[self.__level][0]
+            self.__boards = [bytearray([UNKNOWN]) * self.__size ** 2
+                             for player in range(event[2])]
+            self.__round = 0
+            self.__broadcast(self.__keyframe())
+        elif event[0] == "shot" and self.__level is not None:
+            player, cell, result, round = event[1:]
+            self.__boards[player][cell] = result
+            self.__round = round
+            self.__broadcast(DELTA.pack(b"D", player, cell, result, round))
+
+    def __keyframe(self):
+        """
+        Makes a keyframe of the state.
+        * This is a private method.
+        :return: bytes, the keyframe message.
+        """
+        header = KEYFRAME.pack(b"K", list(LEVELS.keys()).index(self.__level),
+                               self.__size, len(self.__boards), self.__round)
+        return header + b"".join(self.__boards)
+
+    def __accept(self):
+        """
+        Accepts a new spectator and sends the state to it.
+        * This is a private method.
+        """
+        try:
+            connection, address = self.__listener.accept()
+        except OSError:
+            return
+        connection.setblocking(False)
+        self.__buffers[connection] = bytearray()
+        self.__lengths[connection] = deque()
+        self.__sent[connection] = 0
+        self.__selector.register(connection, selectors.EVENT_READ)
+        if self.__level is not None:
+            self.__queue(connection, self.__keyframe())
+
+    def __receive(self, connection):
+        """
+        Reads from a spectator. The spectators don't send anything, so this
+        only finds the closed connections.
+        * This is a private method.
+        :param connection: socket, the spectator.
+        """
+        try:
+            data = connection.recv(1024)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self.__drop(connection)
+
+    def __broadcast(self, message):
+        """
+        Sends a message to all spectators.
+        * This is a private method.
+        :param message: bytes, the message.
+        """
+        for connection in list(self.__buffers.keys()):
+            self.__queue(connection, message)
+
+    def __queue(self, connection, message):
+        """
+        Adds a message into the buffer of a spectator and sends as much as
+        the socket takes now. If the buffer is full, the old messages are
+        thrown away and a new keyframe is sent instead. The rest of a partly
+        sent message is kept, so the spectator never gets half a message.
+        * This is a private method.
+        :param connection: socket, the spectator.
+        :param message: bytes, the message.
+        """
+        buffer = self.__buffers[connection]
+        lengths = self.__lengths[connection]
+        if len(buffer) + len(message) > SPECTATOR_BUFFER:
+            if self.__sent[connection] > 0:
+                del buffer[lengths[0] - self.__sent[connection]:]
+                while len(lengths) > 1:
+                    lengths.pop()
+            else:
+                buffer.clear()
+                lengths.clear()
+            message = self.__keyframe()
+        buffer += message
+        lengths.append(len(message))
+        self.__send(connection)
+
+    def __send(self, connection):
+        """
+        Sends the waiting bytes of a spectator without waiting.
+        * This is a private method.
+        :param connection: socket, the spectator.
+        """
+        buffer = self.__buffers.get(connection)
+        if buffer is None:
+            return
+        try:
+            sent = connection.send(buffer)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self.__drop(connection)
+            return
+        del buffer[:sent]
+        # Finds the first message, which isn't sent wholly.
+        lengths = self.__lengths[connection]
+        self.__sent[connection] += sent
+        while lengths and self.__sent[connection] >= lengths[0]:
+            self.__sent[connection] -= lengths.popleft()
+        events = selectors.EVENT_READ
+        if buffer:
+            events |= selectors.EVENT_WRITE
+        self.__selector.modify(connection, events)
+
+    def __drop(self, connection):
+        """
+        Closes the connection of a spectator.
+        * This is a private method.
+        :param connection: socket, the spectator.
+        """
+        if connection in self.__buffers.keys():
+            del self.__buffers[connection]
+            del self.__lengths[connection]
+            del self.__sent[connection]
+            self.__selector.unregister(connection)
+            connection.close()
+
+def run_spectator_server(port, events, ready):
+    """
+    The main function of the publisher process.
+    :param port: int, the TCP-port of the spectators.
+    :param events: Queue, the events from the game window.
+    :param ready: Connection, gets None, when the port is open, or the
+                  error, if it can't be opened.
+    """
+    try:
+        server = Spectator_server(port, events)
+    except OSError as error:
+        ready.send(str(error))
+        ready.close()
+        return
+    ready.send(None)
+    ready.close()
+    server.run()
+
+def watch(host, port):
+    """
+    Watches a broadcasted game and prints the boards after every shot.
+    :param host: str, the address of the publisher.
+    :param port: int, the TCP-port of the publisher.
+    """
+    connection = socket.create_connection((host, port))
+    data = bytearray()
+    level = None
+    boards = []
+    round = 0
+    while True:
+        received = connection.recv(4096)
+        if not received:
+            print("The broadcast is over.")
+            return
+        data += received
+        changed = False
+        while data:
+            if data[0:1] == b"D":
+                if len(data) < DELTA.size:
+                    break
+                kind, player, cell, result, round = DELTA.unpack_from(data)
+                if boards:
+                    boards[player][cell] = result
+                del data[:DELTA.size]
+            elif data[0:1] == b"K":
+                if len(data) < KEYFRAME.size:
+                    break
+                kind, level_index, size, players, round = \
+                    KEYFRAME.unpack_from(data)
+                length = KEYFRAME.size + players * size * size
+                if len(data) < length:
+                    break
+                level = list(LEVELS.keys())[level_index]
+                boards = [bytearray(data[KEYFRAME.size + player * size * size:
+                                         KEYFRAME.size
+                                         + (player + 1) * size * size])
+                          for player in range(players)]
+                del data[:length]
+            else:
+                # The stream can't be followed after an unknown message.
+                print("The broadcast has a broken message.")
+                connection.close()
+                return
+            changed = True
+        if changed and level is not None:
+            print_spectator_view(level, boards, round)
+
+def print_spectator_view(level, boards, round):
+    """
+    Prints the boards of a watched game.
+    :param level: str, the level of the game.
+    :param boards: list, the square states of every player.
+    :param round: int, the round counter of the game.
+    """
+    print(f"Level: {level}   Round: {round // len(boards) + 1}")
+    for line in board_lines(boards, LEVELS[level][0]):
+        print(line)
+    print()
+
+
+#===== class Text_game ========================================================
+# This class is used to play the game in a terminal without the game window,
+# for example over SSH. The rules are the same as in the game window. The
+# screen is drawn with ANSI-codes and only the changed lines are drawn
+# again. If the output isn't a terminal, only the changed lines are printed.
+class Text_game:
+    """
+    The terminal game.
+    :param self.__level: str, the level of the game.
+    :param self.__match: Match, the game.
+    :param self.__shown: list, the lines on the screen now.
+    :param self.__message: str, the message on the last line.
+    """
+    # The symbols of UNKNOWN and the results, and the symbol of the hint.
+    TEXT_SYMBOLS = [" o", " *", " X", " ."]
+    HINT_SYMBOL = " ?"
+
+    def __init__(self, level, output=sys.stdout, difficulty=None, players=2):
+        """
+        Initializes the game.
+        :param level: str, the level of the game.
+        :param output: file, the terminal.
+        :param difficulty: tuple, the smallest and the biggest difficulty of
+                           the boards on the given level. EXPERT chooses the
+                           expert boards and None any board.
+        :param players: int, the amount of the players.
+        """
+        self.__level = level
+        self.__players = players
+        self.__difficulty = {}
+        if difficulty is not None:
+            self.__difficulty[level] = difficulty
+        self.__output = output
+        self.__ansi = output.isatty()
+        self.__shown = []
+        self.__new_game()
+
+    def __new_game(self):
+        """
+        Starts a new game on the chosen level.
+        * This is a private method.
+        """
+        difficulty = self.__difficulty.get(self.__level)
+        seed = random.getrandbits(32)
+        boards = [new_board(self.__level,
+                            random.Random(board_seed(seed, player)),
+                            difficulty)
+                  for player in range(self.__players)]
+        self.__match = Match(self.__level, boards, seed)
+        self.__hint_square = None
+        self.__message = ("Type a square (e.g. C5), 'hint', 'new', "
+                          "'level EASY/MEDIUM/HARD' or 'quit'.")
+
+    def __lines(self):
+        """
+        Makes the lines of the screen.
+        * This is a private method.
+        :return: list, the lines (str).
+        """
+        size = LEVELS[self.__level][0]
+        match = self.__match
+        states = []
+        for player in range(match.get_players()):
+            state = bytearray([UNKNOWN]) * (size * size)
+            for cell, result in match.get_revealed(player).get_cells().items():
+                state[cell] = result
+            states.append(state)
+
+        width = 3 + 2 * size
+        lines = [f"Aircraft Head Hunting Game   Level: {self.__level}   "
+                 f"Round: {match.get_rounds_played()}", ""]
+        lines.append("    ".join(f"   Player {player + 1}".ljust(width)
+                                 for player in range(match.get_players())))
+        lines.extend(board_lines(states, size, self.TEXT_SYMBOLS,
+                                 self.__hint_square))
+        lines.append("    ".join(
+            f"{match.get_heads_left(player)} heads to find".ljust(width)
+            for player in range(match.get_players())))
+        if match.is_over():
+            winners = match.get_winners()
+            if len(winners) == 1:
+                lines.append(f"GAME IS OVER: Player {winners[0] + 1} "
+                             f"won the game!!!")
+            elif len(winners) == match.get_players():
+                lines.append("GAME IS OVER: The game is a draw!")
+            else:
+                lines.append("GAME IS OVER: The game is a draw between "
+                             "players " + ", ".join(str(winner + 1)
+                                                    for winner in winners)
+                             + "!")
+        else:
+            lines.append(f"Player {match.get_turn() + 1}: your turn!")
+        lines.append(self.__message)
+        return lines
+
+    def __draw(self):
+        """
+        Draws the changed lines of the screen.
+        * This is a private method.
+        """
+        lines = self.__lines()
+        if len(lines) != len(self.__shown):
+            if self.__ansi:
+                self.__output.write("\x1b[2J")
+            self.__shown = [None] * len(lines)
+        for row, line in enumerate(lines):
+            if line != self.__shown[row]:
+                if self.__ansi:
+                    self.__output.write(f"\x1b[{row + 1};1H{line}\x1b[K")
+                else:
+                    self.__output.write(line + "\n")
+                self.__shown[row] = line
+        if self.__ansi:
+            # Moves the cursor to the input line.
+            self.__output.write(f"\x1b[{len(lines) + 1};1H\x1b[K")
+        self.__output.flush()
+
+    def __command(self, command):
+        """
+        Handles one command of the player.
+        * This is a private method.
+        :param command: str, the typed command.
+        :return: bool, False if the player wants to quit.
+        """
+        words = command.upper().split()
+        self.__message = ""
+        if not words:
+            return True
+        if words[0] == "QUIT":
+            return False
+        if words[0] == "NEW":
+            self.__new_game()
+        elif words[0] == "LEVEL" and len(words) == 2 and words[1] in LEVELS:
+            self.__level = words[1]
+            self.__new_game()
+        elif self.__match.is_over():
+            self.__message = "The game is over. Type 'new' or 'quit'."
+        elif words[0] == "HINT":
+            self.__hint_square = (self.__match.get_turn(),
+                                  hint_engine(self.__level).best_cell(
+                                      self.__match.get_revealed(
+                                          self.__match.get_turn())))
+        else:
+            cell = parse_square(words[0], LEVELS[self.__level][0])
+            if cell is None:
+                self.__message = f"'{command}' isn't a square on the board."
+            elif self.__match.shoot(cell) is None:
+                self.__message = f"{words[0]} is already clicked."
+            else:
+                self.__hint_square = None
+                if self.__match.is_over():
+                    try:
+                        save_game(self.__match.get_record())
+                    except OSError:
+                        None
+                    leaderboard().add_match(self.__match)
+        return True
+
+    def start(self):
+        """
+        Plays the game until the player quits.
+        """
+        while True:
+            self.__draw()
+            try:
+                command = input("> ")
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not self.__command(command):
+                break
+        if self.__ansi:
+            self.__output.write("\n")
+        leaderboard().close()
+
+
+def parse_square(text, size):
+    """
+    Changes the name of a square (for example "C5") into a cell number.
+    :param text: str, the name of the square.
+    :param size: int, the size of the gameboard.
+    :return: int, the cell number. None if the name isn't valid.
+    """
+    text = text.upper()
+    if len(text) < 2 or text[0] not in ROW[0:size] or \
+            not text[1:].isdigit():
         return None
-    else:
-        board = out_board.get()
-        return board
+    x = ROW.index(text[0])
+    y = int(text[1:])
+    if y >= size:
+        return None
+    return y * size + x
+
+def board_lines(boards, size, symbols=SYMBOLS + [" ."], hint=None):
+    """
+    Makes the text lines of the boards side by side.
+    :param boards: list, the state (UNKNOWN or the result) of every square
+                   of every player's board.
+    :param size: int, the size of the gameboard.
+    :param symbols: list, the symbols of the results and UNKNOWN.
+    :param hint: tuple, the player and the cell of a hint square or None.
+    :return: list, the lines (str).
+    """
+    lines = ["    ".join("   " + "".join(f" {x}" for x in ROW[0:size])
+                         for board in boards)]
+    for y in range(size):
+        line = []
+        for player, board in enumerate(boards):
+            squares = [symbols[board[y * size + x]] for x in range(size)]
+            if hint is not None and hint[0] == player and \
+                    hint[1] // size == y:
+                squares[hint[1] % size] = Text_game.HINT_SYMBOL
+            line.append(f"{y:>3}" + "".join(squares))
+        lines.append("    ".join(line))
+    return lines
+
+
+#===== Profiling ==============================================================
+# The profiling is used to find out, which handlers of the game window are
+# slow. It is off by default and then it costs nothing. With --profile the
+# handlers are wrapped and the latency of every call is counted into a
+# histogram with fixed buckets. With --profile=cprofile or
+# --profile=tracemalloc the handlers are also profiled or the memory
+# allocations are traced. The results are printed at exit and they can be
+# seen in the Help-menu.
+class Latency_histogram:
+    """
+    The latencies of one handler.
+    :param self.__counts: list, the amount of calls in every bucket.
+    :param self.__max: float, the longest latency (ms).
+    """
+    def __init__(self):
+        """
+        Initializes an empty histogram.
+        """
+        self.__counts = [0] * len(LATENCY_BUCKETS)
+        self.__total = 0
+        self.__max = 0.0
+
+    def record(self, milliseconds):
+        """
+        Records the latency of one call.
+        :param milliseconds: float, the latency.
+        """
+        self.__counts[bisect_right(LATENCY_BUCKETS[:-1], milliseconds)] += 1
+        self.__total += 1
+        self.__max = max(self.__max, milliseconds)
+
+    def percentile(self, percent):
+        """
+        Gets a percentile of the latencies. The value is the upper limit of
+        the bucket, so it is never smaller than the real value.
+        :param percent: float, the percentile (0-100).
+        :return: float, the latency (ms). None if there are no calls.
+        """
+        if self.__total == 0:
+            return None
+        limit = self.__total * percent / 100
+        amount = 0
+        for bucket, count in enumerate(self.__counts):
+            amount += count
+            if amount >= limit:
+                return min(LATENCY_BUCKETS[bucket], self.__max)
+        return self.__max
+
+    def get_total(self):
+        """
+        Gets the amount of the calls.
+        :return: int, the amount of the calls.
+        """
+        return self.__total
+
+    def get_max(self):
+        """
+        Gets the longest latency.
+        :return: float, the latency (ms).
+        """
+        return self.__max
+
+
+class Profiler:
+    """
+    Wraps the handlers and collects their latencies.
+    :param self.__mode: str, "latency", "cprofile" or "tracemalloc".
+    :param self.__histograms: dict, the histogram of every handler.
+    :param self.__profile: cProfile.Profile, the profile in cprofile-mode.
+    :param self.__depth: int, the amount of the running wrapped calls.
+    """
+    def __init__(self, mode="latency"):
+        """
+        Initializes the profiler.
+        :param mode: str, "latency", "cprofile" or "tracemalloc".
+        """
+        self.__mode = mode
+        self.__histograms = {}
+        self.__profile = None
+        self.__depth = 0
+        if mode == "cprofile":
+            import cProfile
+            self.__profile = cProfile.Profile()
+        elif mode == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start(10)
+
+    def wrap(self, function, name):
+        """
+        Wraps a function, so its latencies are recorded.
+        :param function: function, the wrapped function.
+        :param name: str, the name in the report.
+        :return: function, the wrapper.
+        """
+        histogram = self.__histograms.setdefault(name, Latency_histogram())
+
+        def wrapper(*args, **kwargs):
+            # Only the outermost wrapped call turns the cProfile on and off.
+            self.__depth += 1
+            if self.__profile is not None and self.__depth == 1:
+                self.__profile.enable()
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.record((time.perf_counter() - start) * 1000)
+                if self.__profile is not None and self.__depth == 1:
+                    self.__profile.disable()
+                self.__depth -= 1
+        wrapper.__wrapped__ = function
+        wrapper.__name__ = function.__name__
+        return wrapper
+
+    def report(self):
+        """
+        Makes a text report of the latencies.
+        :return: str, the report.
+        """
+        lines = [f"{'handler':<20}{'calls':>8}{'p50':>9}{'p95':>9}"
+                 f"{'p99':>9}{'max':>10}  (ms)"]
+        for name, histogram in self.__histograms.items():
+            if histogram.get_total() == 0:
+                continue
+            lines.append(f"{name:<20}{histogram.get_total():>8}"
+                         f"{histogram.percentile(50):>9.1f}"
+                         f"{histogram.percentile(95):>9.1f}"
+                         f"{histogram.percentile(99):>9.1f}"
+                         f"{histogram.get_max():>10.1f}")
+        return "\n".join(lines)
+
+    def dump(self, output=sys.stderr):
+        """
+        Prints the report and the cProfile or tracemalloc results.
+        :param output: file, where the results are printed.
+        """
+        print(self.report(), file=output)
+        if self.__mode == "cprofile":
+            import pstats
+            self.__profile.dump_stats("profile.prof")
+            print("\ncProfile of the handlers (saved to profile.prof):",
+                  file=output)
+            pstats.Stats(self.__profile, stream=output) \
+                .sort_stats("cumulative").print_stats(15)
+        elif self.__mode == "tracemalloc":
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            print("\nThe biggest memory allocations:", file=output)
+            for statistic in snapshot.statistics("lineno")[:10]:
+                print(statistic, file=output)
+
+# The profiler, if the profiling is on.
+_profiler = None
+
+def enable_profiling(mode="latency"):
+    """
+    Turns the profiling on. The handlers of the game window, the board
+    creating, which the window waits for, and the widget updates are
+    wrapped. This must be called before the game window is created.
+    :param mode: str, "latency", "cprofile" or "tracemalloc".
+    :return: Profiler, the profiler.
+    """
+    global _profiler
+    _profiler = Profiler(mode)
+    for name in ["__create_board", "__update_board", "__boardButton",
+                 "__disabled_buttons"]:
+        attribute = "_Find_Aircraft_Head_Game" + name
+        setattr(Find_Aircraft_Head_Game, attribute,
+                _profiler.wrap(getattr(Find_Aircraft_Head_Game, attribute),
+                               name.strip("_")))
+    Render_scheduler.flush = _profiler.wrap(Render_scheduler.flush,
+                                            "render flush")
+    Session_manager.take_boards = _profiler.wrap(
+        Session_manager.take_boards, "take boards")
+    Session_manager.create_boards = _profiler.wrap(
+        Session_manager.create_boards, "create boards")
+    atexit.register(_profiler.dump)
+    return _profiler
+
+
+#===== Soak test ==============================================================
+# The soak test starts a lot of new games in the same window and checks that
+# the memory, the open files and the Tk objects don't grow. If there is no
+# display, the test is run in a virtual display (Xvfb). The program exits
+# with status 1, if a resource grew, so a short run (for example --soak 20)
+# works as a smoke test in CI.
+def start_virtual_display():
+    """
+    Starts a virtual display (Xvfb), if there is no display.
+    :return: subprocess.Popen, the Xvfb process. None if there already is a
+             display.
+    """
+    if os.environ.get("DISPLAY"):
+        return None
+    for number in range(99, 200):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            continue
+        try:
+            display = subprocess.Popen(
+                ["Xvfb", f":{number}", "-screen", "0", "1280x1024x24",
+                 "-nolisten", "tcp"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            raise RuntimeError("There is no display and Xvfb isn't installed.")
+        # Waits until the display is ready.
+        for wait in range(50):
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                os.environ["DISPLAY"] = f":{number}"
+                return display
+            if display.poll() is not None:
+                break
+            time.sleep(0.1)
+        display.terminate()
+    raise RuntimeError("The virtual display cannot be started.")
+
+def process_resources():
+    """
+    Gets the memory usage and the amount of the open files of this process.
+    :return: dict, "rss" (kB) and "fds". None if they cannot be read.
+    """
+    resources = {"rss": None, "fds": None}
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        resources["rss"] = pages * os.sysconf("SC_PAGE_SIZE") // 1024
+        resources["fds"] = len(os.listdir("/proc/self/fd"))
+    except (OSError, ValueError, AttributeError):
+        None
+    return resources
+
+def soak_test(cycles, level="EASY", output=sys.stdout):
+    """
+    Starts new games again and again and prints the resources.
+    :param cycles: int, the amount of the new games.
+    :param level: str, the level of the game.
+    :param output: file, where the results are printed.
+    :return: dict, the growth of every resource from the first report to the
+             last one.
+    """
+    display = start_virtual_display()
+    try:
+        ui = Find_Aircraft_Head_Game(level)
+        ui.restart()
+        report_every = max(1, cycles // 20)
+        first = None
+        for cycle in range(cycles + 1):
+            if cycle % report_every == 0 or cycle == cycles:
+                counts = process_resources()
+                counts.update(ui.tk_object_counts())
+                if first is None:
+                    first = counts
+                print(f"cycle {cycle:>6}: " + ", ".join(
+                    f"{name} {value}" for name, value in counts.items()),
+                    file=output, flush=True)
+            if cycle < cycles:
+                ui.restart()
+        growth = {name: counts[name] - first[name]
+                  for name in counts.keys() if counts[name] is not None}
+        print("growth: " + ", ".join(f"{name} {value:+}"
+                                     for name, value in growth.items()),
+              file=output)
+        ui.close()
+        return growth
+    finally:
+        if display is not None:
+            display.terminate()
+
+def soak_leaks(growth):
+    """
+    Finds the resources, which grew in the soak test.
+    :param growth: dict, the growth of every resource (see soak_test).
+    :return: list, the names of the resources, which grew too much.
+    """
+    return [name for name, value in growth.items()
+            if value > (SOAK_MEMORY_GROWTH if name == "rss" else 0)]
+
+
+#===== UI benchmark ===========================================================
+# The benchmark plays whole games in the game window with synthetic clicks and
+# measures how long the window needs until the display has the new picture:
+# after a click of a board square, after a new game (the whole board is
+# created again) and after opening the help window. The results are written
+# as JSON, so two runs (for example before and after a change) can be
+# compared. If there is no display, the benchmark is run in Xvfb. The
+# program exits with status 1, if the clicks are over the budget, so the
+# benchmark can be run in CI.
+def latency_summary(times):
+    """
+    Summarizes the measured times.
+    :param times: list, the times in seconds.
+    :return: dict, the amount of the times and the mean, the median, the 95th
+             percentile and the maximum in milliseconds.
+    """
+    times = sorted(times)
+    if not times:
+        return {"count": 0}
+    def percentile(percent):
+        return times[min(len(times) - 1, int(len(times) * percent / 100))]
+    return {"count": len(times),
+            "mean_ms": round(1000 * sum(times) / len(times), 3),
+            "p50_ms": round(1000 * percentile(50), 3),
+            "p95_ms": round(1000 * percentile(95), 3),
+            "max_ms": round(1000 * times[-1], 3)}
+
+def ui_benchmark(games=BENCHMARK_GAMES, seed=0, output=sys.stdout):
+    """
+    Plays games on every level in the game window and measures the latencies.
+    The squares are clicked in a random order, which is the same in every
+    run with the same seed.
+    :param games: int, the amount of the games on every level.
+    :param seed: int, the seed of the click order.
+    :param output: file, where the JSON results are written.
+    :return: dict, the results. "over_budget" has the levels, whose clicks
+             were over BENCHMARK_CLICK_BUDGET.
+    """
+    rng = random.Random(seed)
+    display = start_virtual_display()
+    try:
+        ui = Find_Aircraft_Head_Game("EASY", messages=False)
+        results = {"python": sys.version.split()[0],
+                   "tk": str(TkVersion), "games": games, "seed": seed,
+                   "levels": {}}
+        for level, (size, _, _) in LEVELS.items():
+            ui.choose_level(level)
+            new_game_times = []
+            click_times = []
+            for game in range(games):
+                start = time.perf_counter()
+                ui.restart()
+                ui.repaint()
+                new_game_times.append(time.perf_counter() - start)
+                ui.press_start()
+                ui.repaint()
+                players = ui.get_players()
+                orders = [rng.sample(range(size * size), size * size)
+                          for player in range(players)]
+                turn = 0
+                while not ui.is_over():
+                    cell = orders[turn].pop()
+                    start = time.perf_counter()
+                    if ui.press_square(cell):
+                        ui.repaint()
+                        click_times.append(time.perf_counter() - start)
+                        turn = (turn + 1) % players
+            results["levels"][level] = {
+                "update_board": latency_summary(new_game_times),
+                "click": latency_summary(click_times)}
+
+        help_times = []
+        for game in range(games):
+            start = time.perf_counter()
+            help_window = ui.open_help()
+            ui.repaint()
+            help_times.append(time.perf_counter() - start)
+            help_window.close_help()
+            ui.repaint()
+        results["help_window"] = latency_summary(help_times)
+        results["over_budget"] = [
+            level for level, latencies in results["levels"].items()
+            if latencies["click"].get("p95_ms", 0) > BENCHMARK_CLICK_BUDGET]
+        ui.close()
+        json.dump(results, output, indent=2)
+        print(file=output)
+        return results
+    finally:
+        if display is not None:
+            display.terminate()
+
 
 def main():
-    ui = Find_Aircraft_Head_Game("EASY")
-    ui.start()
+    parser = argparse.ArgumentParser(
+        description="Aircraft Head Hunting Game. Without options opens the "
+                    "game window.")
+    parser.add_argument("--stats", metavar="ARCHIVE", nargs="?",
+                        const=resource_path(ARCHIVE_FILE),
+                        help="prints the statistics of the recorded games")
+    parser.add_argument("--stats-generated", metavar="AMOUNT", type=int,
+                        help="prints the statistics of AMOUNT new random "
+                             "boards of every level")
+    parser.add_argument("--legacy", action="store_true",
+                        help="uses the old random aircraft generators in "
+                             "--stats-generated")
+    parser.add_argument("--count-layouts", action="store_true",
+                        help="counts the layouts of every level in parallel "
+                             "and saves the counts")
+    parser.add_argument("--broadcast", metavar="PORT", type=int,
+                        help="lets spectators watch the game at PORT")
+    parser.add_argument("--watch", metavar="HOST:PORT",
+                        help="watches a broadcasted game")
+    parser.add_argument("--text", action="store_true",
+                        help="plays the game in the terminal")
+    parser.add_argument("--level", choices=list(LEVELS.keys()),
+                        default="EASY", help="the level of the game")
+    parser.add_argument("--difficulty", metavar="LOWEST-HIGHEST",
+                        type=parse_difficulty,
+                        help="plays only boards, which the solver finds in "
+                             "LOWEST-HIGHEST shots (on the chosen level), or "
+                             "the expert boards with 'expert'")
+    parser.add_argument("--difficulty-pool", metavar="AMOUNT", nargs="?",
+                        type=int, const=DIFFICULTY_POOL_SIZE,
+                        help="rates AMOUNT boards of every level in parallel, "
+                             "saves them and prints the difficulties")
+    parser.add_argument("--expert-pool", metavar="AMOUNT", nargs="?",
+                        type=int, const=EXPERT_POOL_SIZE,
+                        help="searches AMOUNT expert boards of every level "
+                             "in parallel, saves them and prints the "
+                             "difficulties")
+    parser.add_argument("--opening-book", metavar="DEPTH", nargs="?",
+                        type=int, const=OPENING_DEPTH,
+                        help="makes the opening book of the first DEPTH "
+                             "shots of every level")
+    parser.add_argument("--build-atlas", action="store_true",
+                        help="packs the pictures into one atlas file")
+    parser.add_argument("--leaderboard", action="store_true",
+                        help="prints the best games and the averages of "
+                             "every level")
+    parser.add_argument("--profile", nargs="?", const="latency",
+                        choices=["latency", "cprofile", "tracemalloc"],
+                        help="records the latencies of the game window's "
+                             "handlers and prints them at exit")
+    parser.add_argument("--computer", action="store_true",
+                        help="the computer plays all players except the "
+                             "player 1")
+    parser.add_argument("--players", metavar="AMOUNT", type=int, default=2,
+                        choices=range(MIN_PLAYERS, MAX_PLAYERS + 1),
+                        help=f"the amount of the players ({MIN_PLAYERS}-"
+                             f"{MAX_PLAYERS})")
+    parser.add_argument("--strategy", metavar="NAME",
+                        help="the strategy of the computer player: a "
+                             "built-in strategy (random, hint), an installed "
+                             "one or module:Class")
+    parser.add_argument("--tournament", metavar="NAME", nargs="+",
+                        help="plays the strategies NAME... against each "
+                             "other on the chosen level")
+    parser.add_argument("--games", metavar="AMOUNT", type=int,
+                        default=TOURNAMENT_GAMES,
+                        help="the amount of the tournament games")
+    parser.add_argument("--tables", metavar="AMOUNT", type=int, default=1,
+                        help="opens AMOUNT game windows, which share the "
+                             "pictures and the board creating processes")
+    parser.add_argument("--soak", metavar="CYCLES", nargs="?", type=int,
+                        const=10000,
+                        help="starts CYCLES new games in a row, prints "
+                             "the memory, the open files and the Tk objects "
+                             "and fails, if they grow")
+    parser.add_argument("--benchmark", metavar="GAMES", nargs="?", type=int,
+                        const=BENCHMARK_GAMES,
+                        help="plays GAMES games of every level with "
+                             "synthetic clicks, prints the latencies of the "
+                             "game window as JSON and fails, if the clicks "
+                             "are too slow")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        results = ui_benchmark(args.benchmark)
+        if results["over_budget"]:
+            sys.exit(f"The clicks were slower than {BENCHMARK_CLICK_BUDGET} "
+                     f"ms on " + ", ".join(results["over_budget"]))
+        return
+
+    if args.soak:
+        if args.profile:
+            enable_profiling(args.profile)
+        leaks = soak_leaks(soak_test(args.soak, args.level))
+        if leaks:
+            sys.exit("The soak test failed, these grew: " + ", ".join(leaks))
+        return
+
+    if args.build_atlas:
+        print(f"{IMAGE_ATLAS_FILE}: {build_image_atlas()} bytes")
+        return
+
+    if args.tournament:
+        try:
+            tournament = Tournament(args.level, args.tournament)
+        except ValueError as error:
+            parser.error(str(error))
+        tournament.play(args.games)
+        print(tournament.report())
+        return
+
+    if args.strategy is not None:
+        try:
+            load_strategy(args.strategy)
+        except ValueError as error:
+            parser.error(str(error))
+
+    if args.difficulty is not None and args.difficulty != EXPERT:
+        # The boards are rated here and not in the game window.
+        pool = difficulty_pool(args.level)
+        if not pool.load(0):
+            print(f"Rating {DIFFICULTY_POOL_SIZE} {args.level} boards...")
+        pool.load()
+        if not pool.get_boards(args.difficulty[0], args.difficulty[1]):
+            rated = list(pool.get_distribution().keys())
+            parser.error(f"There are no {args.level} boards of the "
+                         f"difficulty {args.difficulty[0]}-"
+                         f"{args.difficulty[1]}. The rated boards are "
+                         f"{rated[0]}-{rated[-1]}.")
+    elif args.difficulty == EXPERT and not expert_pool(args.level).load():
+        parser.error(f"There are no expert boards of {args.level}. They are "
+                     f"searched with --expert-pool.")
+
+    if args.text:
+        Text_game(args.level, difficulty=args.difficulty,
+                  players=args.players).start()
+        return
+
+    if args.difficulty_pool:
+        for level in LEVELS.keys():
+            pool = difficulty_pool(level)
+            pool.load(args.difficulty_pool)
+            print(f"{level}: " + ", ".join(
+                f"{shots}: {amount}"
+                for shots, amount in pool.get_distribution().items()))
+        return
+
+    if args.expert_pool:
+        for level in LEVELS.keys():
+            pool = expert_pool(level)
+            pool.load(args.expert_pool)
+            print(f"{level}: " + ", ".join(
+                f"{shots}: {amount}"
+                for shots, amount in pool.get_distribution().items()))
+        return
+
+    if args.watch:
+        host, port = args.watch.rsplit(":", 1)
+        watch(host or "127.0.0.1", int(port))
+        return
+
+    if args.leaderboard:
+        print(leaderboard().report())
+        return
+
+    if args.opening_book:
+        for level, amount in build_opening_book(args.opening_book).items():
+            print(f"{level}: {amount} states")
+        return
+
+    if args.count_layouts:
+        for level in LEVELS.keys():
+            print(f"{level}: {uniform_layouts(level).count()} layouts")
+        return
+
+    if args.stats or args.stats_generated:
+        statistics = Game_statistics()
+        if args.stats:
+            statistics.add_archive(read_archive(args.stats))
+        if args.stats_generated:
+            for level in LEVELS.keys():
+                statistics.add_archive(
+                    generated_games(level, args.stats_generated,
+                                    legacy=args.legacy))
+        print(statistics.report())
+        return
+
+    if args.profile:
+        enable_profiling(args.profile)
+    manager = Session_manager()
+    for table in range(args.tables):
+        # Only the first table is broadcasted, the port can be used once.
+        manager.new_session(args.level,
+                            args.broadcast if table == 0 else None,
+                            args.difficulty, args.computer or
+                            args.strategy is not None, args.strategy,
+                            args.players)
+    manager.start()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file